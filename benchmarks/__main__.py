@@ -0,0 +1,41 @@
+"""
+Run benchmarks
+Usage: python -m benchmarks [pattern] [--save FILE] [--compare FILE]
+"""
+
+import argparse
+import sys
+from benchmarks import runner
+
+# register benchmarks
+from benchmarks import schemas, validators, filters, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run shiftschema benchmarks')
+    parser.add_argument('pattern', nargs='?', help='regex to select')
+    parser.add_argument('--save', help='save results as json baseline')
+    parser.add_argument('--compare', help='compare against json baseline')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='allowed slowdown when comparing, default 0.1 (10%%)'
+    )
+    args = parser.parse_args(argv)
+
+    measured = runner.run(args.pattern)
+    if args.save:
+        runner.save(measured, args.save)
+
+    if args.compare:
+        regressions = runner.compare(measured, args.compare, args.threshold)
+        if regressions:
+            print('\nRegressions: ' + ', '.join(regressions))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
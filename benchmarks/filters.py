@@ -0,0 +1,50 @@
+"""
+Filters benchmarks
+Per-value cost of every built-in filter.
+"""
+
+from benchmarks.runner import benchmark
+from shiftschema import filters
+
+
+HTML = '''
+<p>Hello <b>there</b>! Check out <a href="http://example.com">this</a>
+<script>alert("and this")</script> or visit www.example.com</p>
+''' * 10
+
+
+def case(name, filter, value):
+    """ Register benchmark for filter and value """
+    def setup():
+        return lambda: filter.filter(value)
+    benchmark('filters', name)(setup)
+
+
+case('add_http', filters.AddHttp(), 'example.com')
+case('bleach', filters.Bleach(), HTML)
+case('digits', filters.Digits(to_int=True), '+44 (0) 123 456 789')
+case('linkify', filters.Linkify(), HTML)
+case('lowercase', filters.Lowercase(), 'Some Value')
+case('slugify', filters.Slugify(), 'Some Category Name & Co.')
+case('stringify', filters.Stringify(), 12345)
+case('strip', filters.Strip(), '   some value   ')
+case('uppercase', filters.Uppercase(), 'Some Value')
+case('bleach_cached', filters.Cached(filters.Bleach()), HTML)
+case(
+    'slugify_cached',
+    filters.Cached(filters.Slugify()),
+    'Some Category Name & Co.'
+)
+
+
+def many_case(name, filter, value, size=100):
+    """ Register benchmark for filtering a batch of values at once """
+    values = [value] * size
+
+    def setup():
+        return lambda: filter.filter_many(values)
+    benchmark('filters', name)(setup)
+
+
+many_case('bleach_many_100', filters.Bleach(), HTML)
+many_case('linkify_many_100', filters.Linkify(), HTML)
@@ -0,0 +1,199 @@
+"""
+Benchmark fixtures
+Schemas and models used across benchmarks: flat schemas, deeply nested
+entity graphs and wide collections.
+"""
+
+from shiftschema.schema import Schema
+from shiftschema import validators
+from shiftschema import filters
+
+
+class FlatSchema(Schema):
+    """ Typical signup payload schema """
+    def schema(self):
+        self.add_property('username')
+        self.username.add_filter(filters.Strip())
+        self.username.add_filter(filters.Lowercase())
+        self.username.add_validator(validators.Required())
+        self.username.add_validator(validators.Length(min=3, max=50))
+
+        self.add_property('email')
+        self.email.add_filter(filters.Strip())
+        self.email.add_validator(validators.Required())
+        self.email.add_validator(validators.Email())
+
+        self.add_property('website')
+        self.website.add_filter(filters.Strip())
+        self.website.add_validator(validators.Url())
+
+        self.add_property('country')
+        self.country.add_filter(filters.Uppercase())
+        self.country.add_validator(validators.Choice(['GB', 'US', 'DE']))
+
+        self.add_property('phone')
+        self.phone.add_filter(filters.Digits())
+        self.phone.add_validator(validators.Digits())
+
+        self.add_property('bio')
+        self.bio.add_validator(validators.Length(max=1000))
+
+
+class SharedFlatSchema(FlatSchema):
+    """ Signup schema sharing definitions by all instances """
+    shared = True
+
+
+class OrderSchema(Schema):
+    """ Order with customer, addresses and line items """
+    def schema(self):
+        self.add_property('reference').add_validator(validators.Required())
+        self.add_entity('customer').schema = FlatSchema()
+        self.add_entity('billing').schema = FlatSchema()
+        self.add_collection('items').schema = LineItemSchema()
+
+
+class SharedOrderSchema(OrderSchema):
+    """ Order schema sharing definitions by all instances """
+    shared = True
+
+
+class CodegenFlatSchema(FlatSchema):
+    """ Shared signup schema validating with generated code """
+    shared = True
+    codegen = True
+
+
+def flat_model(valid=True):
+    """ Model for flat schema """
+    return dict(
+        username='  Someone  ',
+        email='someone@example.com' if valid else 'not an email',
+        website='https://example.com/someone',
+        country='gb',
+        phone='+44 (0) 123 456 789',
+        bio='Hello there!',
+    )
+
+
+class Signup:
+    """ Object model for flat schema, e.g. an orm entity """
+    def __init__(self, **kwargs):
+        self.username = None
+        self.website = None
+        self.country = None
+        self.phone = None
+        self.bio = None
+        self._email = None
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def get_email(self):
+        return self._email
+
+    def set_email(self, email):
+        self._email = email
+
+
+def flat_object(valid=True):
+    """ Object model for flat schema """
+    model = flat_model(valid=valid)
+    email = model.pop('email')
+    signup = Signup(**model)
+    signup.set_email(email)
+    return signup
+
+
+class LineItemSchema(Schema):
+    """ Order line item """
+    def schema(self):
+        self.add_property('sku')
+        self.sku.add_filter(filters.Strip())
+        self.sku.add_validator(validators.Required())
+        self.sku.add_validator(validators.Length(min=3, max=20))
+
+        self.add_property('quantity')
+        self.quantity.add_validator(validators.Required())
+        self.quantity.add_validator(validators.Digits())
+
+
+def line_item(index, valid=True):
+    """ Single line item """
+    return dict(
+        sku=' SKU-{} '.format(index),
+        quantity=index + 1 if valid else 'many'
+    )
+
+
+def invalid_order():
+    """ Model for order schema failing on every level """
+    return dict(
+        reference=None,
+        customer=flat_model(valid=False),
+        billing=flat_model(),
+        items=[line_item(0), line_item(1, valid=False)],
+    )
+
+
+def collection_schema():
+    """ Schema with a wide collection of line items """
+    schema = Schema()
+    schema.add_property('reference').add_validator(validators.Required())
+    schema.add_collection('items').add_validator(validators.NotEmpty())
+    schema.items.schema = LineItemSchema()
+    return schema
+
+
+def collection_model(width=1000, invalid_every=0):
+    """ Model with a wide collection, optionally with invalid items """
+    items = []
+    for index in range(width):
+        valid = not invalid_every or index % invalid_every
+        items.append(line_item(index, valid=valid))
+    return dict(reference='ORDER-1', items=items)
+
+
+def nested_schema(depth=5):
+    """ Deeply nested chain of entity properties """
+    schema = FlatSchema()
+    for _ in range(depth):
+        parent = FlatSchema()
+        parent.add_entity('child').schema = schema
+        schema = parent
+    return schema
+
+
+def nested_model(depth=5, valid=True):
+    """ Model for deeply nested schema """
+    model = flat_model(valid=valid)
+    for _ in range(depth):
+        parent = flat_model()
+        parent['child'] = model
+        model = parent
+    return model
+
+
+def order_schema():
+    """ Order -> shipments -> line items, 3 levels of nested collections """
+    shipment = Schema()
+    shipment.add_property('carrier').add_validator(validators.Required())
+    shipment.add_collection('items').schema = LineItemSchema()
+
+    order = Schema()
+    order.add_property('reference').add_validator(validators.Required())
+    order.add_collection('shipments').schema = shipment
+    return order
+
+
+def order_model(shipments=10, items=1000, invalid_every=0):
+    """ Order model with given number of shipments and items in each """
+    return dict(
+        reference='ORDER-1',
+        shipments=[
+            dict(
+                carrier='DHL',
+                items=collection_model(items, invalid_every)['items']
+            )
+            for _ in range(shipments)
+        ]
+    )
@@ -0,0 +1,60 @@
+"""
+Results benchmarks
+Merging validation results and getting translated messages out of them.
+"""
+
+from benchmarks.runner import benchmark
+from benchmarks import fixtures
+from shiftschema.result import Result
+
+
+def invalid_result(width=1000):
+    """ Result with errors on every other item of a wide collection """
+    schema = fixtures.collection_schema()
+    model = fixtures.collection_model(width, invalid_every=2)
+    return schema.validate(model)
+
+
+def order_result(invalid_every=10):
+    """ Result of 3 levels deep order with 10k line items """
+    schema = fixtures.order_schema()
+    model = fixtures.order_model(10, 1000, invalid_every=invalid_every)
+    return schema.validate(model)
+
+
+@benchmark('results', 'merge_order_3_levels_10k')
+def merge_order():
+    local = order_result()
+    remote = order_result(invalid_every=5)
+
+    def merge():
+        merged = Result()
+        merged.merge(local)
+        merged.merge(remote)
+        return merged
+    return merge
+
+
+@benchmark('results', 'get_messages_order_3_levels_10k')
+def get_messages_order():
+    result = order_result()
+    return lambda: result.get_messages()
+
+
+@benchmark('results', 'iter_errors_order_3_levels_10k')
+def iter_errors_order():
+    result = order_result()
+    return lambda: sum(1 for _ in result.iter_errors())
+
+
+@benchmark('results', 'get_messages_flat')
+def get_messages_flat():
+    schema = fixtures.FlatSchema()
+    result = schema.validate(fixtures.flat_model(valid=False))
+    return lambda: result.get_messages()
+
+
+@benchmark('results', 'get_messages_1000')
+def get_messages():
+    result = invalid_result()
+    return lambda: result.get_messages()
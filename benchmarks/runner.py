@@ -0,0 +1,145 @@
+"""
+Benchmark runner
+A tiny dependency-free benchmark harness. Benchmarks are registered with a
+decorator on a setup function that builds fixtures and returns a callable
+to measure. Each benchmark reports operations per second and memory
+allocated per operation, measured with tracemalloc. Results can be saved
+as a json baseline and compared against later to detect regressions.
+"""
+
+import gc
+import json
+import re
+import sys
+import time
+import tracemalloc
+from timeit import Timer
+
+
+# registered benchmarks as (group, name, setup) tuples
+registry = []
+
+
+def benchmark(group, name):
+    """
+    Benchmark decorator
+    Registers a setup function that returns a callable to measure.
+
+    :param group: str, benchmark group
+    :param name: str, benchmark name
+    :return: decorator
+    """
+    def decorator(setup):
+        registry.append((group, name, setup))
+        return setup
+    return decorator
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """
+    Measure
+    Measures callable speed as best of several runs, each long enough to
+    give a stable timing, then measures memory allocated during a single
+    call.
+
+    :param func: callable to measure
+    :param repeat: int, number of timing runs
+    :param min_time: float, minimum duration of each run in seconds
+    :return: dict, ops per second, seconds per op and bytes per op
+    """
+    func()
+    timer = Timer(func, timer=time.perf_counter)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        ops=1 / best,
+        seconds=best,
+        allocated=max(0, peak - before)
+    )
+
+
+def run(pattern=None, stream=sys.stdout):
+    """
+    Run benchmarks
+    Runs registered benchmarks whose "group.name" matches an optional regex
+    pattern and prints a report.
+
+    :param pattern: str, regex to select benchmarks
+    :param stream: file-like object to print report to
+    :return: dict, measurements keyed by "group.name"
+    """
+    results = {}
+    for group, name, setup in registry:
+        key = '{}.{}'.format(group, name)
+        if pattern and not re.search(pattern, key):
+            continue
+
+        results[key] = measure(setup())
+        stream.write(format_line(key, results[key]) + '\n')
+        stream.flush()
+
+    return results
+
+
+def format_line(key, result, baseline=None):
+    """ Format single report line """
+    line = '{:<48} {:>14,.1f} ops/s {:>12,.2f} us {:>12,} B'.format(
+        key,
+        result['ops'],
+        result['seconds'] * 1e6,
+        result['allocated']
+    )
+    if baseline:
+        change = result['seconds'] / baseline['seconds'] - 1
+        line += ' {:>+8.1%}'.format(change)
+    return line
+
+
+def save(results, path):
+    """ Save results as json baseline """
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def compare(results, path, threshold=0.1, stream=sys.stdout):
+    """
+    Compare
+    Compares results against saved json baseline, prints time change per
+    benchmark and returns benchmarks that got slower than threshold.
+
+    :param results: dict, current measurements
+    :param path: str, path to baseline json
+    :param threshold: float, allowed slowdown, e.g. 0.1 for 10%
+    :param stream: file-like object to print report to
+    :return: list of regressed benchmark keys
+    """
+    with open(path) as file:
+        baseline = json.load(file)
+
+    regressions = []
+    stream.write('\nCompared to {}:\n'.format(path))
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        stream.write(format_line(key, result, baseline[key]) + '\n')
+        if result['seconds'] > baseline[key]['seconds'] * (1 + threshold):
+            regressions.append(key)
+
+    return regressions
@@ -0,0 +1,272 @@
+"""
+Schema benchmarks
+Filtering, validation and processing of flat schemas, deeply nested
+entity graphs and wide collections, as well as column-wise filtering and
+validation of single property values.
+"""
+
+from benchmarks.runner import benchmark
+from benchmarks import fixtures
+from shiftschema.property import SimpleProperty
+from shiftschema import filters, validators
+from shiftschema import persistence
+from shiftschema import translator
+import os
+import tempfile
+
+
+@benchmark('schema', 'create_flat')
+def create_flat():
+    return lambda: fixtures.FlatSchema().compile()
+
+
+@benchmark('schema', 'create_flat_shared')
+def create_flat_shared():
+    return lambda: fixtures.SharedFlatSchema()
+
+
+@benchmark('schema', 'create_order')
+def create_order():
+    return lambda: fixtures.OrderSchema().compile()
+
+
+@benchmark('schema', 'create_order_shared')
+def create_order_shared():
+    return lambda: fixtures.SharedOrderSchema()
+
+
+@benchmark('schema', 'load_order_cached')
+def load_order_cached():
+    path = os.path.join(tempfile.mkdtemp(), 'order.cache')
+    persistence.save(fixtures.OrderSchema(), path)
+    return lambda: persistence.load(path)
+
+
+def cold_start():
+    """
+    Drops caches a freshly started worker doesn't have yet. Regex engine
+    cache is kept as cached patterns get recompiled on load all the same.
+    """
+    translator.clear_cache()
+    for validator in (validators.Email, validators.Url, validators.Digits):
+        validator.compiled_regexes.clear()
+
+
+@benchmark('schema', 'cold_start_order')
+def cold_start_order():
+    model = fixtures.invalid_order()
+
+    def run():
+        cold_start()
+        schema = fixtures.OrderSchema(locale='ru')
+        return schema.validate(model).get_messages()
+    return run
+
+
+@benchmark('schema', 'cold_start_order_cached')
+def cold_start_order_cached():
+    path = os.path.join(tempfile.mkdtemp(), 'order.cache')
+    persistence.save(fixtures.OrderSchema(locale='ru'), path)
+    model = fixtures.invalid_order()
+
+    def run():
+        cold_start()
+        schema = persistence.load(path)
+        return schema.validate(model).get_messages()
+    return run
+
+
+@benchmark('schema', 'validate_flat_valid')
+def validate_flat_valid():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_model()
+    schema.filter(model)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_flat_invalid')
+def validate_flat_invalid():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_model(valid=False)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_flat_object')
+def validate_flat_object():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_object()
+    schema.filter(model)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'process_flat_object')
+def process_flat_object():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_object()
+    return lambda: schema.process(model)
+
+
+@benchmark('schema', 'filter_flat')
+def filter_flat():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_model()
+    return lambda: schema.filter(model)
+
+
+@benchmark('schema', 'process_flat')
+def process_flat():
+    schema = fixtures.FlatSchema()
+    model = fixtures.flat_model()
+    return lambda: schema.process(model)
+
+
+@benchmark('schema', 'validate_nested_depth_10')
+def validate_nested():
+    schema = fixtures.nested_schema(depth=10)
+    model = fixtures.nested_model(depth=10, valid=False)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'process_nested_depth_10')
+def process_nested():
+    schema = fixtures.nested_schema(depth=10)
+    model = fixtures.nested_model(depth=10)
+    return lambda: schema.process(model)
+
+
+@benchmark('schema', 'validate_collection_1000')
+def validate_collection():
+    schema = fixtures.collection_schema()
+    model = fixtures.collection_model(1000)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_collection_1000_invalid')
+def validate_collection_invalid():
+    schema = fixtures.collection_schema()
+    model = fixtures.collection_model(1000, invalid_every=2)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'process_collection_1000')
+def process_collection():
+    schema = fixtures.collection_schema()
+    model = fixtures.collection_model(1000)
+    return lambda: schema.process(model)
+
+
+@benchmark('schema', 'validate_order_3_levels_1k')
+def validate_small_order():
+    schema = fixtures.order_schema()
+    model = fixtures.order_model(shipments=10, items=100, invalid_every=10)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_order_3_levels_10k')
+def validate_order():
+    schema = fixtures.order_schema()
+    model = fixtures.order_model(shipments=10, items=1000, invalid_every=10)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'process_order_3_levels_10k')
+def process_order():
+    schema = fixtures.order_schema()
+    model = fixtures.order_model(shipments=10, items=1000, invalid_every=10)
+    return lambda: schema.process(model)
+
+
+@benchmark('schema', 'process_order_3_levels_10k_fused')
+def process_order_fused():
+    schema = fixtures.order_schema()
+    model = fixtures.order_model(shipments=10, items=1000, invalid_every=10)
+    return lambda: schema.process(model, fused=True)
+
+
+@benchmark('schema', 'process_nested_depth_10_fused')
+def process_nested_fused():
+    schema = fixtures.nested_schema(depth=10)
+    model = fixtures.nested_model(depth=10)
+    return lambda: schema.process(model, fused=True)
+
+
+@benchmark('schema', 'validate_flat_valid_codegen')
+def validate_flat_valid_codegen():
+    schema = fixtures.FlatSchema()
+    schema.codegen = True
+    model = fixtures.flat_model()
+    schema.filter(model)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_flat_invalid_codegen')
+def validate_flat_invalid_codegen():
+    schema = fixtures.FlatSchema()
+    schema.codegen = True
+    model = fixtures.flat_model(valid=False)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'create_and_validate_flat')
+def create_and_validate_flat():
+    model = fixtures.flat_model()
+    return lambda: fixtures.FlatSchema().validate(model)
+
+
+@benchmark('schema', 'create_and_validate_flat_codegen')
+def create_and_validate_flat_codegen():
+    model = fixtures.flat_model()
+    return lambda: fixtures.CodegenFlatSchema().validate(model)
+
+
+@benchmark('schema', 'validate_order_3_levels_10k_codegen')
+def validate_order_codegen():
+    schema = fixtures.order_schema()
+    schema.codegen = True
+    model = fixtures.order_model(shipments=10, items=1000, invalid_every=10)
+    return lambda: schema.validate(model)
+
+
+@benchmark('schema', 'validate_many_1000')
+def validate_many():
+    schema = fixtures.FlatSchema()
+    models = [fixtures.flat_model(valid=i % 10) for i in range(1000)]
+    return lambda: list(schema.validate_many(models, invalid_only=True))
+
+
+def column_property():
+    """ Property with batchable filters and validators """
+    prop = SimpleProperty()
+    prop.add_filter(filters.Strip())
+    prop.add_filter(filters.Lowercase())
+    prop.add_validator(validators.Length(min=2, max=10))
+    prop.add_validator(validators.Choice(['red', 'green', 'blue']))
+    return prop
+
+
+@benchmark('property', 'filter_values_10k')
+def filter_values_10k():
+    prop = column_property()
+    values = [' Red ', 'GREEN', ' blue', 'purple '] * 2500
+    return lambda: [prop.filter(value) for value in values]
+
+
+@benchmark('property', 'filter_many_10k')
+def filter_many_10k():
+    prop = column_property()
+    values = [' Red ', 'GREEN', ' blue', 'purple '] * 2500
+    return lambda: prop.filter_many(values)
+
+
+@benchmark('property', 'validate_values_10k')
+def validate_values_10k():
+    prop = column_property()
+    values = ['red', 'green', 'blue', 'purple'] * 2500
+    return lambda: [prop.validate(value) for value in values]
+
+
+@benchmark('property', 'validate_many_10k')
+def validate_many_10k():
+    prop = column_property()
+    values = ['red', 'green', 'blue', 'purple'] * 2500
+    return lambda: prop.validate_many(values)
@@ -0,0 +1,82 @@
+"""
+Validators benchmarks
+Per-value cost of every built-in validator. Regex-based validators are
+also measured rebuilding and compiling the pattern for every value, as it
+was done before patterns got cached, to compare against.
+"""
+
+import re
+from benchmarks.runner import benchmark
+from shiftschema import validators
+
+
+def case(name, validator, value):
+    """ Register benchmark for validator and value """
+    def setup():
+        return lambda: validator.run(value)
+    benchmark('validators', name)(setup)
+
+
+case('choice', validators.Choice(['GB', 'US', 'DE']), 'DE')
+case('multichoice', validators.MultiChoice(['GB', 'US', 'DE']), ['US', 'DE'])
+case('digits', validators.Digits(), '1234567890')
+case('email', validators.Email(), 'someone@example.com')
+case('ip', validators.Ip(), '192.168.1.1')
+case('length', validators.Length(min=3, max=50), 'Some value')
+case('not_empty', validators.NotEmpty(), [1, 2, 3])
+case('required', validators.Required(), 'value')
+case('url', validators.Url(), 'https://example.com/some/path?query=1')
+case(
+    'choice_50k',
+    validators.Choice(['SKU-{}'.format(i) for i in range(50000)]),
+    'SKU-49999'
+)
+case(
+    'multichoice_50k_100_items',
+    validators.MultiChoice(['SKU-{}'.format(i) for i in range(50000)]),
+    ['SKU-{}'.format(i) for i in range(49900, 50000)]
+)
+case(
+    'url_cached',
+    validators.Cached(validators.Url()),
+    'https://example.com/some/path?query=1'
+)
+
+
+@benchmark('validators', 'email_uncached_pattern')
+def email_uncached():
+    class UncachedEmail(validators.Email):
+        compiled_regexes = {}
+
+    validator = UncachedEmail()
+
+    def rebuild():
+        UncachedEmail.compiled_regexes.clear()
+        return validator.regex().match('someone@example.com')
+    return rebuild
+
+
+@benchmark('validators', 'url_uncached_pattern')
+def url_uncached():
+    validator = validators.Url()
+    value = 'https://example.com/some/path?query=1'
+
+    def rebuild():
+        pattern = validator.pattern(validator.protocols, validator.localhost)
+        return re.compile(pattern, flags=validator.flags).match(value)
+    return rebuild
+
+
+@benchmark('validators', 'digits_uncached_pattern')
+def digits_uncached():
+    value = '1234567890'
+
+    def rebuild():
+        match = re.match(r'^\d+', value)
+        return match and value == match.group()
+    return rebuild
+
+
+if __name__ == '__main__':
+    from benchmarks import runner
+    runner.run('validators')
@@ -87,7 +87,7 @@ setup(**dict(
     ],
 
     # project packages
-    packages=find_packages(exclude=['tests*']),
+    packages=find_packages(exclude=['tests*', 'benchmarks*']),
 
     # include none-code data files from manifest.in (http://goo.gl/Uf0Yxc)
     include_package_data=True,
@@ -0,0 +1,191 @@
+"""
+Accessors
+Resolve how to get and set properties on models of certain class (mapping
+item, getter or setter method, namedtuple or dataclass field, or attribute)
+once and cache resolved accessors per (model class, property name), so that
+validating many models of the same class does not repeat dynamic lookups
+for every property of every model.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from dataclasses import is_dataclass, fields
+from operator import methodcaller, attrgetter, itemgetter
+
+
+# resolved accessors per (model class, property name)
+getters = {}
+setters = {}
+
+
+def is_dynamic(cls):
+    """
+    Is dynamic
+    Checks if class resolves attributes dynamically, in which case getters
+    and setters can only be resolved per model
+
+    :param cls: model class
+    :return: bool
+    """
+    return hasattr(cls, '__getattr__')
+
+
+def can_attach(cls, method_name):
+    """
+    Can attach
+    Checks if getter or setter method class does not define can be attached
+    to its models, i.e. models are objects having their own attribute
+    dictionaries, which is only worth checking per model for classes that
+    are not resolved per model already
+
+    :param cls: model class
+    :param method_name: str, getter or setter method name
+    :return: bool
+    """
+    if issubclass(cls, Mapping) or is_dynamic(cls):
+        return False
+    if not getattr(cls, '__dictoffset__', 0):
+        return False
+    return not hasattr(cls, method_name)
+
+
+def is_namedtuple(cls):
+    """
+    Is namedtuple
+    Checks if class is a namedtuple
+    :param cls: model class
+    :return: bool
+    """
+    return issubclass(cls, tuple) and hasattr(cls, '_fields')
+
+
+def has_dataclass_field(cls, property_name):
+    """
+    Has dataclass field
+    Checks if class is a dataclass that always sets field with this name
+    in its generated initializer
+
+    :param cls: model class
+    :param property_name: str, field name
+    :return: bool
+    """
+    if not is_dataclass(cls) or not cls.__dataclass_params__.init:
+        return False
+    for field in fields(cls):
+        if field.name == property_name:
+            return field.init
+    return False
+
+
+def per_model(accessor, method_name):
+    """
+    Per model
+    Wraps accessor resolved for model class to use getter or setter method
+    attached to model itself if there is one.
+
+    :param accessor: callable, accessor resolved for model class
+    :param method_name: str, getter or setter method name
+    :return: callable
+    """
+    def accessor_per_model(model, *args):
+        method = model.__dict__.get(method_name)
+        if method is not None:
+            return method(*args)
+        return accessor(model, *args)
+    return accessor_per_model
+
+
+def get_getter(cls, property_name):
+    """
+    Get getter
+    Returns cached callable that gets property value from model of class.
+    Mappings (dicts, mapping proxies, custom mappings) are accessed by key.
+    For objects uses model getter method if present, attribute otherwise,
+    with faster access to fields of namedtuples and dataclasses. Getter
+    methods attached to models rather than their class are looked up per
+    model.
+
+    :param cls: model class
+    :param property_name: str, name on the model
+    :return: callable, accepting model
+    """
+    key = (cls, property_name)
+    getter = getters.get(key)
+    if getter is not None:
+        return getter
+
+    getter_name = 'get_' + property_name
+    if issubclass(cls, Mapping):
+        def getter(model):
+            return model.get(property_name)
+    elif is_dynamic(cls):
+        def getter(model):
+            if hasattr(model, getter_name):
+                return getattr(model, getter_name)()
+            return getattr(model, property_name, None)
+    elif hasattr(cls, getter_name):
+        getter = methodcaller(getter_name)
+    elif is_namedtuple(cls) and property_name in cls._fields:
+        getter = itemgetter(cls._fields.index(property_name))
+    elif has_dataclass_field(cls, property_name):
+        getter = attrgetter(property_name)
+    else:
+        def getter(model):
+            return getattr(model, property_name, None)
+
+    if can_attach(cls, getter_name):
+        getter = per_model(getter, getter_name)
+
+    getters[key] = getter
+    return getter
+
+
+def get_setter(cls, property_name):
+    """
+    Get setter
+    Returns cached callable that sets property value on model of class.
+    Mutable mappings are updated by key, while read-only mappings are left
+    as they are. For objects uses model setter method if present, attribute
+    otherwise. Immutable objects, like namedtuples or frozen dataclasses,
+    are left as they are. Setter methods attached to models rather than
+    their class are looked up per model.
+
+    :param cls: model class
+    :param property_name: str, name on the model
+    :return: callable, accepting model and value
+    """
+    key = (cls, property_name)
+    setter = setters.get(key)
+    if setter is not None:
+        return setter
+
+    setter_name = 'set_' + property_name
+
+    def set_attribute(model, value):
+        try:
+            setattr(model, property_name, value)
+        except AttributeError:
+            pass
+
+    if issubclass(cls, MutableMapping):
+        def setter(model, value):
+            model[property_name] = value
+    elif issubclass(cls, Mapping):
+        def setter(model, value):
+            pass
+    elif is_dynamic(cls):
+        def setter(model, value):
+            if hasattr(model, setter_name):
+                getattr(model, setter_name)(value)
+            else:
+                set_attribute(model, value)
+    elif hasattr(cls, setter_name):
+        def setter(model, value):
+            getattr(model, setter_name)(value)
+    else:
+        setter = set_attribute
+
+    if can_attach(cls, setter_name):
+        setter = per_model(setter, setter_name)
+
+    setters[key] = setter
+    return setter
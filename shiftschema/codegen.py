@@ -0,0 +1,478 @@
+"""
+Codegen
+Generates specialised python source for schema validation: a single
+straight-line function per schema with properties read directly, Required,
+Length and Choice checks inlined, custom validators called directly and
+nested schemas validated by their own generated functions. Source gets
+compiled once per schema class sharing definitions, or once per schema
+instance otherwise. Produces the same results as Schema.validate() without
+fail fast mode. Schemas overriding validation methods are validated by
+their own methods.
+"""
+
+import threading
+from shiftschema.result import Result, Error, VALID
+from shiftschema.exceptions import InvalidErrorType
+from shiftschema.validators import AbstractValidator, Required, Length, Choice
+from shiftschema.validators.choice import Choices
+
+
+# guards generating code for schemas
+lock = threading.Lock()
+
+# schema methods generated code replaces
+VALIDATION_METHODS = (
+    'validate',
+    'validate_state',
+    'validate_properties',
+    'validate_entities',
+    'validate_collections',
+)
+
+
+def overrides_validation(schema):
+    """
+    Overrides validation
+    Checks if schema class overrides any of the validation methods
+    generated code would bypass, in which case schema must be validated
+    by regular code.
+
+    :param schema: shiftschema.schema.Schema
+    :return: bool
+    """
+    from shiftschema.schema import Schema
+    cls = type(schema)
+    for method in VALIDATION_METHODS:
+        if getattr(cls, method) is not getattr(Schema, method):
+            return True
+    return False
+
+
+def raise_invalid(validator, result):
+    """ Raise on validator returning something else than error """
+    err = 'Validator "{}" result must be of type "{}", got "{}"'
+    raise InvalidErrorType(err.format(
+        validator.__class__.__name__,
+        Error,
+        type(result))
+    )
+
+
+class Generator:
+    """
+    Generator
+    Writes source of validation functions for a schema and its nested
+    schemas, collecting objects the source refers to into a namespace.
+    """
+
+    def __init__(self):
+        self.output = []
+        self.lines = []
+        self.indent = 0
+        self.functions = {}
+        self.namespace = dict(
+            Error=Error,
+            VALID=VALID,
+            Result=Result,
+            dict_get=dict.get,
+            raise_invalid=raise_invalid,
+        )
+
+    def line(self, code):
+        """ Write line of code at current indent """
+        self.lines.append('    ' * self.indent + code)
+
+    def constant(self, obj):
+        """ Put object into namespace and return its name """
+        name = 'c{}'.format(len(self.namespace))
+        self.namespace[name] = obj
+        return name
+
+    def block(self, header, body):
+        """ Write block of code under header """
+        self.line(header)
+        self.indent += 1
+        count = len(self.lines)
+        body()
+        if len(self.lines) == count:
+            self.line('pass')
+        self.indent -= 1
+
+    def source(self):
+        """ Get generated source """
+        return '\n'.join(self.output) + '\n'
+
+    def function(self, schema):
+        """
+        Function
+        Generates validation function for schema unless already generated
+        and returns its name. Functions accept schema, model and context.
+
+        :param schema: shiftschema.schema.Schema
+        :return: str, function name
+        """
+        key = id(schema)
+        if key in self.functions:
+            return self.functions[key][0]
+
+        name = 'validate_{}'.format(len(self.functions))
+        self.functions[key] = (name, schema)
+
+        from shiftschema.schema import Schema
+        plan = schema._plan or schema.compile()
+        lines, indent = self.lines, self.indent
+        self.lines, self.indent = [], 0
+
+        self.line('def {}(schema, model, context):'.format(name))
+        self.indent += 1
+        if type(schema).get is Schema.get:
+            self.line(
+                'get = dict_get if model.__class__ is dict else schema.get'
+            )
+        else:
+            self.line('get = schema.get')
+        self.line('errors = None')
+
+        if plan[0]:
+            self.line('errs = None')
+            for validator in plan[0]:
+                self.validator(validator, 'model', 'context')
+            self.add_errors("'__state__'", 'errs')
+
+        for property_name, prop in plan[1]:
+            self.simple(property_name, prop)
+        for property_name, prop in plan[2]:
+            self.entity(property_name, prop)
+        for property_name, prop in plan[3]:
+            self.collection(property_name, prop)
+
+        self.line('return Result(errors, schema.translator, schema.locale)')
+        self.lines.append('')
+
+        self.output.extend(self.lines)
+        self.lines, self.indent = lines, indent
+        return name
+
+    def add_errors(self, key, errors):
+        """ Write errors to result under key if any """
+        self.line('if {} is not None:'.format(errors))
+        self.indent += 1
+        self.line('if errors is None:')
+        self.line('    errors = {}')
+        self.line('errors[{}] = {}'.format(key, errors))
+        self.indent -= 1
+
+    def append_error(self, error):
+        """ Collect error into property errors """
+        self.line('if errs is None:')
+        self.line('    errs = [{}]'.format(error))
+        self.line('else:')
+        self.line('    errs.append({})'.format(error))
+
+    def chain(self, prop, validators, context):
+        """ Run validators chain on value stopping if property fails fast """
+        for index, validator in enumerate(validators):
+            if prop.fail_fast and index:
+                self.block('if errs is None:', lambda: self.validator(
+                    validator,
+                    'value',
+                    context
+                ))
+            else:
+                self.validator(validator, 'value', context)
+
+    def property_errors(self, property_name, prop):
+        """ Get property value and run validators into errs """
+        compiled = prop._compiled or prop.compile()
+        context = 'context' if prop.use_context else 'None'
+        self.line('value = get(model, {!r})'.format(property_name))
+        self.line('errs = None')
+        if compiled[1]:
+            self.block('if value is not None:', lambda: self.chain(
+                prop,
+                compiled[1],
+                context
+            ))
+            if compiled[2]:
+                self.block('else:', lambda: self.chain(
+                    prop,
+                    compiled[2],
+                    context
+                ))
+
+    def simple(self, property_name, prop):
+        """ Validate simple property """
+        compiled = prop._compiled or prop.compile()
+        if not compiled[1]:
+            return
+
+        self.property_errors(property_name, prop)
+        self.add_errors(repr(property_name), 'errs')
+
+    def entity(self, property_name, prop):
+        """ Validate entity property and nested schema """
+        self.property_errors(property_name, prop)
+        self.line('entity = None')
+        self.line('if errs is not None:')
+        self.line("    entity = {'direct': errs}")
+
+        if prop.schema is not None:
+            condition = 'value is not None'
+            if prop.fail_fast:
+                condition += ' and errs is None'
+            self.line('if {}:'.format(condition))
+            self.indent += 1
+            self.line('nested = {}'.format(self.nested(prop, 'value')))
+            self.line('if not nested:')
+            self.line('    if entity is None:')
+            self.line('        entity = {}')
+            self.line("    entity['schema'] = nested.errors")
+            self.indent -= 1
+
+        self.add_errors(repr(property_name), 'entity')
+
+    def nested(self, prop, value):
+        """ Get expression validating value with property schema """
+        context = 'context' if prop.use_context else 'None'
+        schema = prop.schema
+        if prop.fail_fast or schema.fail_fast or overrides_validation(schema):
+            return '{}({}, context, False)'.format(
+                self.constant(prop.validate_with_schema),
+                value
+            )
+
+        return '{}({}, {}, {})'.format(
+            self.function(schema),
+            self.constant(schema),
+            value,
+            context
+        )
+
+    def collection(self, property_name, prop):
+        """ Validate collection property and its items """
+        self.property_errors(property_name, prop)
+        self.line('collection = None')
+        self.line('if errs is not None:')
+        self.line("    collection = {'direct': errs}")
+
+        schema = prop.schema
+        if schema is not None:
+            if prop.fail_fast:
+                self.line('if value and errs is None:')
+            else:
+                self.line('if value:')
+            self.indent += 1
+            self.line('invalid = None')
+            regular = (
+                prop.executor is not None
+                or prop.fail_fast
+                or schema.fail_fast
+                or overrides_validation(schema)
+            )
+            if regular:
+                self.line('results = {}(value, context, False)'.format(
+                    self.constant(prop.validate_with_schema)
+                ))
+                self.line('for index, item in enumerate(results):')
+                self.line('    if not item:')
+                self.line('        if invalid is None:')
+                self.line('            invalid = {}')
+                self.line('        invalid[index] = item')
+            else:
+                function = self.function(schema)
+                nested = self.constant(schema)
+                context = 'context' if prop.use_context else 'None'
+                self.line('try:')
+                self.line('    for index, item in enumerate(value):')
+                self.line('        item = {}({}, item, {})'.format(
+                    function,
+                    nested,
+                    context
+                ))
+                self.line('        if not item:')
+                self.line('            if invalid is None:')
+                self.line('                invalid = {}')
+                self.line('            invalid[index] = item')
+                self.line('except TypeError:')
+                self.line('    pass')
+
+            self.line('if invalid is not None:')
+            self.line('    if collection is None:')
+            self.line('        collection = {}')
+            self.line("    collection['collection'] = invalid")
+            self.indent -= 1
+
+        self.add_errors(repr(property_name), 'collection')
+
+    def validator(self, validator, value, context):
+        """
+        Validator
+        Writes validator check for value collecting errors into errs.
+        Required, Length and Choice checks are inlined, other validators
+        are called directly.
+
+        :param validator: shiftschema.validators.AbstractValidator
+        :param value: str, value expression
+        :param context: str, context expression
+        :return: None
+        """
+        cls = type(validator)
+        if cls is Required:
+            return self.required(validator, value)
+        if cls is Length:
+            return self.length(validator, value)
+        if cls is Choice:
+            return self.choice(validator, value)
+
+        if cls.run is not AbstractValidator.run:
+            self.line('e = {}({}, model, {})'.format(
+                self.constant(validator.run),
+                value,
+                context
+            ))
+            self.line('if e:')
+            self.indent += 1
+            self.append_error('e')
+            self.indent -= 1
+            return
+
+        self.line('e = {}({}, model, {})'.format(
+            self.constant(validator.validate),
+            value,
+            context
+        ))
+        self.line('if e is not None and e is not VALID:')
+        self.indent += 1
+        self.line('if not isinstance(e, Error):')
+        self.line('    raise_invalid({}, e)'.format(self.constant(validator)))
+        self.line('if e:')
+        self.indent += 1
+        self.append_error('e')
+        self.indent -= 2
+
+    def required(self, validator, value):
+        """ Inline Required check """
+        conditions = ['not {}'.format(value)]
+        if validator.allow_false:
+            conditions.append('{} is not False'.format(value))
+        if validator.allow_zero:
+            conditions.append('not {} == 0'.format(value))
+        if validator.allow_empty_string:
+            conditions.append("not {} == ''".format(value))
+
+        self.line('if {}:'.format(' and '.join(conditions)))
+        self.indent += 1
+        error = 'Error({})'.format(self.constant(validator.value_required))
+        self.append_error(error)
+        self.indent -= 1
+
+    def length(self, validator, value):
+        """ Inline Length check choosing bounds at generation time """
+        min, max = validator.min, validator.max
+        if not min and not max:
+            return
+
+        min_name, max_name = self.constant(min), self.constant(max)
+        if min and max is None:
+            message = validator.too_short
+            condition = 'length < ' + min_name
+        elif max and min is None:
+            message = validator.too_long
+            condition = 'length > ' + max_name
+        elif min and max:
+            message = validator.not_in_range
+            condition = 'length < {} or length > {}'.format(min_name, max_name)
+        else:
+            return
+
+        self.line(
+            'length = len({0}) if {0}.__class__ is str else len(str({0}))'
+            .format(value)
+        )
+        self.line('if {}:'.format(condition))
+        self.indent += 1
+        self.append_error("Error({}, {{'min': {}, 'max': {}}})".format(
+            self.constant(message),
+            min_name,
+            max_name
+        ))
+        self.indent -= 1
+
+    def choice(self, validator, value):
+        """ Inline Choice check with hashed lookup """
+        choices = validator.lookup
+        error = 'Error({})'.format(self.constant(validator.invalid_choice))
+        if isinstance(choices, Choices) and not choices.unhashable:
+            self.line('try:')
+            self.line('    valid = {} in {}'.format(
+                value,
+                self.constant(choices.hashed)
+            ))
+            self.line('except TypeError:')
+            self.line('    valid = False')
+            self.line('if not valid:')
+        else:
+            self.line('if {} not in {}:'.format(
+                value,
+                self.constant(choices)
+            ))
+        self.indent += 1
+        self.append_error(error)
+        self.indent -= 1
+
+
+def generate(schema):
+    """
+    Generate
+    Generates source of validation functions for schema and its nested
+    schemas along with namespace of objects the source refers to. Function
+    for the schema itself is called validate_0.
+
+    :param schema: shiftschema.schema.Schema
+    :return: tuple, (source, namespace)
+    """
+    generator = Generator()
+    generator.function(schema)
+    return generator.source(), generator.namespace
+
+
+def compile_schema(schema):
+    """
+    Compile schema
+    Generates and compiles validation function for schema. Function accepts
+    schema, model and context and returns validation result.
+
+    :param schema: shiftschema.schema.Schema
+    :return: callable
+    """
+    source, namespace = generate(schema)
+    code = compile(source, '<shiftschema {}>'.format(schema), 'exec')
+    exec(code, namespace)
+    return namespace['validate_0']
+
+
+def get_generated(schema):
+    """
+    Get generated
+    Returns generated validation function for schema, generating it on
+    first use. Schemas sharing definitions share generated function kept
+    on their class, while other schemas keep their own. Function is
+    regenerated only when schema plan gets recompiled, so changes to
+    nested schemas or property chains made after first validation are not
+    picked up unless schema.compile() is called again.
+
+    :param schema: shiftschema.schema.Schema
+    :return: callable
+    """
+    plan = schema._plan or schema.compile()
+    owner = type(schema) if schema._shared else schema
+    generated = vars(owner).get('_generated')
+    if generated is not None and generated[0] is plan:
+        return generated[1]
+
+    with lock:
+        generated = vars(owner).get('_generated')
+        if generated is None or generated[0] is not plan:
+            generated = (plan, compile_schema(schema))
+            setattr(owner, '_generated', generated)
+    return generated[1]
@@ -82,4 +82,21 @@ class NoTranslations(ShiftValidateException, ValueError):
     Indicates that no translation dictionary exists in registered path
     for the locale provided
     """
-    pass
\ No newline at end of file
+    pass
+
+class AsyncValidationRequired(ShiftValidateException, TypeError):
+    """
+    Async validation required
+    Raised when running async validators synchronously. Schemas having async
+    validators must be validated with avalidate() or aprocess()
+    """
+    pass
+
+
+class FrozenDefinition(ShiftValidateException, TypeError):
+    """
+    Frozen definition
+    Raised when changing a property or nested schema that is frozen, e.g.
+    definitions shared by all instances of a schema
+    """
+    pass
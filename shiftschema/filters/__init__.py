@@ -1,13 +1,44 @@
+from importlib import import_module
 from shiftschema.filters.abstract_filter import AbstractFilter
 from shiftschema.filters.digits import Digits
-from shiftschema.filters.slugify import Slugify
 from shiftschema.filters.stringify import Stringify
 from shiftschema.filters.strip import Strip
 from shiftschema.filters.lowercase import Lowercase
 from shiftschema.filters.uppercase import Uppercase
-from shiftschema.filters.bleach import Bleach
-from shiftschema.filters.linkify import Linkify
 from shiftschema.filters.add_http import AddHttp
+from shiftschema.filters.cached import Cached
+
+
+# filters depending on heavy libraries (bleach, html5lib, python-slugify)
+# get imported on first access, so that importing schemas does not pay
+# for them unless they are used
+lazy = dict(
+    Slugify='shiftschema.filters.slugify',
+    Bleach='shiftschema.filters.bleach',
+    Linkify='shiftschema.filters.linkify',
+)
+
+
+def __getattr__(name):
+    """
+    Get attribute
+    Imports lazy filters on first access (PEP 562).
+
+    :param name: str, attribute name
+    :return: filter class
+    """
+    module = lazy.get(name)
+    if module is None:
+        err = 'module {!r} has no attribute {!r}'
+        raise AttributeError(err.format(__name__, name))
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy))
 
 
 # todo implement these filters:
@@ -13,7 +13,9 @@ class AbstractFilter(metaclass=ABCMeta):
         """
         Filter
         Abstract filtering method: implement this in your concrete
-        filters. Accepts a value and returns filtered value.
+        filters. Accepts a value and returns filtered value. Return the
+        value itself when there is nothing to change, so that schemas
+        don't write it back to the model.
 
         :param value:               a value to filter
         :param model:               parent model of the property
@@ -22,5 +24,16 @@ class AbstractFilter(metaclass=ABCMeta):
         """
         raise NotImplemented
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Filters a list of values, e.g. items of a batch of models. Override
+        this in your filters if batch can be filtered faster than value by
+        value.
 
-
+        :param values:              list of values to filter
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    list of filtered values
+        """
+        return [self.filter(value, model, context) for value in values]
@@ -1,5 +1,6 @@
 from shiftschema.filters import AbstractFilter
-import bleach
+from bleach.sanitizer import Cleaner
+import threading
 
 
 class Bleach(AbstractFilter):
@@ -39,6 +40,9 @@ class Bleach(AbstractFilter):
     # whether to strip comments
     strip_comments = True
 
+    # return input when cleaning leaves it unchanged (costs a comparison)
+    keep_unchanged = False
+
     # a dict of prepared bleach params containing all of the above
     bleach_params = None
 
@@ -49,7 +53,8 @@ class Bleach(AbstractFilter):
         styles=None,
         protocols=None,
         strip=True,
-        strip_comments=True
+        strip_comments=True,
+        keep_unchanged=False
     ):
         """
         Initialize the filter and set bleach config options
@@ -60,6 +65,7 @@ class Bleach(AbstractFilter):
         :param protocols: allowed protocols for links
         :param strip: strip disallowed elements?
         :param strip_comments: strip comments?
+        :param keep_unchanged: return input when cleaning leaves it unchanged
         """
         self.tags = tags
         self.attributes = attributes
@@ -67,6 +73,7 @@ class Bleach(AbstractFilter):
         self.protocols = protocols
         self.strip = strip
         self.strip_comments = strip_comments
+        self.keep_unchanged = keep_unchanged
 
         # prepare bleach params
         self.bleach_params = dict(
@@ -83,6 +90,32 @@ class Bleach(AbstractFilter):
         if self.protocols:
             self.bleach_params['protocols'] = self.protocols
 
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """ Thread-local cleaners can't be pickled: drop them """
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def get_cleaner(self):
+        """
+        Get cleaner
+        Cleaners are not thread-safe and expensive to create, so every
+        thread gets its own one created on first use from bleach params
+        and reused for subsequent values.
+
+        :return: bleach.sanitizer.Cleaner
+        """
+        cleaner = getattr(self._local, 'cleaner', None)
+        if cleaner is None:
+            cleaner = self._local.cleaner = Cleaner(**self.bleach_params)
+        return cleaner
+
     def filter(self, value, model=None, context=None):
         """
         Filter
@@ -97,6 +130,35 @@ class Bleach(AbstractFilter):
         if type(value) is not str:
             return value
 
-        return bleach.clean(text=value, **self.bleach_params)
+        cleaned = self.get_cleaner().clean(value)
+        if self.keep_unchanged and cleaned == value:
+            return value
+        return cleaned
+
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Sanitizes a list of values with a single cleaner.
+
+        :param values:              list of values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list of filtered values
+        """
+        clean = self.get_cleaner().clean
+        if not self.keep_unchanged:
+            return [
+                clean(value) if type(value) is str else value
+                for value in values
+            ]
+
+        filtered = []
+        for value in values:
+            if type(value) is str:
+                cleaned = clean(value)
+                if cleaned != value:
+                    value = cleaned
+            filtered.append(value)
+        return filtered
 
 
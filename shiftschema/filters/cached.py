@@ -0,0 +1,56 @@
+from shiftschema.filters import AbstractFilter
+from shiftschema.exceptions import InvalidFilter
+from shiftschema.lru import LRUCache, MISSING
+
+# cached instead of result when filter returned value unchanged
+UNCHANGED = object()
+
+
+class Cached(AbstractFilter):
+    """
+    Cached filter
+    Wraps filter that is a pure function of the value, like Slugify or
+    Bleach, and memoizes filtered values in a bounded LRU cache. Model and
+    context are not part of the cache key. Unhashable values are filtered
+    without caching.
+    """
+
+    def __init__(self, filter, max_size=1024, max_bytes=None):
+        """
+        Initialize filter
+        :param filter: shiftschema.filters.AbstractFilter, filter to wrap
+        :param max_size: int, maximum number of cached values
+        :param max_bytes: int or None, maximum size of cached values
+        :return: None
+        """
+        if not isinstance(filter, AbstractFilter):
+            err = 'Filters must be of type {}'.format(AbstractFilter)
+            raise InvalidFilter(err)
+
+        self.wrapped = filter
+        self.cache = LRUCache(max_size=max_size, max_bytes=max_bytes)
+
+    def filter(self, value, model=None, context=None):
+        """
+        Filter
+        Returns cached filtered value or filters and caches it.
+
+        :param value:               input value
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    filtered value
+        """
+        key = (type(value), value)
+        try:
+            cached = self.cache.get(key)
+        except TypeError:
+            return self.wrapped.filter(value, model, context)
+
+        if cached is UNCHANGED:
+            return value
+        if cached is not MISSING:
+            return cached
+
+        filtered = self.wrapped.filter(value, model, context)
+        self.cache.set(key, UNCHANGED if filtered is value else filtered)
+        return filtered
@@ -1,6 +1,9 @@
 from shiftschema.filters import AbstractFilter
 import re
 
+# runs of digits
+pattern = re.compile(r'\d+')
+
 
 class Digits(AbstractFilter):
     """
@@ -33,13 +36,35 @@ class Digits(AbstractFilter):
         if type(value) is not str:
             return value
 
-        pattern = r'\d+'
-        found = ''.join(re.findall(pattern, value))
+        found = ''.join(pattern.findall(value))
+        if len(found) == len(value):
+            found = value  # nothing removed: keep original
 
         if found and self.to_int:
             found = int(found)
 
         return found
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Leaves just the digits in a list of values.
 
-
+        :param values:          list of values to filter
+        :param model:           parent model being validated
+        :param context:         object, filtering context
+        :return:                list of filtered values
+        """
+        findall = pattern.findall
+        to_int = self.to_int
+        filtered = []
+        for value in values:
+            if type(value) is str:
+                found = ''.join(findall(value))
+                if len(found) == len(value):
+                    found = value
+                if found and to_int:
+                    found = int(found)
+                value = found
+            filtered.append(value)
+        return filtered
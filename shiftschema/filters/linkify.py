@@ -1,5 +1,11 @@
 from shiftschema.filters import AbstractFilter
 from bleach.linkifier import Linker
+import threading
+
+
+def default_callback(attrs, new=False):
+    """ Default linkify callback (does not add anything to attrs) """
+    return attrs
 
 
 class Linkify(AbstractFilter):
@@ -24,21 +30,32 @@ class Linkify(AbstractFilter):
     # whether to linkify email addresses
     parse_email = True
 
+    # return input when linkifying leaves it unchanged (costs a comparison)
+    keep_unchanged = False
+
     # prepared list of params for linkifier containing all of the above
     linkify_params = None
 
-    def __init__(self, callbacks=None, skip_tags=None, parse_email=True):
+    def __init__(
+        self,
+        callbacks=None,
+        skip_tags=None,
+        parse_email=True,
+        keep_unchanged=False
+    ):
         """
         Initialize the filter and set bleach linkifier config options
 
         :param callbacks: list of callbacks
         :param skip_tags: list - skips links within these tags
         :param parse_email: bool - whether to linkify emails
+        :param keep_unchanged: bool - return input when left unchanged
         """
 
         self.callbacks = callbacks
         self.skip_tags = skip_tags
         self.parse_email = parse_email
+        self.keep_unchanged = keep_unchanged
 
         # prepare bleach params
         self.linkify_params = dict(parse_email=self.parse_email)
@@ -49,10 +66,34 @@ class Linkify(AbstractFilter):
         if self.callbacks:
             self.linkify_params['callbacks'] = self.callbacks
         else:
-            def default_callback(attrs, new=False):
-                return attrs
             self.linkify_params['callbacks'] = [default_callback]
 
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """ Thread-local linkers can't be pickled: drop them """
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def get_linker(self):
+        """
+        Get linker
+        Linkers are not thread-safe and expensive to create, so every
+        thread gets its own one created on first use from linkify params
+        and reused for subsequent values.
+
+        :return: bleach.linkifier.Linker
+        """
+        linker = getattr(self._local, 'linker', None)
+        if linker is None:
+            linker = self._local.linker = Linker(**self.linkify_params)
+        return linker
+
     def filter(self, value, model=None, context=None):
         """
         Filter
@@ -68,7 +109,35 @@ class Linkify(AbstractFilter):
         if type(value) is not str:
             return value
 
-        linker = Linker(**self.linkify_params)
-        return linker.linkify(value)
+        linked = self.get_linker().linkify(value)
+        if self.keep_unchanged and linked == value:
+            return value
+        return linked
+
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Linkifies a list of values with a single linker.
+
+        :param values:              list of values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list of filtered values
+        """
+        linkify = self.get_linker().linkify
+        if not self.keep_unchanged:
+            return [
+                linkify(value) if type(value) is str else value
+                for value in values
+            ]
+
+        filtered = []
+        for value in values:
+            if type(value) is str:
+                linked = linkify(value)
+                if linked != value:
+                    value = linked
+            filtered.append(value)
+        return filtered
 
 
@@ -23,6 +23,25 @@ class Lowercase(AbstractFilter):
         if type(value) is not str:
             return value
 
-        return value.lower()
+        filtered = value.lower()
+        return value if filtered == value else filtered
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Converts a list of values to lowercase.
 
+        :param values:              list of values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list of filtered values
+        """
+        lower = str.lower
+        filtered = []
+        for value in values:
+            if type(value) is str:
+                converted = lower(value)
+                if converted != value:
+                    value = converted
+            filtered.append(value)
+        return filtered
@@ -102,6 +102,6 @@ class Slugify(AbstractFilter):
             lowercase=self.lowercase,
             replacements=self.replacements,
         )
-        return result
+        return value if result == value else result
 
 
@@ -51,4 +51,25 @@ class Strip(AbstractFilter):
         else:
             return value.strip(self.chars)
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Strips a list of values choosing strip mode once.
+
+        :param values:              list of values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list of filtered values
+        """
+        if self.mode == 'left':
+            strip = str.lstrip
+        elif self.mode == 'right':
+            strip = str.rstrip
+        else:
+            strip = str.strip
 
+        chars = self.chars
+        return [
+            strip(value, chars) if type(value) is str else value
+            for value in values
+        ]
@@ -23,6 +23,25 @@ class Uppercase(AbstractFilter):
         if type(value) is not str:
             return value
 
-        return value.upper()
+        filtered = value.upper()
+        return value if filtered == value else filtered
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Converts a list of values to uppercase.
 
+        :param values:              list of values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list of filtered values
+        """
+        upper = str.upper
+        filtered = []
+        for value in values:
+            if type(value) is str:
+                converted = upper(value)
+                if converted != value:
+                    value = converted
+            filtered.append(value)
+        return filtered
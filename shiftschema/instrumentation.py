@@ -0,0 +1,292 @@
+"""
+Instrumentation
+Optional timing of filtering and validation. While an instrument is active
+in current thread or task, schemas record wall time and call counts per
+property path (including nested entities and collections), per validator
+class and per filter class. When no instrument is active the only cost is
+a single context variable lookup per schema stage.
+
+Async validation and validation inside executor workers is not
+instrumented.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# instrument active in current context and path prefix of nested schema
+active = ContextVar('shiftschema_instrument', default=None)
+prefix = ContextVar('shiftschema_instrument_prefix', default='')
+
+
+@contextmanager
+def instrument(instance=None):
+    """
+    Instrument
+    Context manager that activates an instrument for all schemas filtered
+    and validated within the block in current thread or task.
+
+    :param instance: Instrument or None to create default one
+    :return: Instrument
+    """
+    instance = instance if instance is not None else Instrument()
+    token = active.set(instance)
+    try:
+        yield instance
+    finally:
+        active.reset(token)
+
+
+class Stat:
+    """
+    Stat
+    Call count, total and slowest call time of a single measured thing
+    """
+    __slots__ = ('calls', 'seconds', 'max')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """ Record single call """
+        self.calls += 1
+        self.seconds += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def __repr__(self):
+        r = '<Stat calls={} seconds={:.6f} max={:.6f}>'
+        return r.format(self.calls, self.seconds, self.max)
+
+
+class Instrument:
+    """
+    Instrument
+    Collects timings reported by schemas. Override on_property(),
+    on_validator() and on_filter() hooks to send timings elsewhere, e.g.
+    to your metrics system.
+    """
+
+    def __init__(self):
+        self.properties = {}
+        self.validators = {}
+        self.filters = {}
+        self._plans = {}
+
+    def on_property(self, path, seconds):
+        """
+        On property
+        Called with time spent filtering or validating property. For
+        entities and collections includes time of nested schemas. Items
+        of collections are reported under the path of collection.
+
+        :param path: str, dotted property path, e.g. 'address.city'
+        :param seconds: float, wall time
+        :return: None
+        """
+        stat = self.properties.get(path)
+        if stat is None:
+            stat = self.properties[path] = Stat()
+        stat.add(seconds)
+
+    def on_validator(self, validator, seconds):
+        """
+        On validator
+        Called with time spent in a single validator run
+        :param validator: shiftschema.validators.AbstractValidator
+        :param seconds: float, wall time
+        :return: None
+        """
+        cls = type(validator)
+        stat = self.validators.get(cls)
+        if stat is None:
+            stat = self.validators[cls] = Stat()
+        stat.add(seconds)
+
+    def on_filter(self, filter, seconds):
+        """
+        On filter
+        Called with time spent in a single filter run
+        :param filter: shiftschema.filters.AbstractFilter
+        :param seconds: float, wall time
+        :return: None
+        """
+        cls = type(filter)
+        stat = self.filters.get(cls)
+        if stat is None:
+            stat = self.filters[cls] = Stat()
+        stat.add(seconds)
+
+    def report(self):
+        """
+        Report
+        Formats collected stats as text, slowest first
+        :return: str
+        """
+        lines = []
+        sections = (
+            ('properties', self.properties),
+            ('validators', self.validators),
+            ('filters', self.filters),
+        )
+        for title, stats in sections:
+            lines.append('{}:'.format(title))
+            ordered = sorted(stats.items(), key=lambda s: -s[1].seconds)
+            for key, stat in ordered:
+                name = key if isinstance(key, str) else key.__name__
+                line = '  {:<40} {:>8} calls {:>12.6f}s total {:>10.6f}s max'
+                lines.append(line.format(
+                    name,
+                    stat.calls,
+                    stat.seconds,
+                    stat.max
+                ))
+
+        return '\n'.join(lines)
+
+    def plan(self, schema, plan):
+        """
+        Plan
+        Returns instrumented copy of schema execution plan for current path
+        prefix. Properties in it are timed copies of original properties
+        with timed filter and validator chains. Copies are cached until
+        schema or any of its properties get recompiled.
+
+        :param schema: shiftschema.schema.Schema
+        :param plan: tuple, compiled schema plan
+        :return: tuple, instrumented plan
+        """
+        path = prefix.get()
+        key = (id(schema), path)
+        compiled = tuple(
+            prop._compiled for properties in plan[1:] for _, prop in properties
+        )
+        cached = self._plans.get(key)
+        if cached is not None and cached[1] is plan and all(
+            a is b for a, b in zip(cached[2], compiled)
+        ):
+            return cached[3]
+
+        state = tuple(
+            TimedValidator(self, validator, path + '__state__')
+            for validator in plan[0]
+        )
+        timed = (state,) + tuple(
+            tuple(
+                (name, self.timed_property(prop, path + name))
+                for name, prop in properties
+            )
+            for properties in plan[1:]
+        )
+
+        # keep schema referenced, so that its id can't be reused
+        self._plans[key] = (schema, plan, compiled, timed)
+        return timed
+
+    def timed_property(self, prop, path):
+        """
+        Timed property
+        Creates a copy of property with timed filters, validators and
+        methods schemas call when filtering and validating.
+
+        :param prop: shiftschema.property.SimpleProperty
+        :param path: str, property path
+        :return: shiftschema.property.SimpleProperty
+        """
+        compiled = prop._compiled or prop.compile()
+        timed = object.__new__(type(prop))
+        timed.__dict__.update(prop.__dict__)
+        timed._compiled = (
+            tuple(TimedFilter(self, f) for f in compiled[0]),
+            tuple(TimedValidator(self, v) for v in compiled[1]),
+            tuple(TimedValidator(self, v) for v in compiled[2]),
+            compiled[3],
+        )
+
+        cls = type(prop)
+        timed.filter = self.timed(cls.filter.__get__(timed), path)
+        timed.get_errors = self.timed(cls.get_errors.__get__(timed), path)
+        if hasattr(cls, 'validate_with_schema'):
+            nested = path + '.'
+            timed.filter_with_schema = self.timed(
+                self.nested(cls.filter_with_schema.__get__(timed), nested),
+                path
+            )
+            timed.validate_with_schema = self.timed(
+                self.nested(cls.validate_with_schema.__get__(timed), nested),
+                path
+            )
+            timed.process_with_schema = self.timed(
+                self.nested(cls.process_with_schema.__get__(timed), nested),
+                path
+            )
+
+        return timed
+
+    def timed(self, method, path):
+        """ Wrap property method to report its time under path """
+        def timed_method(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.on_property(path, perf_counter() - start)
+        return timed_method
+
+    def nested(self, method, path):
+        """ Wrap property method to run nested schemas under path """
+        def nested_method(*args, **kwargs):
+            token = prefix.set(path)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                prefix.reset(token)
+        return nested_method
+
+
+class TimedValidator:
+    """
+    Timed validator
+    Wraps validator to report time of each run to instrument and
+    optionally to property path
+    """
+    __slots__ = ('instrument', 'validator', 'path')
+
+    def __init__(self, instrument, validator, path=None):
+        self.instrument = instrument
+        self.validator = validator
+        self.path = path
+
+    def run(self, value, model=None, context=None):
+        start = perf_counter()
+        try:
+            return self.validator.run(value, model, context)
+        finally:
+            seconds = perf_counter() - start
+            self.instrument.on_validator(self.validator, seconds)
+            if self.path is not None:
+                self.instrument.on_property(self.path, seconds)
+
+
+class TimedFilter:
+    """
+    Timed filter
+    Wraps filter to report time of each run to instrument
+    """
+    __slots__ = ('instrument', 'filter_obj')
+
+    def __init__(self, instrument, filter_obj):
+        self.instrument = instrument
+        self.filter_obj = filter_obj
+
+    def filter(self, value, model=None, context=None):
+        start = perf_counter()
+        try:
+            return self.filter_obj.filter(value, model, context)
+        finally:
+            self.instrument.on_filter(
+                self.filter_obj,
+                perf_counter() - start
+            )
@@ -0,0 +1,147 @@
+"""
+LRU cache
+Thread-safe least recently used cache bounded by number of items and
+optionally by approximate size of keys and values in bytes. Counts hits,
+misses and evictions. Used by caching filter and validator wrappers.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+# returned by get() when key is not cached
+MISSING = object()
+
+
+def sizeof(obj):
+    """
+    Size of
+    Returns approximate size of object in bytes. Tuples, e.g. cache keys
+    made of value type and value, count the size of their items too, except
+    for types and singletons like None and booleans, which are shared and
+    not held by the cache alone.
+
+    :param obj: object to measure
+    :return: int
+    """
+    size = sys.getsizeof(obj)
+    if type(obj) is tuple:
+        for item in obj:
+            if isinstance(item, type) or item is None or item is True:
+                continue
+            if item is not False:
+                size += sys.getsizeof(item)
+    return size
+
+
+class LRUCache:
+    """
+    LRU cache
+    Evicts least recently used items when exceeding maximum number of items
+    or maximum size in bytes. Sizes are measured with sys.getsizeof, which
+    is accurate for strings and numbers and shallow for containers, except
+    for tuple keys, which count their items.
+    """
+
+    def __init__(self, max_size=1024, max_bytes=None):
+        """
+        Initialize cache
+        :param max_size: int, maximum number of items
+        :param max_bytes: int or None, maximum size of items in bytes
+        :return: None
+        """
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.items = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        r = '<LRUCache items={} bytes={} hits={} misses={} evictions={}>'
+        return r.format(
+            len(self.items),
+            self.bytes,
+            self.hits,
+            self.misses,
+            self.evictions
+        )
+
+    def get(self, key):
+        """
+        Get
+        Returns cached value and marks it as recently used or MISSING
+        :param key: hashable key
+        :return: cached value or MISSING
+        """
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                self.misses += 1
+                return MISSING
+
+            self.items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key, value):
+        """
+        Set
+        Caches value evicting least recently used items if over limits.
+        Values larger than the whole byte limit are not cached.
+
+        :param key: hashable key
+        :param value: value to cache
+        :return: None
+        """
+        size = sizeof(key) + sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self.lock:
+            previous = self.items.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+
+            self.items[key] = (value, size)
+            self.bytes += size
+
+            while len(self.items) > self.max_size or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                _, evicted = self.items.popitem(last=False)
+                self.bytes -= evicted[1]
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Clear
+        Removes all cached items and resets counters
+        :return: None
+        """
+        with self.lock:
+            self.items.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Stats
+        Returns cache counters
+        :return: dict
+        """
+        return dict(
+            items=len(self.items),
+            bytes=self.bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions
+        )
@@ -0,0 +1,148 @@
+"""
+Parallel validation
+Helpers to split large collections and batches of models into chunks that
+get validated with a concurrent.futures executor (thread or process pool)
+and reassemble results in original order. When using process pools schema,
+models and context must be picklable. Nested collections validated inside
+executor workers are validated inline, so that nested collections sharing
+a bounded executor do not wait on tasks queued behind their own.
+"""
+
+from collections import deque
+from functools import partial
+from itertools import islice
+import threading
+
+
+# marks threads validating chunks inside executor workers
+worker = threading.local()
+
+
+def in_worker():
+    """
+    In worker
+    Checks whether current thread validates a chunk inside executor worker.
+    :return: bool
+    """
+    return getattr(worker, 'active', False)
+
+
+def chunks(iterable, size):
+    """
+    Chunks
+    Splits an iterable into lists of given size. Last chunk can be smaller.
+
+    :param iterable: iterable to split
+    :param size: int, chunk size
+    :return: generator of lists
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_chunk(
+    schema,
+    models,
+    context=None,
+    fail_fast=None,
+    stop_on_invalid=False
+):
+    """
+    Validate chunk
+    Validates a chunk of models with schema. Runs inside executor workers.
+
+    :param schema: shiftschema.schema.Schema
+    :param models: list of objects or dicts
+    :param context: object, dict or None
+    :param fail_fast: bool, stop validating model on first error
+    :param stop_on_invalid: bool, stop on first invalid model
+    :return: list of shiftschema.result.Result
+    """
+    active = in_worker()
+    worker.active = True
+    try:
+        results = []
+        for model in models:
+            result = schema.validate(
+                model,
+                context=context,
+                fail_fast=fail_fast
+            )
+            results.append(result)
+            if stop_on_invalid and not result:
+                break
+    finally:
+        worker.active = active
+
+    return results
+
+
+def validate_parallel(
+    executor,
+    schema,
+    models,
+    context=None,
+    fail_fast=None,
+    stop_on_invalid=False,
+    chunk_size=1000,
+    pending=16
+):
+    """
+    Validate parallel
+    Lazily validates an iterable of models in chunks submitted to executor
+    and yields results in original order. Keeps at most a number of pending
+    chunks in flight, so that large iterables are not consumed at once.
+    When called inside executor worker validates models inline instead.
+
+    :param executor: concurrent.futures.Executor
+    :param schema: shiftschema.schema.Schema
+    :param models: iterable of objects or dicts
+    :param context: object, dict or None
+    :param fail_fast: bool, stop validating model on first error
+    :param stop_on_invalid: bool, stop on first invalid model
+    :param chunk_size: int, number of models per chunk
+    :param pending: int, maximum number of chunks in flight
+    :return: generator of shiftschema.result.Result
+    """
+    if in_worker():
+        yield from validate_chunk(
+            schema,
+            models,
+            context=context,
+            fail_fast=fail_fast,
+            stop_on_invalid=stop_on_invalid
+        )
+        return
+
+    task = partial(
+        validate_chunk,
+        schema,
+        context=context,
+        fail_fast=fail_fast,
+        stop_on_invalid=stop_on_invalid
+    )
+
+    futures = deque()
+    batches = chunks(models, chunk_size)
+    try:
+        for batch in batches:
+            futures.append(executor.submit(task, batch))
+            if len(futures) < pending:
+                continue
+            for result in futures.popleft().result():
+                yield result
+                if stop_on_invalid and not result:
+                    return
+
+        while futures:
+            for result in futures.popleft().result():
+                yield result
+                if stop_on_invalid and not result:
+                    return
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,291 @@
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+from shiftschema import translator as translations
+from shiftschema.exceptions import NoTranslations
+from shiftschema.version import version
+
+
+# bump when layout of cache files changes
+FORMAT = 2
+
+
+def hash_file(path):
+    """
+    Hash file
+    Returns hash of file contents or None if file does not exist.
+
+    :param path:            str, path to file
+    :return:                str or None
+    """
+    try:
+        with open(path, 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def stat_file(path):
+    """
+    Stat file
+    Returns modification time and size of file or None if file does not
+    exist. Used to tell file is unchanged without reading it.
+
+    :param path:            str, path to file
+    :return:                tuple or None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def walk(schema, seen=None):
+    """
+    Walk schema
+    Yields schema, its state validators, properties, their filters and
+    validators and then does the same for every nested schema. Every schema
+    is visited once, so recursive schemas are fine.
+
+    :param schema:          shiftschema.schema.Schema
+    :param seen:            set, ids of visited schemas
+    :return:                generator of objects
+    """
+    if seen is None:
+        seen = set()
+    if id(schema) in seen:
+        return
+    seen.add(id(schema))
+
+    yield schema
+    yield from schema.state
+    plan = schema._plan or schema.compile()
+    for properties in plan[1:]:
+        for _, prop in properties:
+            yield prop
+            yield from prop.filters
+            yield from prop.validators
+            nested = getattr(prop, 'schema', None)
+            if nested is not None:
+                yield from walk(nested, seen)
+
+
+def source_files(schema):
+    """
+    Source files
+    Returns source files of modules defining classes used by schema, e.g.
+    schema subclasses and custom filters or validators. Modules of the
+    library itself are left out as they are covered by library version.
+
+    :param schema:          shiftschema.schema.Schema
+    :return:                list of paths
+    """
+    files = set()
+    for obj in walk(schema):
+        for cls in type(obj).__mro__:
+            name = cls.__module__
+            if name == 'shiftschema' or name.startswith('shiftschema.'):
+                continue
+            file = getattr(sys.modules.get(name), '__file__', None)
+            if file:
+                files.add(os.path.realpath(file))
+
+    return sorted(files)
+
+
+def translation_files(dirs, locale):
+    """
+    Translation files
+    Returns files translator with given locations would load dictionaries
+    from for locale.
+
+    :param dirs:            list, translation locations
+    :param locale:          str, normalized locale
+    :return:                list of paths
+    """
+    files = []
+    for path in dirs:
+        for extension in ('py', 'json'):
+            file = os.path.join(path, '{}.{}'.format(locale, extension))
+            if os.path.isfile(file):
+                files.append(file)
+
+    return files
+
+
+def fingerprint(schema):
+    """
+    Fingerprint
+    Records modification time, size and hash of source files schema was
+    built from along with translation files for schema locale. Cached
+    schema is stale when any of those change.
+
+    :param schema:          shiftschema.schema.Schema
+    :return:                dict, (stat, hash) per path
+    """
+    translator = schema.translator
+    files = source_files(schema)
+    locale = translator.normalize_locale(schema.locale)
+    files += translation_files(translator.dirs, locale)
+    return {file: (stat_file(file), hash_file(file)) for file in files}
+
+
+def compiled_regexes(schema):
+    """
+    Compiled regexes
+    Compiles regexes of regex based validators used by schema, e.g. email
+    and url, and returns them per validator class. Patterns are pickled by
+    their source and get recompiled on load without rebuilding them.
+
+    :param schema:          shiftschema.schema.Schema
+    :return:                dict
+    """
+    regexes = {}
+    for obj in walk(schema):
+        compiled = getattr(obj, 'compiled_regexes', None)
+        if isinstance(compiled, dict):
+            obj.regex()
+            regexes[type(obj)] = compiled
+
+    return {cls: dict(compiled) for cls, compiled in regexes.items()}
+
+
+def save(schema, path):
+    """
+    Save
+    Compiles schema and writes it to a cache file along with compiled
+    regexes and translations for schema locale. File is written atomically,
+    so that concurrently starting workers never read a partial file. Cached
+    schema is invalidated when library version or any of the source or
+    translation files it was built from change.
+
+    :param schema:          shiftschema.schema.Schema
+    :param path:            str, path to cache file
+    :return:                None
+    """
+    schema._plan or schema.compile()
+    translator = schema.translator
+    locale = translator.normalize_locale(schema.locale)
+    try:
+        dictionary = translator.get_translations(schema.locale)
+    except NoTranslations:
+        dictionary = None
+
+    header = dict(
+        format=FORMAT,
+        version=version,
+        files=fingerprint(schema),
+        translations=(locale, tuple(translator.dirs)),
+    )
+
+    payload = dict(
+        schema=schema,
+        regexes=compiled_regexes(schema),
+        translations=(locale, tuple(translator.dirs), dictionary),
+    )
+
+    dir = os.path.dirname(os.path.abspath(path))
+    handle, tmp = tempfile.mkstemp(dir=dir, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def is_fresh(header):
+    """
+    Is fresh
+    Checks cache file header against library version and current state of
+    files the schema was built from, including translation files that
+    appeared since. Files are only hashed when their modification time or
+    size changed, e.g. after a fresh checkout, so that loading does not
+    read every source file.
+
+    :param header:          dict, cache file header
+    :return:                bool
+    """
+    if not isinstance(header, dict):
+        return False
+    if header.get('format') != FORMAT or header.get('version') != version:
+        return False
+
+    files = header['files']
+    locale, dirs = header['translations']
+    for file in translation_files(dirs, locale):
+        if file not in files:
+            return False
+
+    for file, (stat, hash) in files.items():
+        if stat_file(file) != stat and hash_file(file) != hash:
+            return False
+    return True
+
+
+def load(path):
+    """
+    Load
+    Loads schema from a cache file written by save(). Returns None if there
+    is no cache file, it can't be read or is stale, in which case schema
+    must be built and saved again. Cache files are pickles, so only load
+    files you trust.
+
+    :param path:            str, path to cache file
+    :return:                shiftschema.schema.Schema or None
+    """
+    try:
+        with open(path, 'rb') as file:
+            if not is_fresh(pickle.load(file)):
+                return None
+            payload = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+    schema = payload['schema']
+    for cls, compiled in payload['regexes'].items():
+        for key, regex in compiled.items():
+            cls.compiled_regexes.setdefault(key, regex)
+
+    # translator with new locations won't use these
+    locale, dirs, dictionary = payload['translations']
+    if dictionary and tuple(schema.translator.dirs) == dirs:
+        with translations.lock:
+            translations.cache.setdefault((locale, dirs), dictionary)
+
+    if schema._shared:
+        schema.adopt_definitions()
+
+    return schema
+
+
+def cached(path, build):
+    """
+    Cached
+    Loads schema from cache file or builds it by calling build and saves it
+    to cache file for next time. When build is a schema class, cached schema
+    of any other class is rebuilt. Schemas that can't be pickled, e.g. ones
+    using lambdas or local functions as callbacks, are returned without
+    being cached.
+
+    :param path:            str, path to cache file
+    :param build:           callable returning shiftschema.schema.Schema
+    :return:                shiftschema.schema.Schema
+    """
+    schema = load(path)
+    if isinstance(build, type) and type(schema) is not build:
+        schema = None
+    if schema is None:
+        schema = build()
+        try:
+            save(schema, path)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            pass
+
+    return schema
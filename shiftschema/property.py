@@ -1,8 +1,11 @@
 from shiftschema.filters import AbstractFilter
 from shiftschema.validators import AbstractValidator
 from shiftschema.exceptions import InvalidFilter, InvalidValidator
-from shiftschema.exceptions import InvalidSchemaType
+from shiftschema.exceptions import InvalidSchemaType, FrozenDefinition
 from shiftschema.validators import Required
+from shiftschema.validators import AbstractAsyncValidator
+from shiftschema.validators.abstract_async_validator import run_validators
+from shiftschema.parallel import validate_parallel
 
 
 class SimpleProperty:
@@ -11,19 +14,40 @@ class SimpleProperty:
     A single value property on the schema and holds a number of filters and
     validators for this value
     """
-    def __init__(self, use_context=True):
+    def __init__(self, use_context=True, fail_fast=False):
         """
         Initialize property
         Can optionally accept a flag indicating whether the property should
         inherit context when being filtered and validated. This is useful
         to control how custom context is being passed down when validating
-        graphs with nested schemas.
+        graphs with nested schemas. Fail fast flag makes property stop
+        validation on first error.
 
         :param use_context: bool, use or ignore passed context
+        :param fail_fast: bool, stop validation on first error
         """
         self.filters = []
         self.validators = []
         self.use_context = use_context
+        self.fail_fast = fail_fast
+        self._compiled = None
+        self._frozen = False
+
+    def freeze(self):
+        """
+        Freeze property
+        Compiles property and prevents adding filters and validators to it,
+        so that it can be shared by many schemas.
+        :return: None
+        """
+        self.compile()
+        self._frozen = True
+
+    def ensure_not_frozen(self):
+        """ Raise if property is frozen """
+        if self._frozen:
+            err = 'Property is frozen and shared by schemas, can not change it'
+            raise FrozenDefinition(err)
 
     def add_filter(self, filter):
         """
@@ -31,12 +55,14 @@ class SimpleProperty:
         :param filter: object, extending from AbstractFilter
         :return: None
         """
+        self.ensure_not_frozen()
         if not isinstance(filter, AbstractFilter):
             err = 'Filters must be of type {}'.format(AbstractFilter)
             raise InvalidFilter(err)
 
         if filter not in self.filters:
             self.filters.append(filter)
+            self._compiled = None
         return self
 
     def add_validator(self, validator):
@@ -46,13 +72,35 @@ class SimpleProperty:
         :param validator: object, extending from AbstractValidator
         :return: None
         """
+        self.ensure_not_frozen()
         if not isinstance(validator, AbstractValidator):
             err = 'Validator must be of type {}'.format(AbstractValidator)
             raise InvalidValidator(err)
 
         self.validators.append(validator)
+        self._compiled = None
         return self
 
+    def compile(self):
+        """
+        Compile property
+        Precomputes filter and validator chains that are iterated when
+        filtering and validating values, including the validators that
+        still need to run when value is None, and whether any of the
+        validators are async. The chains are cached until a filter or
+        validator gets added to the property.
+
+        :return: tuple, (filters, validators, none validators, has async)
+        """
+        filters = tuple(self.filters)
+        validators = tuple(self.validators)
+        required = tuple(v for v in validators if isinstance(v, Required))
+        has_async = any(
+            isinstance(v, AbstractAsyncValidator) for v in validators
+        )
+        self._compiled = (filters, validators, required, has_async)
+        return self._compiled
+
     def filter(self, value=None, model=None, context=None):
         """
         Sequentially applies all the filters to provided value
@@ -64,38 +112,190 @@ class SimpleProperty:
         """
         if value is None:
             return value
-        for filter_obj in self.filters:
+
+        filters = (self._compiled or self.compile())[0]
+        context = context if self.use_context else None
+        for filter_obj in filters:
             value = filter_obj.filter(
                 value=value,
                 model=model,
-                context=context if self.use_context else None
+                context=context
             )
         return value
 
-    def validate(self, value=None, model=None, context=None):
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Applies filters to a column of values, running each filter once
+        over the whole column through its filter_many(). Just like with
+        single values, None values are left as they are.
+
+        :param values: iterable of values to filter
+        :param model: parent entity
+        :param context: filtering context, usually parent entity
+        :return: list of filtered values
+        """
+        values = list(values)
+        filters = (self._compiled or self.compile())[0]
+        if not filters:
+            return values
+
+        context = context if self.use_context else None
+        indices = [i for i, value in enumerate(values) if value is not None]
+        if len(indices) == len(values):
+            for filter_obj in filters:
+                values = filter_obj.filter_many(values, model, context)
+            return values
+
+        present = [values[i] for i in indices]
+        for filter_obj in filters:
+            present = filter_obj.filter_many(present, model, context)
+        for i, value in zip(indices, present):
+            values[i] = value
+        return values
+
+    def validate_many(self, values, model=None, context=None, fail_fast=False):
+        """
+        Validate many
+        Validates a column of values, running each validator once over the
+        whole column through its validate_many(). Returns list of errors
+        for every value, in the same order, just like validate() would.
+
+        :param values: iterable of values to validate
+        :param model: parent entity
+        :param context: validation context, usually parent entity
+        :param fail_fast: bool, stop on first error for every value
+        :return: list of lists of errors
+        """
+        values = list(values)
+        compiled = self._compiled or self.compile()
+        context = context if self.use_context else None
+        fail_fast = fail_fast or self.fail_fast
+
+        errors = [[] for _ in values]
+        present = [i for i, value in enumerate(values) if value is not None]
+        missing = [i for i, value in enumerate(values) if value is None]
+        for indices, validators in (
+            (present, compiled[1]),
+            (missing, compiled[2])
+        ):
+            for validator in validators:
+                if fail_fast:
+                    indices = [i for i in indices if not errors[i]]
+                if not indices:
+                    break
+
+                results = validator.validate_many(
+                    [values[i] for i in indices],
+                    model,
+                    context
+                )
+                for i, error in zip(indices, results):
+                    if error:
+                        errors[i].append(error)
+
+        return errors
+
+    def validate(self, value=None, model=None, context=None, fail_fast=False):
         """
         Sequentially apply each validator to value and collect errors.
 
         :param value: a value to validate
         :param model: parent entity
         :param context: validation context, usually parent entity
+        :param fail_fast: bool, stop on first error
         :return: list of errors (if any)
         """
-        errors = []
-        for validator in self.validators:
-            if value is None and not isinstance(validator, Required):
+        errors = self.get_errors(value, model, context, fail_fast)
+        return errors if errors is not None else []
+
+    def get_errors(
+        self,
+        value=None,
+        model=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Get errors
+        Same as validate(), but returns None for valid values, so that
+        success path does not allocate an empty list of errors.
+
+        :param value: a value to validate
+        :param model: parent entity
+        :param context: validation context, usually parent entity
+        :param fail_fast: bool, stop on first error
+        :return: list of errors or None
+        """
+        compiled = self._compiled or self.compile()
+        validators = compiled[1] if value is not None else compiled[2]
+        context = context if self.use_context else None
+        fail_fast = fail_fast or self.fail_fast
+
+        errors = None
+        for validator in validators:
+            error = validator.run(value, model, context)
+            if not error:
                 continue
 
-            error = validator.run(
-                value=value,
-                model=model,
-                context=context if self.use_context else None
-            )
-            if error:
+            if errors is None:
+                errors = [error]
+            else:
                 errors.append(error)
+            if fail_fast:
+                break
 
         return errors
 
+    async def avalidate(
+        self,
+        value=None,
+        model=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Asynchronously apply each validator to value and collect errors.
+        Sync validators run inline while async ones are awaited concurrently.
+
+        :param value: a value to validate
+        :param model: parent entity
+        :param context: validation context, usually parent entity
+        :param fail_fast: bool, stop on first error
+        :return: list of errors (if any)
+        """
+        errors = await self.aget_errors(value, model, context, fail_fast)
+        return errors if errors is not None else []
+
+    async def aget_errors(
+        self,
+        value=None,
+        model=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Get errors asynchronously
+        Same as avalidate(), but returns None for valid values.
+
+        :param value: a value to validate
+        :param model: parent entity
+        :param context: validation context, usually parent entity
+        :param fail_fast: bool, stop on first error
+        :return: list of errors or None
+        """
+        compiled = self._compiled or self.compile()
+        if not compiled[3]:
+            return self.get_errors(value, model, context, fail_fast)
+
+        return await run_validators(
+            compiled[1] if value is not None else compiled[2],
+            value,
+            model=model,
+            context=context if self.use_context else None,
+            fail_fast=fail_fast or self.fail_fast
+        )
+
 
 class EntityProperty(SimpleProperty):
     """
@@ -104,8 +304,8 @@ class EntityProperty(SimpleProperty):
     filters and validators attached as well as a nested schema.
     """
 
-    def __init__(self, use_context=True):
-        super().__init__(use_context=use_context)
+    def __init__(self, use_context=True, fail_fast=False):
+        super().__init__(use_context=use_context, fail_fast=fail_fast)
         self._schema = None
 
     @property
@@ -115,6 +315,7 @@ class EntityProperty(SimpleProperty):
     @schema.setter
     def schema(self, schema):
         from shiftschema.schema import Schema
+        self.ensure_not_frozen()
         if isinstance(schema, Schema):
             self._schema = schema
             return
@@ -122,6 +323,16 @@ class EntityProperty(SimpleProperty):
         err = 'Nested schema must be of type "{}" got "{}"'
         raise InvalidSchemaType(err.format(Schema, schema))
 
+    def freeze(self):
+        """
+        Freeze property
+        Freezes property along with its nested schema.
+        :return: None
+        """
+        super().freeze()
+        if self._schema is not None:
+            self._schema.freeze()
+
     def filter_with_schema(self, model=None, context=None):
         """ Perform model filtering with schema """
         if model is None or self.schema is None:
@@ -132,14 +343,45 @@ class EntityProperty(SimpleProperty):
             context=context if self.use_context else None
         )
 
-    def validate_with_schema(self, model=None, context=None):
+    def validate_with_schema(self, model=None, context=None, fail_fast=False):
         """ Perform model validation with schema"""
         if self._schema is None or model is None:
             return
 
         result = self._schema.validate(
             model=model,
-            context=context if self.use_context else None
+            context=context if self.use_context else None,
+            fail_fast=fail_fast or self.fail_fast or None
+        )
+        return result
+
+    def process_with_schema(self, model=None, context=None, fail_fast=False):
+        """ Perform model filtering and validation with schema in one pass """
+        if self._schema is None or model is None:
+            return
+
+        result = self._schema.process(
+            model=model,
+            context=context if self.use_context else None,
+            fail_fast=fail_fast or self.fail_fast or None,
+            fused=True
+        )
+        return result
+
+    async def avalidate_with_schema(
+        self,
+        model=None,
+        context=None,
+        fail_fast=False
+    ):
+        """ Perform model validation with schema asynchronously """
+        if self._schema is None or model is None:
+            return
+
+        result = await self._schema.avalidate(
+            model=model,
+            context=context if self.use_context else None,
+            fail_fast=fail_fast or self.fail_fast or None
         )
         return result
 
@@ -152,6 +394,34 @@ class CollectionProperty(EntityProperty):
     whole, when schema will be applied to each item in the collection.
     """
 
+    def __init__(
+        self,
+        use_context=True,
+        fail_fast=False,
+        executor=None,
+        chunk_size=1000
+    ):
+        """
+        Initialize property
+        In addition to entity property options accepts an optional
+        concurrent.futures executor (thread or process pool) to validate
+        large collections in parallel, split into chunks of given size.
+
+        :param use_context: bool, use or ignore passed context
+        :param fail_fast: bool, stop validation on first error
+        :param executor: concurrent.futures.Executor or None
+        :param chunk_size: int, number of items validated per task
+        """
+        super().__init__(use_context=use_context, fail_fast=fail_fast)
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def __getstate__(self):
+        """ Executors can't be pickled: drop when sending to workers """
+        state = self.__dict__.copy()
+        state['executor'] = None
+        return state
+
     def filter_with_schema(self, collection=None, context=None):
         """ Perform collection items filtering with schema """
         if collection is None or self.schema is None:
@@ -166,25 +436,134 @@ class CollectionProperty(EntityProperty):
         except TypeError:
             pass
 
-    def validate_with_schema(self, collection=None, context=None):
-        """ Validate each item in collection with our schema"""
+    def validate_with_schema(
+        self,
+        collection=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Validate each item in collection with our schema. In fail fast mode
+        stops on first invalid item.
+        """
         if self._schema is None or not collection:
             return
 
+        context = context if self.use_context else None
+        fail_fast = fail_fast or self.fail_fast
+
+        if self.executor is not None:
+            results = validate_parallel(
+                self.executor,
+                self._schema,
+                collection,
+                context=context,
+                fail_fast=fail_fast or None,
+                stop_on_invalid=fail_fast,
+                chunk_size=self.chunk_size
+            )
+            try:
+                return list(results)
+            except TypeError:
+                return []
+
         result = []
         try:
             for index, item in enumerate(collection):
                 item_result = self._schema.validate(
                     model=item,
-                    context=context if self.use_context else None
+                    context=context,
+                    fail_fast=fail_fast or None
                 )
                 result.append(item_result)
+                if fail_fast and not item_result:
+                    break
         except TypeError:
             pass
 
         return result
 
+    def process_with_schema(
+        self,
+        collection=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Filter and validate each item in collection with our schema in one
+        pass. In fail fast mode items after first invalid one are only
+        filtered. Items of collections having an executor are filtered
+        first and then validated in parallel.
+        """
+        if self._schema is None or not collection:
+            return
+
+        if self.executor is not None:
+            self.filter_with_schema(collection, context)
+            return self.validate_with_schema(collection, context, fail_fast)
+
+        context = context if self.use_context else None
+        fail_fast = fail_fast or self.fail_fast
 
+        result = []
+        invalid = False
+        try:
+            for item in collection:
+                if invalid:
+                    self._schema.filter(model=item, context=context)
+                    continue
 
+                item_result = self._schema.process(
+                    model=item,
+                    context=context,
+                    fail_fast=fail_fast or None,
+                    fused=True
+                )
+                result.append(item_result)
+                invalid = fail_fast and not item_result
+        except TypeError:
+            pass
 
+        return result
 
+    async def avalidate_with_schema(
+        self,
+        collection=None,
+        context=None,
+        fail_fast=False
+    ):
+        """
+        Asynchronously validate each item in collection with our schema.
+        Items are validated concurrently, unless in fail fast mode, when
+        validation stops on first invalid item.
+        """
+        if self._schema is None or not collection:
+            return
+
+        context = context if self.use_context else None
+        fail_fast = fail_fast or self.fail_fast
+
+        try:
+            items = list(collection)
+        except TypeError:
+            return []
+
+        if not fail_fast:
+            import asyncio
+            return list(await asyncio.gather(*(
+                self._schema.avalidate(model=item, context=context)
+                for item in items
+            )))
+
+        result = []
+        for item in items:
+            item_result = await self._schema.avalidate(
+                model=item,
+                context=context,
+                fail_fast=True
+            )
+            result.append(item_result)
+            if not item_result:
+                break
+
+        return result
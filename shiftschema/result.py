@@ -1,8 +1,12 @@
+import json
 from pprint import pformat
-from copy import deepcopy
 from shiftschema import exceptions as x
 
 
+# maximum number of memoized messages per translator
+MESSAGES_MEMO_SIZE = 10000
+
+
 class Error:
     """
     Error
@@ -31,6 +35,10 @@ class Error:
         return r.format(self.__class__.__qualname__, self.message)
 
 
+# shared error object returned by validators on success, don't modify
+VALID = Error()
+
+
 class Result:
     """
     Result
@@ -38,14 +46,28 @@ class Result:
     their errors but can also contain nested results for nested schemas.
     """
     def __init__(self, errors=None, translator=None, locale='en'):
-        if not errors:
-            errors = dict()
-        self.errors = errors
+        self._errors = errors or None
         self.translator = translator
         self.locale = locale
 
+    @property
+    def errors(self):
+        """
+        Errors
+        Errors dictionary is only created when first error gets added or
+        when it is accessed, so that valid results don't allocate one.
+        :return: dict
+        """
+        if self._errors is None:
+            self._errors = dict()
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
+
     def __bool__(self):
-        return not self.errors
+        return not self._errors
 
     def __eq__(self, other):
         return self.__bool__() == other
@@ -54,7 +76,7 @@ class Result:
         return self.__bool__() != other
 
     def __repr__(self):
-        return '<Result errors=[' + pformat(self.errors) + ']>'
+        return '<Result errors=[' + pformat(self._errors or {}) + ']>'
 
     def add_state_errors(self, errors):
         """
@@ -66,8 +88,6 @@ class Result:
         :param errors: list or Error, list of entity state validation errors
         :return: shiftschema.result.Result
         """
-        if not self.errors:
-            self.errors = dict()
         if '__state__' not in self.errors:
             self.errors['__state__'] = []
 
@@ -205,17 +225,10 @@ class Result:
             if 'collection' not in self.errors[property_name]:
                 self.errors[property_name]['collection'] = errors_dict
             else:
-                local = self.errors[property_name]['collection']
-                remote = errors_dict
-                for index, result in remote.items():
-                    if index not in local:
-                        self.errors[property_name]['collection'][index] = result
-                    else:
-                        merged = self.merge_errors(
-                            local[index].errors,
-                            remote[index].errors
-                        )
-                        self.errors[property_name]['collection'][index] = merged
+                self.merge_collection_errors(
+                    self.errors[property_name]['collection'],
+                    errors_dict
+                )
 
         return self
 
@@ -223,34 +236,44 @@ class Result:
         """
         Merge errors
         Recursively traverses error graph to merge remote errors into local
-        errors to return a new joined graph.
+        errors to return a new joined graph. Visits every remote error once
+        and copies remote branches missing locally, so merging is linear in
+        the number of remote errors and never changes remote result later.
 
         :param errors_local: dict, local errors, will be updated
         :param errors_remote: dict, remote errors, provides updates
         :return: dict
         """
-        for prop in errors_remote:
+        for prop, remote in errors_remote.items():
 
             # create if doesn't exist
-            if prop not in errors_local:
-                errors_local[prop] = errors_remote[prop]
+            local = errors_local.get(prop)
+            if local is None:
+                errors_local[prop] = self.copy_branch(remote)
                 continue
 
-            local = errors_local[prop]
-            local = local.errors if isinstance(local, Result) else local
-            remote = errors_remote[prop]
-            remote = remote.errors if isinstance(remote, Result) else remote
+            if isinstance(local, Result):
+                local = errors_local[prop] = local.errors
+            if isinstance(remote, Result):
+                remote = remote.errors
+            if local is remote:
+                continue  # branch was merged before
 
             # check compatibility
-            if not isinstance(local, type(remote)):
+            if type(local) is not type(remote):
                 msg = 'Type mismatch on property [{}] when merging errors. '
                 msg += 'Unable to merge [{}] into [{}]'
                 raise x.UnableToMergeResultsType(msg.format(
                     prop,
-                    type(errors_remote[prop]),
-                    type(self.errors[prop])
+                    type(remote),
+                    type(local)
                 ))
 
+            # merge simple & state
+            if type(remote) is list:
+                local.extend(remote)
+                continue
+
             mismatch = 'Unable to merge nested entity errors with nested '
             mismatch += 'collection errors on property [{}]'
             if 'schema' in local and 'collection' in remote:
@@ -258,37 +281,137 @@ class Result:
             if 'collection' in local and 'schema' in remote:
                 raise x.UnableToMergeResultsType(mismatch.format(prop))
 
-            # merge simple & state
-            if type(remote) is list:
-                errors_local[prop].extend(remote)
-                continue
-
             # merge direct errors on nested entities and collection
-            if 'direct' in remote and 'direct' in local:
-                errors_local[prop]['direct'].extend(remote['direct'])
+            if 'direct' in remote:
+                if 'direct' in local:
+                    local['direct'].extend(remote['direct'])
+                else:
+                    local['direct'] = list(remote['direct'])
 
             # merge nested schema errors
-            if 'schema' in remote and 'schema' in local:
-                errors_local[prop]['schema'] = self.merge_errors(
-                    errors_local[prop]['schema'],
-                    remote['schema']
-                )
+            if 'schema' in remote:
+                if 'schema' in local:
+                    local['schema'] = self.merge_errors(
+                        local['schema'],
+                        remote['schema']
+                    )
+                else:
+                    local['schema'] = self.copy_errors(remote['schema'])
 
             # merge nested collections errors
-            if 'collection' in remote and 'collection' in local:
-                for index, result in remote['collection'].items():
-                    if index not in local['collection']:
-                        errors_local[prop]['collection'][index] = result
-                    else:
-                        merged = self.merge_errors(
-                            errors_local[prop]['collection'][index].errors,
-                            errors_remote[prop]['collection'][index].errors,
-                        )
-                        errors_local[prop]['collection'][index] = merged
+            if 'collection' in remote:
+                if 'collection' in local:
+                    self.merge_collection_errors(
+                        local['collection'],
+                        remote['collection']
+                    )
+                else:
+                    local['collection'] = self.copy_collection(
+                        remote['collection']
+                    )
 
         # and return
         return errors_local
 
+    def merge_collection_errors(self, collection_local, collection_remote):
+        """
+        Merge collection errors
+        Merges remote collection items errors into local collection errors
+        by item index. Items can be results or their errors dictionaries.
+        Items missing locally are copied keeping their type, while merged
+        items become errors dictionaries.
+
+        :param collection_local: dict, local items errors, will be updated
+        :param collection_remote: dict, remote items errors
+        :return: dict
+        """
+        for index, remote in collection_remote.items():
+            local = collection_local.get(index)
+            if local is None:
+                collection_local[index] = self.copy_item(remote)
+                continue
+
+            if isinstance(local, Result):
+                local = local.errors
+            if isinstance(remote, Result):
+                remote = remote.errors
+            if local is not remote:
+                collection_local[index] = self.merge_errors(local, remote)
+
+        return collection_local
+
+    def copy_errors(self, errors):
+        """
+        Copy errors
+        Copies errors graph, so that it can be merged into another result
+        without sharing its dictionaries and lists. Errors are not copied.
+
+        :param errors: dict, errors graph
+        :return: dict
+        """
+        return {
+            prop: self.copy_branch(branch)
+            for prop, branch in errors.items()
+        }
+
+    def copy_branch(self, branch):
+        """
+        Copy branch
+        Copies errors of a single property: a list of errors or a dictionary
+        of direct, nested schema and collection errors. Anything else is
+        returned as it is.
+
+        :param branch: list, dict or shiftschema.result.Result
+        :return: list, dict or branch
+        """
+        if isinstance(branch, Result):
+            branch = branch.errors
+        if type(branch) is list:
+            return list(branch)
+        if not isinstance(branch, dict):
+            return branch
+
+        copied = {}
+        if 'direct' in branch:
+            copied['direct'] = list(branch['direct'])
+        if 'schema' in branch:
+            copied['schema'] = self.copy_errors(branch['schema'])
+        if 'collection' in branch:
+            copied['collection'] = self.copy_collection(branch['collection'])
+        return copied
+
+    def copy_collection(self, collection):
+        """
+        Copy collection
+        Copies collection items errors, items can be results or their
+        errors dictionaries.
+
+        :param collection: dict, items errors by index
+        :return: dict
+        """
+        return {
+            index: self.copy_item(item)
+            for index, item in collection.items()
+        }
+
+    def copy_item(self, item):
+        """
+        Copy item
+        Copies errors of a single collection item. Results are copied into
+        new results with the same translator and locale, errors
+        dictionaries into new dictionaries.
+
+        :param item: shiftschema.result.Result or dict
+        :return: shiftschema.result.Result or dict
+        """
+        if isinstance(item, Result):
+            return Result(
+                self.copy_errors(item.errors),
+                item.translator,
+                item.locale
+            )
+        return self.copy_errors(item)
+
     def merge(self, another):
         """ Merges another validation result graph into itself"""
         if isinstance(another, Result):
@@ -296,58 +419,201 @@ class Result:
         self.errors = self.merge_errors(self.errors, another)
 
     def get_messages(self, locale=None):
-        """ Get a dictionary of translated messages """
+        """
+        Get messages
+        Builds a dictionary of translated and formatted messages mirroring
+        errors graph in a single pass. Messages are memoized per (locale,
+        message, kwargs) on translator, so that repeated errors, e.g. on
+        collection items, are translated and formatted once.
+
+        :param locale: str, locale to translate to, defaults to result's
+        :return: dict
+        """
+        translate, memo = self._get_translate(locale)
+        return self._translate_errors(self._errors or {}, translate, memo)
+
+    def iter_errors(self, locale=None, prefix=None):
+        """
+        Iterate errors
+        Lazily walks errors graph yielding flat (path, message, translated)
+        records, e.g. ('items.42.price', '%value_required%', 'Value...').
+        Direct errors of entities and collections are reported under their
+        own path and state errors under '__state__'.
+
+        :param locale: str, locale to translate to, defaults to result's
+        :param prefix: str, optional path prefix, e.g. row number
+        :return: generator of tuples
+        """
+        translate, memo = self._get_translate(locale)
+        prefix = prefix + '.' if prefix else ''
+        return self._iter_errors(self._errors or {}, prefix, translate, memo)
+
+    def write_json_lines(self, stream, locale=None, prefix=None):
+        """
+        Write json lines
+        Streams errors to a file-like object as json lines, one record with
+        path, message and translated keys per line.
+
+        :param stream: file-like object open for writing text
+        :param locale: str, locale to translate to, defaults to result's
+        :param prefix: str, optional path prefix, e.g. row number
+        :return: int, number of written lines
+        """
+        lines = 0
+        for path, message, translated in self.iter_errors(locale, prefix):
+            stream.write(json.dumps(dict(
+                path=path,
+                message=message,
+                translated=translated
+            )) + '\n')
+            lines += 1
+
+        return lines
+
+    def _iter_errors(self, errors, prefix, translate, memo):
+        """ Recursively yield flat error records from errors graph """
+        message = self._translate_error
+        for prop, prop_errors in errors.items():
+            path = prefix + str(prop)
+
+            # state and simple
+            if type(prop_errors) is list:
+                for error in prop_errors:
+                    translated = message(error, translate, memo)
+                    yield path, error.message, translated
+                continue
+
+            # entity and collection direct
+            for error in prop_errors.get('direct', ()):
+                translated = message(error, translate, memo)
+                yield path, error.message, translated
+
+            # entity schema
+            if 'schema' in prop_errors:
+                schema = prop_errors['schema']
+                if isinstance(schema, Result):
+                    schema = schema.errors
+                yield from self._iter_errors(
+                    schema,
+                    path + '.',
+                    translate,
+                    memo
+                )
+
+            # collection schema
+            if 'collection' in prop_errors:
+                for index, result in prop_errors['collection'].items():
+                    if isinstance(result, Result):
+                        result = result.errors
+                    yield from self._iter_errors(
+                        result,
+                        '{}.{}.'.format(path, index),
+                        translate,
+                        memo
+                    )
+
+    def _get_translate(self, locale=None):
+        """
+        Get translate
+        Returns translate callback for locale and a memo of translated
+        messages to use with it
+        """
         if locale is None:
             locale = self.locale
 
         if self.translator:
-            def translate(error):
-                return self.translator.translate(error, locale)
+            refresh = getattr(self.translator, 'refresh', None)
+            if refresh is not None:
+                refresh()
+
+            def translate(message):
+                return self.translator.translate(message, locale)
+            memo = self.translator.messages.get(locale)
+            if memo is None or len(memo) > MESSAGES_MEMO_SIZE:
+                memo = self.translator.messages[locale] = dict()
         else:
-            def translate(error):
-                return error
+            def translate(message):
+                return message
+            memo = dict()
 
-        errors = deepcopy(self.errors)
-        errors = self._translate_errors(errors, translate)
-        return errors
+        return translate, memo
 
-    def _translate_errors(self, errors, translate):
-        """ Recursively apply translate callback to each error message"""
-        for prop in errors:
-            prop_errors = errors[prop]
+    def _translate_errors(self, errors, translate, memo=None):
+        """ Recursively build translated copy of errors graph """
+        if memo is None:
+            memo = dict()
+
+        message = self._translate_error
+        translated = dict()
+        for prop, prop_errors in errors.items():
 
             # state and simple
             if type(prop_errors) is list:
-                for index, error in enumerate(prop_errors):
-                    message = translate(error.message)
-                    message = self.format_error(message, error.kwargs)
-                    errors[prop][index] = message
+                translated[prop] = [
+                    message(e, translate, memo) for e in prop_errors
+                ]
+                continue
+
+            nested = dict()
 
             # entity and collection direct
-            if type(prop_errors) is dict and 'direct' in prop_errors:
-                for index, error in enumerate(prop_errors['direct']):
-                    message = translate(error.message)
-                    message = self.format_error(message, error.kwargs)
-                    errors[prop]['direct'][index] = message
+            if 'direct' in prop_errors:
+                nested['direct'] = [
+                    message(e, translate, memo) for e in prop_errors['direct']
+                ]
 
             # entity schema
-            if type(prop_errors) is dict and 'schema' in prop_errors:
-                errors[prop]['schema'] = self._translate_errors(
-                    prop_errors['schema'],
-                    translate
+            if 'schema' in prop_errors:
+                schema = prop_errors['schema']
+                if isinstance(schema, Result):
+                    schema = schema.errors
+                nested['schema'] = self._translate_errors(
+                    schema,
+                    translate,
+                    memo
                 )
 
             # collection schema
-            if type(prop_errors) is dict and 'collection' in prop_errors:
-                translated = dict()
+            if 'collection' in prop_errors:
+                collection = dict()
                 for index, result in prop_errors['collection'].items():
-                    translated[index] = self._translate_errors(
-                        result.errors,
-                        translate
+                    if isinstance(result, Result):
+                        result = result.errors
+                    collection[index] = self._translate_errors(
+                        result,
+                        translate,
+                        memo
                     )
-                    errors[prop]['collection'] = translated
+                nested['collection'] = collection
+
+            translated[prop] = nested
 
-        return errors
+        return translated
+
+    def _translate_error(self, error, translate, memo):
+        """ Translate and format single error memoizing the message """
+        kwargs = error.kwargs
+        if kwargs is None:
+            key = error.message
+        elif type(kwargs) is dict:
+            key = (error.message, tuple(sorted(kwargs.items())))
+        elif type(kwargs) is list or type(kwargs) is tuple:
+            key = (error.message, tuple(kwargs))
+        else:
+            key = None  # scalar kwargs are not used for formatting
+
+        if key is not None:
+            try:
+                return memo[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None  # unhashable kwargs, e.g. lists of values
+
+        message = self.format_error(translate(error.message), kwargs)
+        if key is not None:
+            memo[key] = message
+        return message
 
     def format_error(self, error, args=None):
         """ Format error with positional or named arguments (if any) """
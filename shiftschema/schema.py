@@ -4,7 +4,19 @@ from shiftschema.property import CollectionProperty
 from shiftschema.result import Result
 from shiftschema.validators import AbstractValidator
 from shiftschema.exceptions import InvalidValidator, PropertyExists
+from shiftschema.exceptions import FrozenDefinition
 from shiftschema.translator import Translator
+from shiftschema.parallel import validate_parallel
+from shiftschema import instrumentation
+from shiftschema.codegen import get_generated, overrides_validation
+from shiftschema.accessors import getters, setters, get_getter, get_setter
+from shiftschema.validators.abstract_async_validator import run_validators
+from functools import partial
+import threading
+
+
+# guards building shared definitions of schema subclasses
+definitions_lock = threading.RLock()
 
 
 class Schema:
@@ -17,19 +29,180 @@ class Schema:
     locale = 'en'
     translator = Translator()
 
-    def __init__(self, locale=None, translator=None):
+    # stop validation on first error
+    fail_fast = False
+
+    # process models in a single pass
+    fused = False
+
+    # build definitions once per subclass and share them by all instances
+    shared = False
+
+    # validate with generated code
+    codegen = False
+
+    # shared definitions are copied before changing, frozen ones can't change
+    _shared = False
+    _frozen = False
+
+    # context manager to time filtering and validation
+    instrument = staticmethod(instrumentation.instrument)
+
+    def __init_subclass__(cls, **kwargs):
+        """ Every subclass shares definitions of its own """
+        super().__init_subclass__(**kwargs)
+        cls._definitions = None
+
+    def __init__(
+        self,
+        locale=None,
+        translator=None,
+        fail_fast=None,
+        fused=None
+    ):
         self.state = []
         self.properties = {}
         self.entities = {}
         self.collections = {}
+        self._plan = None
 
         if locale:
             self.locale = locale
         if translator:
             self.translator = translator
+        if fail_fast is not None:
+            self.fail_fast = bool(fail_fast)
+        if fused is not None:
+            self.fused = bool(fused)
 
         # or by subclassing
-        self.schema()
+        if self.shared:
+            self.share_definitions()
+        else:
+            self.schema()
+
+    def __getstate__(self):
+        """ Generated code can't be pickled: drop it """
+        state = self.__dict__.copy()
+        state.pop('_generated', None)
+        return state
+
+    def share_definitions(self):
+        """
+        Share definitions
+        Uses definitions shared by all instances of schema class, building
+        them on first use by calling schema() once, compiling and freezing
+        them. Properties and nested schemas of shared definitions can't be
+        changed, while adding properties or state validators to an instance
+        gives it its own copy of definitions. Schema must then be configured
+        in schema() the same way for every instance.
+
+        :return: None
+        """
+        cls = type(self)
+        definitions = cls.__dict__.get('_definitions')
+        if definitions is None:
+            with definitions_lock:
+                definitions = cls.__dict__.get('_definitions')
+                if definitions is None:
+                    self.schema()
+                    plan = self.compile()
+                    for properties in plan[1:]:
+                        for _, prop in properties:
+                            prop.freeze()
+                    definitions = (
+                        self.state,
+                        self.properties,
+                        self.entities,
+                        self.collections,
+                        plan
+                    )
+                    cls._definitions = definitions
+
+        self.state = definitions[0]
+        self.properties = definitions[1]
+        self.entities = definitions[2]
+        self.collections = definitions[3]
+        self._plan = definitions[4]
+        self._shared = True
+
+    def adopt_definitions(self):
+        """
+        Adopt definitions
+        Makes definitions of a shared schema loaded from cache file the
+        definitions shared by all instances of its class, or switches it to
+        definitions already shared by them.
+
+        :return: None
+        """
+        cls = type(self)
+        with definitions_lock:
+            definitions = cls.__dict__.get('_definitions')
+            if definitions is None:
+                plan = self._plan or self.compile()
+                definitions = (
+                    self.state,
+                    self.properties,
+                    self.entities,
+                    self.collections,
+                    plan
+                )
+                cls._definitions = definitions
+
+        self.state = definitions[0]
+        self.properties = definitions[1]
+        self.entities = definitions[2]
+        self.collections = definitions[3]
+        self._plan = definitions[4]
+
+    @classmethod
+    def cached(cls, path):
+        """
+        Cached
+        Loads compiled schema from cache file or creates and compiles a new
+        one and saves it to cache file, e.g. to speed up startup of short
+        lived workers. Cache is rebuilt whenever library version or source
+        and translation files of the schema change.
+
+        :param path: str, path to cache file
+        :return: shiftschema.schema.Schema
+        """
+        from shiftschema import persistence
+        return persistence.cached(path, cls)
+
+    def freeze(self):
+        """
+        Freeze
+        Compiles schema and prevents changing it along with its properties
+        and nested schemas, so that it can be shared.
+        :return: None
+        """
+        if self._frozen:
+            return
+
+        self._frozen = True
+        plan = self._plan or self.compile()
+        for properties in plan[1:]:
+            for _, prop in properties:
+                prop.freeze()
+
+    def own_definitions(self):
+        """
+        Own definitions
+        Copies shared definitions before schema gets changed. Raises if
+        schema is frozen.
+        :return: None
+        """
+        if self._frozen:
+            err = 'Schema is frozen and shared, can not change it'
+            raise FrozenDefinition(err)
+
+        if self._shared:
+            self.state = list(self.state)
+            self.properties = dict(self.properties)
+            self.entities = dict(self.entities)
+            self.collections = dict(self.collections)
+            self._shared = False
 
     def schema(self):
         """
@@ -59,7 +232,9 @@ class Schema:
         :param property_name: name to get
         :return: obj, property
         """
-        if property_name in self.properties:
+        if property_name.startswith('__'):
+            return object.__getattribute__(self, property_name)
+        elif property_name in self.properties:
             return self.properties[property_name]
         elif property_name in self.entities:
             return self.entities[property_name]
@@ -79,103 +254,394 @@ class Schema:
             raise InvalidValidator(err.format(validator, AbstractValidator))
 
         if validator not in self.state:
+            self.own_definitions()
             self.state.append(validator)
+            self._plan = None
 
-    def add_property(self, property_name, use_context=True):
+    def add_property(self, property_name, use_context=True, fail_fast=False):
         """
         Add simple property to schema
         :param property_name: str, property name
         :param use_context: bool, whether custom context should be used
+        :param fail_fast: bool, stop property validation on first error
         :return: shiftschema.property.SimpleProperty
         """
         if self.has_property(property_name):
             err = 'Property "{}" already exists'
             raise PropertyExists(err.format(property_name))
 
-        prop = SimpleProperty(use_context=bool(use_context))
+        prop = SimpleProperty(
+            use_context=bool(use_context),
+            fail_fast=bool(fail_fast)
+        )
+        self.own_definitions()
         self.properties[property_name] = prop
+        self._plan = None
         return prop
 
-    def add_entity(self, property_name, use_context=True):
+    def add_entity(self, property_name, use_context=True, fail_fast=False):
         """
         Add entity property to schema
         :param property_name: str, property name
         :param use_context: bool, whether custom context should be used
+        :param fail_fast: bool, stop property validation on first error
         :return: shiftschema.property.EntityProperty
         """
         if self.has_property(property_name):
             err = 'Property "{}" already exists'
             raise PropertyExists(err.format(property_name))
-        prop = EntityProperty(use_context=bool(use_context))
+        prop = EntityProperty(
+            use_context=bool(use_context),
+            fail_fast=bool(fail_fast)
+        )
+        self.own_definitions()
         self.entities[property_name] = prop
+        self._plan = None
         return prop
 
-    def add_collection(self, property_name, use_context=True):
+    def add_collection(
+        self,
+        property_name,
+        use_context=True,
+        fail_fast=False,
+        executor=None,
+        chunk_size=1000
+    ):
         """
         Add collection property to schema
         :param property_name: str, property name
-        :param property_name: str, property name
+        :param use_context: bool, whether custom context should be used
+        :param fail_fast: bool, stop on first invalid collection item
+        :param executor: concurrent.futures.Executor to validate items with
+        :param chunk_size: int, number of items validated per executor task
         :return: shiftschema.property.CollectionProperty
         """
         if self.has_property(property_name):
             err = 'Property "{}" already exists'
             raise PropertyExists(err.format(property_name))
 
-        prop = CollectionProperty(use_context=bool(use_context))
+        prop = CollectionProperty(
+            use_context=bool(use_context),
+            fail_fast=bool(fail_fast),
+            executor=executor,
+            chunk_size=chunk_size
+        )
+        self.own_definitions()
         self.collections[property_name] = prop
+        self._plan = None
         return prop
 
+    def compile(self):
+        """
+        Compile schema
+        Flattens state validators and properties into a precomputed execution
+        plan of (property name, property) pairs with compiled filter and
+        validator chains that filtering and validation iterate instead of
+        walking property dictionaries. Runs lazily on first use and is reset
+        when schema gets changed via its api. Call it again if you modify
+        properties dictionaries directly.
+
+        :return: tuple, (state, properties, entities, collections)
+        """
+        plan = (
+            tuple(self.state),
+            tuple(self.properties.items()),
+            tuple(self.entities.items()),
+            tuple(self.collections.items()),
+        )
+
+        self._plan = plan
+        for properties in plan[1:]:
+            for property_name, prop in properties:
+                prop.compile()
+                nested = getattr(prop, 'schema', None)
+                if nested is not None and nested._plan is None:
+                    nested.compile()
+
+        return plan
+
+    def _stage_plan(self):
+        """ Get compiled plan, timed by active instrument if any """
+        plan = self._plan or self.compile()
+        instrument = instrumentation.active.get()
+        if instrument is not None:
+            plan = instrument.plan(self, plan)
+        return plan
+
     def get(self, model, property_name):
         """
-        Get property from model. Use getter if possible.
+        Get property from model. Use getter if possible. Accessors for
+        object models are resolved once per model class and property.
         :param model: model or dict
         :param property_name: str, name on the model
         :return: mixed
         """
-        if type(model) is dict:
-            if property_name not in model:
-                return None
-            else:
-                return model[property_name]
-        elif hasattr(model, 'get_' + property_name):
-            getter = getattr(model, 'get_' + property_name)
-            return getter()
-        else:
-            try:
-                return getattr(model, property_name)
-            except AttributeError:
-                return None
+        cls = type(model)
+        if cls is dict:
+            return model.get(property_name)
+
+        getter = getters.get((cls, property_name))
+        if getter is None:
+            getter = get_getter(cls, property_name)
+        return getter(model)
 
     def set(self, model, property_name, value):
         """
-        Set model property to value. Use setter if possible.
+        Set model property to value. Use setter if possible. Accessors for
+        object models are resolved once per model class and property.
         :param model: model object or dict
         :param property_name: str, name on the model
         :param value: mixed, a value to set
         :return: None
         """
-        if type(model) is dict:
+        cls = type(model)
+        if cls is dict:
             model[property_name] = value
-        elif hasattr(model, 'set_' + property_name):
-            setter = getattr(model, 'set_' + property_name)
-            setter(value)
-        else:
-            try:
-                setattr(model, property_name, value)
-            except AttributeError:
-                pass
+            return
+
+        setter = setters.get((cls, property_name))
+        if setter is None:
+            setter = get_setter(cls, property_name)
+        setter(model, value)
 
-    def process(self, model=None, context=None):
+    def process(self, model=None, context=None, fail_fast=None, fused=None):
         """
         Perform validation and filtering at the same time, return a
         validation result object.
 
+        In fused mode model is traversed once: every property is read,
+        filtered, written back if changed and validated right away, and
+        nested entities and collection items are processed the same way.
+        Property validators then see other properties of the model that
+        come after them in the schema unfiltered. State validators run last
+        to see the whole model filtered. In fail fast mode the rest of the
+        model still gets filtered after first error.
+
         :param model: object or dict
         :param context: object, dict or None
+        :param fail_fast: bool, stop on first error (defaults to schema's)
+        :param fused: bool, process in a single pass (defaults to schema's)
         :return: shiftschema.result.Result
         """
-        self.filter(model, context)
-        return self.validate(model, context)
+        if fused is None:
+            fused = self.fused
+        if not fused or model is None:
+            self.filter(model, context)
+            return self.validate(model, context, fail_fast=fail_fast)
+
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+
+        plan = self._plan or self.compile()
+        result = Result(translator=self.translator, locale=self.locale)
+        stages = (
+            (plan[1], self.process_properties),
+            (plan[2], self.process_entities),
+            (plan[3], self.process_collections),
+        )
+        for properties, stage in stages:
+            if properties:
+                stage(
+                    model,
+                    context=context,
+                    result=result,
+                    fail_fast=fail_fast
+                )
+        if not plan[0]:
+            return result
+
+        # state errors come first, as they do when validating
+        state = Result(translator=self.translator, locale=self.locale)
+        self.validate_state(
+            model,
+            context=context,
+            result=state,
+            fail_fast=fail_fast
+        )
+        if state:
+            return result
+        if not fail_fast:
+            state.errors.update(result.errors)
+        return state
+
+    def process_properties(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
+        """
+        Process simple properties
+        Filters and validates simple properties in a single pass. Once
+        result is invalid in fail fast mode, properties are only filtered.
+        :param model:  object or dict
+        :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
+        :return: shiftschema.result.Result
+        """
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[1]:
+            value = self.get(model, property_name)
+            if value is not None:
+                filtered_value = prop.filter(
+                    value=value,
+                    model=model,
+                    context=context
+                )
+                if filtered_value is not value:  # unless changed!
+                    self.set(model, property_name, filtered_value)
+                    value = self.get(model, property_name)
+
+            if fail_fast and not result:
+                continue
+
+            errors = prop.get_errors(
+                value=value,
+                model=model,
+                context=context,
+                fail_fast=fail_fast
+            )
+            if errors:
+                result.add_errors(
+                    errors=errors,
+                    property_name=property_name
+                )
+
+        return result
+
+    def process_entities(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
+        """
+        Process entity properties
+        Filters and validates entity properties in a single pass, processing
+        nested entities with their schemas. Once result is invalid in fail
+        fast mode, entities are only filtered.
+        :param model:  object or dict
+        :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
+        :return: shiftschema.result.Result
+        """
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[2]:
+            value = self.get(model, property_name)
+            filtered_value = prop.filter(
+                value=value,
+                model=model,
+                context=context
+            )
+            if filtered_value is not value:  # unless changed!
+                self.set(model, property_name, filtered_value)
+                value = self.get(model, property_name)
+
+            if fail_fast and not result:
+                prop.filter_with_schema(model=value, context=context)
+                continue
+
+            errors = prop.get_errors(
+                value=value,
+                model=model,
+                context=context,
+                fail_fast=fail_fast
+            )
+            if errors:
+                result.add_entity_errors(
+                    property_name=property_name,
+                    direct_errors=errors
+                )
+                if fail_fast or prop.fail_fast:
+                    prop.filter_with_schema(model=value, context=context)
+                    continue
+
+            if value is None:
+                continue
+
+            schema_valid = prop.process_with_schema(
+                model=value,
+                context=context,
+                fail_fast=fail_fast
+            )
+            if schema_valid == False:
+                result.add_entity_errors(
+                    property_name,
+                    schema_errors=schema_valid.errors
+                )
+
+        return result
+
+    def process_collections(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
+        """
+        Process collection properties
+        Filters and validates collection properties in a single pass,
+        processing every item with collection schema. Once result is
+        invalid in fail fast mode, collections are only filtered.
+        :param model:  object or dict
+        :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
+        :return: shiftschema.result.Result
+        """
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[3]:
+            collection = self.get(model, property_name)
+            filtered_value = prop.filter(
+                value=collection,
+                model=model,
+                context=context
+            )
+            if filtered_value is not collection:  # unless changed!
+                self.set(model, property_name, filtered_value)
+                collection = self.get(model, property_name)
+
+            if fail_fast and not result:
+                prop.filter_with_schema(collection, context)
+                continue
+
+            errors = prop.get_errors(
+                value=collection,
+                model=model,
+                context=context,
+                fail_fast=fail_fast
+            )
+            if errors:
+                result.add_collection_errors(
+                    property_name=property_name,
+                    direct_errors=errors
+                )
+                if fail_fast or prop.fail_fast:
+                    prop.filter_with_schema(collection, context)
+                    continue
+
+            collection_errors = prop.process_with_schema(
+                collection=collection,
+                context=context,
+                fail_fast=fail_fast
+            )
+            result.add_collection_errors(
+                property_name=property_name,
+                collection_errors=collection_errors
+            )
+
+        return result
 
     def filter(self, model=None, context=None):
         """
@@ -199,7 +665,9 @@ class Schema:
     def filter_properties(self, model, context=None):
         """
         Filter simple properties
-        Runs filters on simple properties changing them in place.
+        Runs filters on simple properties changing them in place. Filters
+        report unchanged values by returning the same object, in which
+        case value is not written back to the model.
         :param model:  object or dict
         :param context: object, dict or None
         :return: None
@@ -207,8 +675,8 @@ class Schema:
         if model is None:
             return
 
-        for property_name in self.properties:
-            prop = self.properties[property_name]
+        plan = self._stage_plan()
+        for property_name, prop in plan[1]:
             value = self.get(model, property_name)
             if value is None:
                 continue
@@ -218,7 +686,7 @@ class Schema:
                 model=model,
                 context=context
             )
-            if value != filtered_value:  # unless changed!
+            if filtered_value is not value:  # unless changed!
                 self.set(model, property_name, filtered_value)
 
     def filter_entities(self, model, context=None):
@@ -232,8 +700,8 @@ class Schema:
         if model is None:
             return
 
-        for property_name in self.entities:
-            prop = self.entities[property_name]
+        plan = self._stage_plan()
+        for property_name, prop in plan[2]:
             value = self.get(model, property_name)
 
             filtered_value = prop.filter(
@@ -241,7 +709,7 @@ class Schema:
                 model=model,
                 context=context
             )
-            if value != filtered_value:  # unless changed!
+            if filtered_value is not value:  # unless changed!
                 self.set(model, property_name, filtered_value)
 
             prop.filter_with_schema(
@@ -260,61 +728,338 @@ class Schema:
         if model is None:
             return
 
-        for property_name in self.collections:
-            prop = self.collections[property_name]
+        plan = self._stage_plan()
+        for property_name, prop in plan[3]:
             collection = self.get(model, property_name)
             filtered_value = prop.filter(
                 value=collection,
                 model=model,
                 context=context
             )
-            self.set(model, property_name, filtered_value)
+            if filtered_value is not collection:  # unless changed!
+                self.set(model, property_name, filtered_value)
 
             prop.filter_with_schema(
                 collection,
                 context if prop.use_context else None
             )
 
-    def validate(self, model=None, context=None):
+    def validate(self, model=None, context=None, fail_fast=None):
         """
-        Validate model and return validation result object
+        Validate model and return validation result object. In fail fast
+        mode validation stops on first error.
+
         :param model:  object or dict
         :param context: object, dict or None
+        :param fail_fast: bool, stop on first error (defaults to schema's)
         :return: shiftschema.result.Result
         """
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+
+        # generated code does not fail fast, is not instrumented and
+        # does not bypass overridden validation methods
+        if self.codegen and not fail_fast:
+            instrument = instrumentation.active.get()
+            if instrument is None and not overrides_validation(self):
+                return get_generated(self)(self, model, context)
 
         # inject with settings
         result = Result(translator=self.translator, locale=self.locale)
 
-        # validate state
-        state_result = self.validate_state(model, context=context)
-        result.merge(state_result)
+        # validate state, properties, nested entities and collections
+        # writing errors into the same result
+        stages = (
+            self.validate_state,
+            self.validate_properties,
+            self.validate_entities,
+            self.validate_collections,
+        )
+        for stage in stages:
+            stage(model, context=context, result=result, fail_fast=fail_fast)
+            if fail_fast and not result:
+                break
 
-        # validate simple properties
-        props_result = self.validate_properties(model, context=context)
-        result.merge(props_result)
+        # and return
+        return result
 
-        # validate nested entity properties
-        entities_result = self.validate_entities(model, context=context)
-        result.merge(entities_result)
+    async def aprocess(self, model=None, context=None, fail_fast=None):
+        """
+        Perform filtering and asynchronous validation at the same time,
+        return a validation result object.
 
-        # validate collection properties
-        collections_result = self.validate_collections(model, context=context)
-        result.merge(collections_result)
+        :param model: object or dict
+        :param context: object, dict or None
+        :param fail_fast: bool, stop on first error (defaults to schema's)
+        :return: shiftschema.result.Result
+        """
+        self.filter(model, context)
+        return await self.avalidate(model, context, fail_fast=fail_fast)
+
+    async def avalidate(self, model=None, context=None, fail_fast=None):
+        """
+        Validate model asynchronously and return validation result object.
+        Sync validators run inline, while async validators, nested entities
+        and collection items are awaited concurrently. In fail fast mode
+        everything is validated one by one until first error.
+
+        :param model:  object or dict
+        :param context: object, dict or None
+        :param fail_fast: bool, stop on first error (defaults to schema's)
+        :return: shiftschema.result.Result
+        """
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+
+        result = Result(translator=self.translator, locale=self.locale)
+        plan = self._plan or self.compile()
+
+        # jobs writing into result when awaited
+        jobs = [partial(
+            self._avalidate_state,
+            plan[0],
+            model,
+            context,
+            result,
+            fail_fast
+        )]
+        kinds = (
+            (plan[1], self._avalidate_property),
+            (plan[2], self._avalidate_entity),
+            (plan[3], self._avalidate_collection),
+        )
+        for properties, job in kinds:
+            for property_name, prop in properties:
+                jobs.append(partial(
+                    job,
+                    property_name,
+                    prop,
+                    model,
+                    context,
+                    result,
+                    fail_fast
+                ))
+
+        if not fail_fast:
+            import asyncio
+            await asyncio.gather(*(job() for job in jobs))
+            return result
+
+        for job in jobs:
+            await job()
+            if not result:
+                break
 
-        # and return
         return result
 
-    def validate_state(self, model, context=None):
+    async def _avalidate_state(self, state, model, context, result, fail_fast):
+        """ Validate model state asynchronously """
+        errors = await run_validators(
+            state,
+            model,
+            model=model,
+            context=context,
+            fail_fast=fail_fast
+        )
+        if errors:
+            result.add_state_errors(errors)
+
+    async def _avalidate_property(
+        self,
+        property_name,
+        prop,
+        model,
+        context,
+        result,
+        fail_fast
+    ):
+        """ Validate simple property asynchronously """
+        errors = await prop.aget_errors(
+            value=self.get(model, property_name),
+            model=model,
+            context=context,
+            fail_fast=fail_fast
+        )
+        if errors:
+            result.add_errors(errors=errors, property_name=property_name)
+
+    async def _avalidate_entity(
+        self,
+        property_name,
+        prop,
+        model,
+        context,
+        result,
+        fail_fast
+    ):
+        """ Validate entity property asynchronously """
+        value = self.get(model, property_name)
+        errors = await prop.aget_errors(
+            value=value,
+            model=model,
+            context=context,
+            fail_fast=fail_fast
+        )
+        if errors:
+            result.add_entity_errors(
+                property_name=property_name,
+                direct_errors=errors
+            )
+            if fail_fast or prop.fail_fast:
+                return
+
+        if value is None:
+            return
+
+        schema_valid = await prop.avalidate_with_schema(
+            model=value,
+            context=context,
+            fail_fast=fail_fast
+        )
+        if schema_valid == False:
+            result.add_entity_errors(
+                property_name,
+                schema_errors=schema_valid.errors
+            )
+
+    async def _avalidate_collection(
+        self,
+        property_name,
+        prop,
+        model,
+        context,
+        result,
+        fail_fast
+    ):
+        """ Validate collection property asynchronously """
+        collection = self.get(model, property_name)
+        errors = await prop.aget_errors(
+            value=collection,
+            model=model,
+            context=context,
+            fail_fast=fail_fast
+        )
+        if errors:
+            result.add_collection_errors(
+                property_name=property_name,
+                direct_errors=errors
+            )
+            if fail_fast or prop.fail_fast:
+                return
+
+        collection_errors = await prop.avalidate_with_schema(
+            collection=collection,
+            context=context,
+            fail_fast=fail_fast
+        )
+        result.add_collection_errors(
+            property_name=property_name,
+            collection_errors=collection_errors
+        )
+
+    def validate_many(
+        self,
+        models,
+        context=None,
+        invalid_only=False,
+        fail_fast=None,
+        executor=None,
+        chunk_size=1000
+    ):
+        """
+        Validate many
+        Lazily validates an iterable of models yielding a result object for
+        each one. With invalid_only flag yields (index, result) pairs only
+        for models that failed validation, which makes a compact per-index
+        error map when collected into a dict. Optionally accepts a
+        concurrent.futures executor to validate models in parallel chunks.
+
+        :param models: iterable of objects or dicts
+        :param context: object, dict or None
+        :param invalid_only: bool, only yield errors for invalid models
+        :param fail_fast: bool, stop on first error (defaults to schema's)
+        :param executor: concurrent.futures.Executor or None
+        :param chunk_size: int, number of models validated per executor task
+        :return: generator
+        """
+        if executor is None:
+            results = (
+                self.validate(model, context=context, fail_fast=fail_fast)
+                for model in models
+            )
+        else:
+            results = validate_parallel(
+                executor,
+                self,
+                models,
+                context=context,
+                fail_fast=fail_fast,
+                chunk_size=chunk_size
+            )
+
+        return self._many(results, invalid_only)
+
+    def process_many(
+        self,
+        models,
+        context=None,
+        invalid_only=False,
+        fail_fast=None,
+        fused=None
+    ):
+        """
+        Process many
+        Lazily filters and validates an iterable of models in place yielding
+        a result object for each one. Accepts the same options as
+        validate_many(), except for executor, since filtering changes
+        models in place.
+
+        :param models: iterable of objects or dicts
+        :param context: object, dict or None
+        :param invalid_only: bool, only yield errors for invalid models
+        :param fail_fast: bool, stop on first error (defaults to schema's)
+        :param fused: bool, process in a single pass (defaults to schema's)
+        :return: generator
+        """
+        results = (
+            self.process(
+                model,
+                context=context,
+                fail_fast=fail_fast,
+                fused=fused
+            )
+            for model in models
+        )
+        return self._many(results, invalid_only)
+
+    def _many(self, results, invalid_only):
+        """ Yield all results or (index, result) pairs for invalid ones """
+        for index, result in enumerate(results):
+            if not invalid_only:
+                yield result
+            elif not result:
+                yield index, result
+
+    def validate_state(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
         """
         Validate model state
         Run state validators and return and result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
         :return: shiftschema.result.Result
         """
-        result = Result()
-        for state_validator in self.state:
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for state_validator in plan[0]:
             error = state_validator.run(
                 value=model,
                 model=model,
@@ -322,25 +1067,37 @@ class Schema:
             )
             if error:
                 result.add_state_errors(error)
+                if fail_fast:
+                    break
 
         return result
 
-    def validate_properties(self, model, context=None):
+    def validate_properties(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
         """
         Validate simple properties
         Performs validation on simple properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
         :return: shiftschema.result.Result
         """
-        result = Result()
-        for property_name in self.properties:
-            prop = self.properties[property_name]
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[1]:
             value = self.get(model, property_name)
-            errors = prop.validate(
+            errors = prop.get_errors(
                 value=value,
                 model=model,
-                context=context
+                context=context,
+                fail_fast=fail_fast
             )
 
             if errors:
@@ -348,81 +1105,117 @@ class Schema:
                     errors=errors,
                     property_name=property_name
                 )
+                if fail_fast:
+                    break
 
         return result
 
-    def validate_entities(self, model, context=None):
+    def validate_entities(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
         """
         Validate entity properties
         Performs validation on entity properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
         :return: shiftschema.result.Result
         """
-        result = Result()
-        for property_name in self.entities:
-            prop = self.entities[property_name]
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[2]:
             value = self.get(model, property_name)
 
-            errors = prop.validate(
+            errors = prop.get_errors(
                 value=value,
                 model=model,
-                context=context
+                context=context,
+                fail_fast=fail_fast
             )
-            if len(errors):
+            if errors:
                 result.add_entity_errors(
                     property_name=property_name,
                     direct_errors=errors
                 )
+                if fail_fast:
+                    break
+                if prop.fail_fast:
+                    continue
 
             if value is None:
                 continue
 
             schema_valid = prop.validate_with_schema(
                 model=value,
-                context=context
+                context=context,
+                fail_fast=fail_fast
             )
             if schema_valid == False:
                 result.add_entity_errors(
                     property_name,
                     schema_errors=schema_valid.errors
                 )
+                if fail_fast:
+                    break
 
         return result
 
-    def validate_collections(self, model, context=None):
+    def validate_collections(
+        self,
+        model,
+        context=None,
+        result=None,
+        fail_fast=False
+    ):
         """
         Validate collection properties
         Performs validation on collection properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param result: shiftschema.result.Result, result to write errors to
+        :param fail_fast: bool, stop on first error
         :return: shiftschema.result.Result
         """
-        result = Result()
-        for property_name in self.collections:
-            prop = self.collections[property_name]
+        plan = self._stage_plan()
+        if result is None:
+            result = Result()
+        for property_name, prop in plan[3]:
             collection = self.get(model, property_name)
 
-            errors = prop.validate(
+            errors = prop.get_errors(
                 value=collection,
                 model=model,
-                context=context
+                context=context,
+                fail_fast=fail_fast
             )
-            if len(errors):
+            if errors:
                 result.add_collection_errors(
                     property_name=property_name,
                     direct_errors=errors
                 )
+                if fail_fast:
+                    break
+                if prop.fail_fast:
+                    continue
 
             collection_errors = prop.validate_with_schema(
                 collection=collection,
-                context=context
+                context=context,
+                fail_fast=fail_fast
             )
 
             result.add_collection_errors(
                 property_name=property_name,
                 collection_errors=collection_errors
             )
+            if fail_fast and not result:
+                break
 
         return result
 
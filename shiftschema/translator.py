@@ -1,8 +1,64 @@
 import os
-from importlib.machinery import SourceFileLoader
+import re
+import json
+import threading
+from importlib.util import spec_from_file_location, module_from_spec
 from shiftschema.exceptions import NoTranslations
 
 
+# process-wide caches of merged dictionaries per (locale, locations) and
+# of dictionaries loaded from each file, shared by all translators
+cache = {}
+files = {}
+lock = threading.RLock()
+
+# bumped when caches get cleared, so that translators drop dictionaries
+# and translated messages they hold
+generation = 0
+
+language_code = re.compile(r'^[a-z]+')
+
+
+def load_file(file):
+    """
+    Load file
+    Loads translations dictionary from json file or python module having
+    translations dictionary. Every file is loaded once per process.
+
+    :param file:            str, path to file
+    :return:                dict or None
+    """
+    if file in files:
+        return files[file]
+
+    if file.endswith('.json'):
+        with open(file, encoding='utf-8') as handle:
+            translations = json.load(handle)
+    else:
+        name = 'shiftschema_translations_' + str(len(files))
+        spec = spec_from_file_location(name, file)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        translations = getattr(module, 'translations', None)
+
+    files[file] = translations
+    return translations
+
+
+def clear_cache():
+    """
+    Clear cache
+    Forgets loaded translations, e.g. after translation files change,
+    including dictionaries and messages held by existing translators
+    :return:                None
+    """
+    global generation
+    with lock:
+        cache.clear()
+        files.clear()
+        generation += 1
+
+
 class Translator:
     """
     Translator
@@ -18,6 +74,10 @@ class Translator:
         self.dirs = [os.path.join(dir, 'translations')]
         self.translations = {}
 
+        # translated and formatted messages memoized by results
+        self.messages = {}
+        self.generation = generation
+
     @staticmethod
     def normalize_locale(locale):
         """
@@ -28,23 +88,37 @@ class Translator:
         :param locale:          string, locale (en, en_US)
         :return:                string, language code
         """
-        import re
-        match = re.match(r'^[a-z]+', locale.lower())
+        match = language_code.match(locale.lower())
         if match:
             return match.group()
 
 
+    def refresh(self):
+        """
+        Refresh
+        Drops dictionaries and translated messages held by translator if
+        caches were cleared since they got loaded.
+
+        :return:                None
+        """
+        if self.generation != generation:
+            self.translations = {}
+            self.messages = {}
+            self.generation = generation
+
     def add_location(self, dir):
         """
         Add location
         Adds location of locale dictionaries. Must be an existing directory as
         it will be later scanned for locale dictionaries. Adding a new
-        location removes previously loaded translations.
+        location makes translator switch to translations cached for the new
+        set of locations.
 
         :param dir:             str, path to dir with translations
         :return:                None
         """
         self.translations = {}
+        self.messages = {}
         self.dirs.append(dir)
 
 
@@ -52,43 +126,65 @@ class Translator:
         """
         Get translation dictionary
         Returns a dictionary for locale or raises an exception if such can't
-        be located. If a dictionary for locale was previously loaded returns
-        that, otherwise goes through registered locations and merges any
-        found custom dictionaries with defaults.
+        be located. If a dictionary for locale was previously loaded by any
+        translator with the same locations returns that, otherwise goes
+        through registered locations and merges any found dictionaries
+        with defaults. Locations can have python modules ({locale}.py)
+        with translations dictionary or json files ({locale}.json).
 
         :param locale:          str, locale to load translations
         :return:                dict, translations dictionary
         """
+        if self.generation != generation:
+            self.refresh()
+
+        translations = self.translations.get(locale)
+        if translations is not None:
+            return translations
+
+        requested = locale
         locale = self.normalize_locale(locale)
         if locale in self.translations:
             return self.translations[locale]
 
-        translations = {}
-        for path in self.dirs:
-            file = os.path.join(path, '{}.py'.format(locale))
-            if not os.path.isfile(file):
-                continue
-
-            loader = SourceFileLoader(locale, file)
-            locale_dict = loader.load_module()
-            if not hasattr(locale_dict, 'translations'):
-                continue
-
-            language = getattr(locale_dict, 'translations')
-            if translations:
-                translations = language
-            else:
-                merged = dict(translations.items() | language.items())
-                translations = merged
+        key = (locale, tuple(self.dirs))
+        translations = cache.get(key)
+        if translations is None:
+            with lock:
+                translations = cache.get(key)
+                if translations is None:
+                    translations = self.load_translations(locale)
+                    cache[key] = translations
 
         if translations:
             self.translations[locale] = translations
+            self.translations[requested] = translations
             return translations
 
         err = 'No translations found for locale [{}]'
         raise NoTranslations(err.format(locale))
 
+    def load_translations(self, locale):
+        """
+        Load translations
+        Loads and merges dictionaries for locale from all locations, so that
+        dictionaries from locations added later override earlier ones.
+
+        :param locale:          str, normalized locale
+        :return:                dict, translations dictionary (can be empty)
+        """
+        translations = {}
+        for path in self.dirs:
+            for extension in ('py', 'json'):
+                file = os.path.join(path, '{}.{}'.format(locale, extension))
+                if not os.path.isfile(file):
+                    continue
+
+                language = load_file(file)
+                if language:
+                    translations.update(language)
 
+        return translations
 
     def translate(self, message, locale):
         """
@@ -101,8 +197,4 @@ class Translator:
         :return:                str, translated (if possible)
         """
         translations = self.get_translations(locale)
-        if message in translations:
-            return translations[message]
-
-        # return untranslated
-        return message
+        return translations.get(message, message)
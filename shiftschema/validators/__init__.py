@@ -1,4 +1,8 @@
+from importlib import import_module
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.abstract_async_validator import (
+    AbstractAsyncValidator
+)
 from shiftschema.validators.choice import Choice
 from shiftschema.validators.multichoice import MultiChoice
 from shiftschema.validators.digits import Digits
@@ -7,9 +11,37 @@ from shiftschema.validators.email import Email
 from shiftschema.validators.required import Required
 from shiftschema.validators.not_empty import NotEmpty
 from shiftschema.validators.url import Url
-from shiftschema.validators.ip import Ip
+from shiftschema.validators.cached import Cached
 
 
+# validators depending on heavy modules get imported on first access, so
+# that importing schemas does not pay for them unless they are used
+lazy = dict(
+    Ip='shiftschema.validators.ip',
+)
+
+
+def __getattr__(name):
+    """
+    Get attribute
+    Imports lazy validators on first access (PEP 562).
+
+    :param name: str, attribute name
+    :return: validator class
+    """
+    module = lazy.get(name)
+    if module is None:
+        err = 'module {!r} has no attribute {!r}'
+        raise AttributeError(err.format(__name__, name))
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy))
+
 
 
 # todo: implement these validators:
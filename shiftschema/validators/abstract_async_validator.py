@@ -0,0 +1,116 @@
+from abc import abstractmethod
+from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.result import Error, VALID
+from shiftschema.exceptions import InvalidErrorType
+from shiftschema.exceptions import AsyncValidationRequired
+
+
+class AbstractAsyncValidator(AbstractValidator):
+    """
+    Abstract async validator
+    Provides a base for validators that need to await something, e.g. check
+    uniqueness against a database. These can be added to properties just
+    like regular validators, but schema must then be validated with
+    avalidate() or aprocess().
+    """
+
+    @abstractmethod
+    async def validate(self, value, model=None, context=None):
+        """
+        Validate
+        Abstract validation coroutine: implement this in your concrete
+        validators. Performs validation of provided value optionally with
+        context and returns a result Error object that evaluates to boolean.
+
+        :param value:               a value to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    shiftschema.result.Error
+        """
+        raise NotImplemented
+
+    def run(self, value, model=None, context=None):
+        """
+        Run validation
+        Async validators can't run synchronously, so this raises.
+
+        :param value:               a value to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    None
+        """
+        err = 'Validator "{}" is async, use avalidate() or aprocess()'
+        raise AsyncValidationRequired(err.format(self.__class__.__name__))
+
+    async def arun(self, value, model=None, context=None):
+        """
+        Run validation asynchronously
+        Awaits concrete implementation to ensure custom validators return
+        proper type of result.
+
+        :param value:               a value to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    shiftschema.result.Error
+        """
+        res = await self.validate(value, model, context)
+        if res is VALID or res is None:
+            return VALID
+        if not isinstance(res, Error):
+            err = 'Validator "{}" result must be of type "{}", got "{}"'
+            raise InvalidErrorType(err.format(
+                self.__class__.__name__,
+                Error,
+                type(res))
+            )
+
+        return res
+
+
+async def run_validators(
+    validators,
+    value,
+    model=None,
+    context=None,
+    fail_fast=False
+):
+    """
+    Run validators
+    Runs a chain of sync and async validators on a value. Sync validators
+    run inline, while async ones are awaited concurrently. In fail fast mode
+    validators run one by one until the first error.
+
+    :param validators:          iterable of validators
+    :param value:               a value to validate
+    :param model:               parent model of the property
+    :param context:             parent model or custom context
+    :param fail_fast:           bool, stop on first error
+    :return:                    list of errors or None
+    """
+    if fail_fast:
+        for validator in validators:
+            if isinstance(validator, AbstractAsyncValidator):
+                error = await validator.arun(value, model, context)
+            else:
+                error = validator.run(value, model, context)
+            if error:
+                return [error]
+        return None
+
+    results = []
+    pending = []
+    for validator in validators:
+        if isinstance(validator, AbstractAsyncValidator):
+            pending.append(len(results))
+            results.append(validator.arun(value, model, context))
+        else:
+            results.append(validator.run(value, model, context))
+
+    if pending:
+        import asyncio
+        awaited = await asyncio.gather(*(results[i] for i in pending))
+        for index, error in zip(pending, awaited):
+            results[index] = error
+
+    errors = [error for error in results if error]
+    return errors or None
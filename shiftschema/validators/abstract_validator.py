@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 from shiftschema.exceptions import InvalidErrorType
 
 
@@ -30,7 +30,8 @@ class AbstractValidator(metaclass=ABCMeta):
         """
         Run validation
         Wraps concrete implementation to ensure custom validators return
-        proper type of result.
+        proper type of result. Validators can return shared VALID error or
+        None to indicate success without creating error objects.
 
         :param value:               a value to validate
         :param model:               parent model of the property
@@ -38,6 +39,8 @@ class AbstractValidator(metaclass=ABCMeta):
         :return:                    shiftschema.result.Error
         """
         res = self.validate(value, model, context)
+        if res is VALID or res is None:
+            return VALID
         if not isinstance(res, Error):
             err = 'Validator "{}" result must be of type "{}", got "{}"'
             raise InvalidErrorType(err.format(
@@ -47,3 +50,18 @@ class AbstractValidator(metaclass=ABCMeta):
             )
 
         return res
+
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a list of values, e.g. a column of tabular data, and
+        returns a list of results in the same order. Override this in your
+        validators if batch can be validated faster than value by value.
+
+        :param values:              list of values to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    list of shiftschema.result.Error
+        """
+        run = self.run
+        return [run(value, model, context) for value in values]
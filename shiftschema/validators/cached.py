@@ -0,0 +1,57 @@
+from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.abstract_async_validator import \
+    AbstractAsyncValidator
+from shiftschema.exceptions import InvalidValidator
+from shiftschema.lru import LRUCache, MISSING
+
+
+class Cached(AbstractValidator):
+    """
+    Cached validator
+    Wraps validator whose result depends only on the value, like Email or
+    Url, and memoizes results in a bounded LRU cache. Model and context are
+    not part of the cache key. Unhashable values are validated without
+    caching. Async validators can't be cached and Required should not be,
+    as wrapped validators are skipped for None values.
+    """
+
+    def __init__(self, validator, max_size=1024, max_bytes=None):
+        """
+        Initialize validator
+        :param validator: AbstractValidator, validator to wrap
+        :param max_size: int, maximum number of cached results
+        :param max_bytes: int or None, maximum size of cached results
+        :return: None
+        """
+        if not isinstance(validator, AbstractValidator):
+            err = 'Validator must be of type {}'.format(AbstractValidator)
+            raise InvalidValidator(err)
+        if isinstance(validator, AbstractAsyncValidator):
+            err = 'Async validator {} can not be cached'
+            raise InvalidValidator(err.format(validator))
+
+        self.wrapped = validator
+        self.cache = LRUCache(max_size=max_size, max_bytes=max_bytes)
+
+    def validate(self, value, model=None, context=None):
+        """
+        Validate
+        Returns cached validation result or validates and caches it.
+
+        :param value:           value to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                shiftschema.result.Error
+        """
+        key = (type(value), value)
+        try:
+            cached = self.cache.get(key)
+        except TypeError:
+            return self.wrapped.run(value, model, context)
+
+        if cached is not MISSING:
+            return cached
+
+        result = self.wrapped.run(value, model, context)
+        self.cache.set(key, result)
+        return result
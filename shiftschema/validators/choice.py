@@ -1,6 +1,103 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 from shiftschema.exceptions import InvalidOption
+from collections.abc import Iterator
+import json
+import os
+
+
+class Choices:
+    """
+    Choices
+    Lookup of valid choices given as a list or tuple used by choice
+    validators. Hashable choices are kept in a set, so that checking a value
+    is a constant time operation regardless of how many choices there are.
+    Unhashable choices, like lists or dicts, are kept aside and checked one
+    by one.
+    """
+
+    def __init__(self, choices):
+        """
+        Initialize choices
+        :param choices: list or tuple of valid choices
+        :return: None
+        """
+        self.unhashable = []
+        self.hashed = set()
+        for choice in choices:
+            try:
+                self.hashed.add(choice)
+            except TypeError:
+                self.unhashable.append(choice)
+
+    def __contains__(self, value):
+        try:
+            if value in self.hashed:
+                return True
+        except TypeError:
+            pass
+        return bool(self.unhashable) and value in self.unhashable
+
+    def __iter__(self):
+        yield from self.hashed
+        yield from self.unhashable
+
+    def __len__(self):
+        return len(self.hashed) + len(self.unhashable)
+
+
+def load_choices(path):
+    """
+    Load choices
+    Reads valid choices from a file. Json files must contain a list of
+    choices, while any other files are read as text having one choice per
+    line, with blank lines and lines starting with # skipped.
+
+    :param path: str, path to file
+    :return: set of choices
+    """
+    if not os.path.isfile(path):
+        raise InvalidOption('Choices file not found: {}'.format(path))
+
+    with open(path, encoding='utf-8') as file:
+        if os.path.splitext(path)[1] == '.json':
+            choices = json.load(file)
+            if not isinstance(choices, list):
+                err = 'Choices file must contain a list: {}'
+                raise InvalidOption(err.format(path))
+            return choices
+
+        choices = set()
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                choices.add(line)
+        return choices
+
+
+def make_choices(valid_choices):
+    """
+    Make choices
+    Returns valid choices for a validator along with a lookup to check
+    values against. Only lists and tuples get hashed into a lookup, while
+    anything that can already be checked cheaply, like sets, mappings or
+    ranges, and any other iterable are used as they are. That means strings
+    still check for a substring. One-shot iterators, like generators, are
+    read into a list first, so that they can be checked more than once.
+
+    :param valid_choices: iterable of valid choices
+    :return: tuple, (choices, lookup)
+    """
+    try:
+        iter(valid_choices)
+    except TypeError:
+        raise InvalidOption('Choices must be an iterable')
+
+    if isinstance(valid_choices, Iterator):
+        valid_choices = list(valid_choices)
+    if isinstance(valid_choices, (list, tuple)):
+        return valid_choices, Choices(valid_choices)
+    return valid_choices, valid_choices
 
 
 class Choice(AbstractValidator):
@@ -17,21 +114,38 @@ class Choice(AbstractValidator):
         Initialize validator
         Accepts an iterable of valid choices to check against.
 
-        :param min:             int or None, minimum length
-        :param max:             int or None, maximum length
+        :param valid_choices:   iterable of valid choices
         :param message:         str, custom error message
         :return:                None
         """
         if message is not None:
             self.invalid_choice = message
 
-        try:
-            iter(valid_choices)
-        except TypeError:
-            raise InvalidOption('Choices must be an iterable')
-
         self.choices = valid_choices
 
+    @property
+    def choices(self):
+        """ Valid choices as given """
+        return self._choices
+
+    @choices.setter
+    def choices(self, valid_choices):
+        """ Set valid choices and rebuild their lookup """
+        self._choices, self.lookup = make_choices(valid_choices)
+
+    @classmethod
+    def from_file(cls, path, message=None):
+        """
+        From file
+        Creates validator with valid choices loaded from a file, either a
+        json list or a text file with one choice per line.
+
+        :param path:            str, path to choices file
+        :param message:         str, custom error message
+        :return:                shiftschema.validators.Choice
+        """
+        return cls(load_choices(path), message=message)
+
     def validate(self, value, model=None, context=None):
         """
         Validate
@@ -44,10 +158,25 @@ class Choice(AbstractValidator):
         :return:                shiftschema.result.Error
         """
 
-        if value not in self.choices:
+        if value not in self.lookup:
             return Error(self.invalid_choice)
 
         # success otherwise
-        return Error()
+        return VALID
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Checks a list of values against valid choices.
 
+        :param values:          list of values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        choices = self.lookup
+        invalid_choice = self.invalid_choice
+        return [
+            VALID if value in choices else Error(invalid_choice)
+            for value in values
+        ]
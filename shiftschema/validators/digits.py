@@ -1,5 +1,6 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
+import re
 
 
 class Digits(AbstractValidator):
@@ -10,6 +11,12 @@ class Digits(AbstractValidator):
 
     not_digital = '%digits_must_only_contain_digits%'
 
+    # regex compile flags
+    flags = 0
+
+    # compiled regexes shared by all instances, keyed by configuration
+    compiled_regexes = {}
+
     def __init__(self, message=None):
         """
         Initialize validator
@@ -31,14 +38,35 @@ class Digits(AbstractValidator):
         :param context:         object or None, validation context
         :return:                shiftschema.results.SimpleResult
         """
-        import re
-
         value = str(value)
-        match = re.match(r'^\d+', value)
-        if not match or value != match.group():
+        if not self.regex().fullmatch(value):
             return Error(self.not_digital)
 
         # success otherwise
-        return Error()
+        return VALID
+
+    def regex(self):
+        """
+        Compiled regex
+        Returns regex compiled once on first use and shared between all
+        validator instances. Subclasses get their own regexes, so that
+        those overriding pattern() don't get the one of their parent.
+        :return: compiled regex
+        """
+        key = (type(self), self.flags)
+        regexes = type(self).compiled_regexes
+        regex = regexes.get(key)
+        if regex is None:
+            regex = re.compile(self.pattern(), flags=self.flags)
+            regexes[key] = regex
+
+        return regex
+
+    def pattern(self):
+        """
+        Digits regex
+        :return: str, regex source
+        """
+        return r'\d+'
 
 
@@ -1,5 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 import re
 
 
@@ -12,6 +12,12 @@ class Email(AbstractValidator):
 
     not_email = '%email_invalid%'
 
+    # regex compile flags
+    flags = 0
+
+    # compiled regexes shared by all instances, keyed by configuration
+    compiled_regexes = {}
+
     def __init__(self, message=None):
         """
         Initialize validator
@@ -35,15 +41,31 @@ class Email(AbstractValidator):
         """
 
         value = str(value)
-        regex = self.regex()
-        match = regex.match(value)
+        match = self.regex().match(value)
         if not match:
             return Error(self.not_email)
 
         # success otherwise
-        return Error()
+        return VALID
 
     def regex(self):
+        """
+        Compiled regex
+        Returns regex compiled once on first use and shared between all
+        validator instances. Subclasses get their own regexes, so that
+        those overriding pattern() don't get the one of their parent.
+        :return: compiled regex
+        """
+        key = (type(self), self.flags)
+        regexes = type(self).compiled_regexes
+        regex = regexes.get(key)
+        if regex is None:
+            regex = re.compile(self.pattern(), flags=self.flags)
+            regexes[key] = regex
+
+        return regex
+
+    def pattern(self):
         """
         RFC822 Email Address Regex
         Originally written by Cal Henderson
@@ -52,9 +74,8 @@ class Email(AbstractValidator):
         http://tfletcher.com/lib/rfc822.py
         Licensed under a Creative Commons Attribution-ShareAlike 2.5 License
         http://creativecommons.org/licenses/by-sa/2.5/
-        :return:
+        :return: str, regex source
         """
-
         qtext = '[^\\x0d\\x22\\x5c\\x80-\\xff]'
         dtext = '[^\\x0d\\x5b-\\x5d\\x80-\\xff]'
 
@@ -71,8 +92,7 @@ class Email(AbstractValidator):
         local_part = "%s(?:\\x2e%s)*" % (word, word)
         addr_spec = "%s\\x40%s" % (local_part, domain)
 
-        email_address = re.compile('\A%s\Z' % addr_spec)
-        return email_address
+        return r'\A%s\Z' % addr_spec
 
 
 
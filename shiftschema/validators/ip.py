@@ -1,5 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 import ipaddress
 
 
@@ -40,6 +40,6 @@ class Ip(AbstractValidator):
             return Error(self.invalid_ip)
 
         # success otherwise
-        return Error()
+        return VALID
 
 
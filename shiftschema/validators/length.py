@@ -1,5 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 
 
 class Length(AbstractValidator):
@@ -43,25 +43,60 @@ class Length(AbstractValidator):
         :return:                shiftschema.results.SimpleResult
         """
 
-        value = str(value)
-        length = len(value)
-        params = dict(min=self.min, max=self.max)
+        length = len(str(value))
 
         # too short?
         if self.min and self.max is None:
             if length < self.min:
-                return Error(self.too_short, params)
+                return Error(self.too_short, self.params())
 
         # too long?
         if self.max and self.min is None:
             if length > self.max:
-                return Error(self.too_long, params)
+                return Error(self.too_long, self.params())
 
         # within range?
         if self.min and self.max:
             if length < self.min or length > self.max:
-                return Error(self.not_in_range, params)
+                return Error(self.not_in_range, self.params())
 
         # success otherwise
-        return Error()
+        return VALID
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Checks lengths of a list of values choosing which bounds to check
+        once for the whole list.
+
+        :param values:          list of values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        if self.min and self.max is None:
+            message, min, max = self.too_short, self.min, float('inf')
+        elif self.max and self.min is None:
+            message, min, max = self.too_long, 0, self.max
+        elif self.min and self.max:
+            message, min, max = self.not_in_range, self.min, self.max
+        else:
+            return [VALID] * len(values)
+
+        results = []
+        for value in values:
+            length = len(value) if type(value) is str else len(str(value))
+            if length < min or length > max:
+                results.append(Error(message, self.params()))
+            else:
+                results.append(VALID)
+        return results
+
+    def params(self):
+        """
+        Params
+        Returns error message formatting parameters. Only created when
+        validation fails.
+        :return:                dict
+        """
+        return dict(min=self.min, max=self.max)
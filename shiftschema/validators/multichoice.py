@@ -1,6 +1,6 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
-from shiftschema.exceptions import InvalidOption
+from shiftschema.result import Error, VALID
+from shiftschema.validators.choice import make_choices, load_choices
 
 
 class MultiChoice(AbstractValidator):
@@ -16,21 +16,38 @@ class MultiChoice(AbstractValidator):
         Initialize validator
         Accepts an iterable of valid choices to check against.
 
-        :param min:             int or None, minimum length
-        :param max:             int or None, maximum length
+        :param valid_choices:   iterable of valid choices
         :param message:         str, custom error message
         :return:                None
         """
         if message is not None:
             self.invalid_multichoice = message
 
-        try:
-            iter(valid_choices)
-        except TypeError:
-            raise InvalidOption('Choices must be an iterable')
-
         self.choices = valid_choices
 
+    @property
+    def choices(self):
+        """ Valid choices as given """
+        return self._choices
+
+    @choices.setter
+    def choices(self, valid_choices):
+        """ Set valid choices and rebuild their lookup """
+        self._choices, self.lookup = make_choices(valid_choices)
+
+    @classmethod
+    def from_file(cls, path, message=None):
+        """
+        From file
+        Creates validator with valid choices loaded from a file, either a
+        json list or a text file with one choice per line.
+
+        :param path:            str, path to choices file
+        :param message:         str, custom error message
+        :return:                shiftschema.validators.MultiChoice
+        """
+        return cls(load_choices(path), message=message)
+
     def validate(self, value, model=None, context=None):
         """
         Validate
@@ -42,14 +59,15 @@ class MultiChoice(AbstractValidator):
         :param context:         object or None, validation context
         :return:                shiftschema.result.Error
         """
-        invalid = [item for item in value if item not in self.choices]
-        if len(invalid):
+        choices = self.lookup
+        invalid = [item for item in value if item not in choices]
+        if invalid:
             return Error(
                 self.invalid_multichoice,
-                dict(items=', '.join(invalid))
+                dict(items=', '.join(str(item) for item in invalid))
             )
 
         # success otherwise
-        return Error()
+        return VALID
 
 
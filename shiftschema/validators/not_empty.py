@@ -1,5 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 from collections import Iterable
 
 
@@ -42,7 +42,7 @@ class NotEmpty(AbstractValidator):
         except StopIteration:
             return Error(self.cant_be_empty)
 
-        return Error()
+        return VALID
 
 
 
@@ -1,5 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 
 
 class Required(AbstractValidator):
@@ -52,23 +52,23 @@ class Required(AbstractValidator):
 
         # ok if non-empty string
         if type(value) is str and value != '':
-            return Error()
+            return VALID
 
         # ok if has value
         if bool(value):
-            return Error()
+            return VALID
 
         # ok if false, but false is allowed
         if value is False and self.allow_false:
-            return Error()
+            return VALID
 
         # ok if 0, but zero is allowed
         if value == 0 and self.allow_zero:
-            return Error()
+            return VALID
 
         # ok if '', but empty string is allowed
         if value == '' and self.allow_empty_string:
-            return Error()
+            return VALID
 
         # error otherwise
         return Error(self.value_required)
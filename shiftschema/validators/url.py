@@ -1,6 +1,7 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 import re
+import warnings
 
 
 class Url(AbstractValidator):
@@ -20,6 +21,9 @@ class Url(AbstractValidator):
     # allow localhost?
     localhost = False
 
+    # compiled regexes shared by all instances, keyed by configuration
+    compiled_regexes = {}
+
     def __init__(self, protocols=None, localhost=False, message=None):
         """
         Initialize validator
@@ -50,27 +54,57 @@ class Url(AbstractValidator):
         :return:                shiftschema.results.SimpleResult
         """
         value = str(value)
-        regex = self.regex(
-            protocols=self.protocols,
-            localhost=self.localhost
-        )
-
-        regex = re.compile(regex, flags=self.flags)
-        match = regex.match(value)
+        match = self.regex().match(value)
 
         # return error
         if not match:
             return Error(self.url_invalid)
 
         # success otherwise
-        return Error()
+        return VALID
+
+    def regex(self, protocols=None, localhost=True):
+        """
+        Compiled regex
+        Returns regex compiled for current protocols and localhost settings.
+        Each distinct configuration gets compiled only once and is shared
+        between validator instances of the same class. Calling it with
+        protocols to get regex source is deprecated, use pattern() instead.
+
+        :param protocols:       list, deprecated, returns regex source
+        :param localhost:       bool, deprecated, used with protocols
+        :return: compiled regex
+        """
+        if protocols is not None:
+            warnings.warn(
+                'Url.regex(protocols, localhost) is deprecated, '
+                'use Url.pattern(protocols, localhost) instead',
+                DeprecationWarning,
+                stacklevel=2
+            )
+            return self.pattern(protocols, localhost)
+
+        key = (
+            type(self),
+            tuple(self.protocols),
+            bool(self.localhost),
+            self.flags
+        )
+        regexes = type(self).compiled_regexes
+        regex = regexes.get(key)
+        if regex is None:
+            pattern = self.pattern(protocols=key[1], localhost=key[2])
+            regex = re.compile(pattern, flags=self.flags)
+            regexes[key] = regex
+
+        return regex
 
-    def regex(self, protocols, localhost=True):
+    def pattern(self, protocols, localhost=True):
         """
         URL Validation regex
         Based on regular expression by Diego Perini (@dperini) and provided
         under MIT License: https://gist.github.com/dperini/729294
-        :return:
+        :return: str, regex source
         """
         p = r"^"
 
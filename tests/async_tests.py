@@ -0,0 +1,143 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+import asyncio
+from shiftschema.schema import Schema
+from shiftschema.result import Error, Result
+from shiftschema.property import SimpleProperty, CollectionProperty
+from shiftschema.validators import AbstractAsyncValidator
+from shiftschema.exceptions import AsyncValidationRequired
+from shiftschema.exceptions import InvalidErrorType
+from shiftschema import validators
+from tests import helpers
+
+
+class Unique(AbstractAsyncValidator):
+    """ Async validator checking value against a database stand-in """
+    def __init__(self, taken=None, delay=0.01):
+        self.taken = taken or []
+        self.delay = delay
+        self.calls = 0
+
+    async def validate(self, value, model=None, context=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if value in self.taken:
+            return Error('taken')
+
+
+@attr('async')
+class AsyncValidationTest(TestCase):
+
+    def run_async(self, coroutine):
+        """ Run coroutine to completion """
+        return asyncio.run(coroutine)
+
+    def test_raise_when_running_async_validator_synchronously(self):
+        """ Raise when running async validator synchronously """
+        schema = Schema()
+        schema.add_property('name').add_validator(Unique())
+        with self.assertRaises(AsyncValidationRequired):
+            schema.validate(dict(name='value'))
+
+    def test_raise_on_bad_async_validation_result(self):
+        """ Raise if async validator returns bad type of result """
+        class Custom(AbstractAsyncValidator):
+            async def validate(self, value, model=None, context=None):
+                return 'Error'
+
+        with self.assertRaises(InvalidErrorType):
+            self.run_async(Custom().arun('value'))
+
+    def test_property_mixes_sync_and_async_validators(self):
+        """ Property runs sync and async validators preserving order """
+        prop = SimpleProperty()
+        prop.add_validator(Unique(taken=['me']))
+        prop.add_validator(helpers.ValidatorInvalid())
+        errors = self.run_async(prop.avalidate('me'))
+        self.assertEqual(['taken', 'always invalid'], [
+            error.message for error in errors
+        ])
+        self.assertEqual([], self.run_async(SimpleProperty().avalidate('me')))
+
+    def test_validate_schema_asynchronously(self):
+        """ Validating schema with async validators """
+        schema = helpers.PersonSpec()
+        schema.first_name.add_validator(Unique(taken=['Willy']))
+        person = helpers.Person(first_name='Willy', last_name='W')
+        result = self.run_async(schema.avalidate(person))
+        self.assertIsInstance(result, Result)
+        self.assertFalse(result)
+        self.assertEqual('taken', result.errors['first_name'][0].message)
+        self.assertIn('last_name', result.errors)
+        self.assertEqual(schema.locale, result.locale)
+
+    def test_async_validators_are_awaited_concurrently(self):
+        """ Async validators across properties are awaited concurrently """
+        schema = Schema()
+        model = dict()
+        unique = Unique(delay=0.05)
+        for index in range(20):
+            name = 'prop{}'.format(index)
+            schema.add_property(name).add_validator(unique)
+            model[name] = 'value'
+
+        loop = asyncio.new_event_loop()
+        try:
+            started = loop.time()
+            result = loop.run_until_complete(schema.avalidate(model))
+            elapsed = loop.time() - started
+        finally:
+            loop.close()
+
+        self.assertTrue(result)
+        self.assertEqual(20, unique.calls)
+        self.assertLess(elapsed, 0.5)
+
+    def test_async_validation_propagates_to_entities_and_collections(self):
+        """ Async validation of nested entities and collections """
+        unique = Unique(taken=['taken'])
+        nested = Schema()
+        nested.add_property('name').add_validator(unique)
+
+        schema = Schema()
+        schema.add_entity('spouse').schema = nested
+        schema.add_collection('friends').schema = nested
+
+        model = dict(
+            spouse=dict(name='taken'),
+            friends=[dict(name='free'), dict(name='taken')]
+        )
+        result = self.run_async(schema.avalidate(model))
+        self.assertIn('name', result.errors['spouse']['schema'])
+        collection = result.errors['friends']['collection']
+        self.assertEqual([1], list(collection.keys()))
+        self.assertEqual(3, unique.calls)
+
+    def test_async_fail_fast(self):
+        """ Async validation in fail fast mode stops on first error """
+        unique = Unique(taken=['taken'])
+        prop = CollectionProperty(fail_fast=True)
+        prop.schema = Schema()
+        prop.schema.add_property('name').add_validator(unique)
+        collection = [dict(name='taken'), dict(name='taken')]
+        results = self.run_async(prop.avalidate_with_schema(collection))
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, unique.calls)
+
+        schema = Schema()
+        schema.add_state_validator(helpers.ValidatorInvalid())
+        schema.add_property('name').add_validator(unique)
+        result = self.run_async(schema.avalidate(dict(), fail_fast=True))
+        self.assertEqual(['__state__'], list(result.errors.keys()))
+
+    def test_async_process(self):
+        """ Filtering and validating asynchronously """
+        schema = Schema()
+        schema.add_property('name').add_filter(helpers.filters.Strip())
+        schema.name.add_validator(validators.Required())
+        schema.name.add_validator(Unique(taken=['taken']))
+        model = dict(name='  taken  ')
+        result = self.run_async(schema.aprocess(model))
+        self.assertEqual('taken', model['name'])
+        self.assertFalse(result)
@@ -0,0 +1,287 @@
+from unittest import TestCase, mock
+from nose.plugins.attrib import attr
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import pickle
+import weakref
+
+from shiftschema.schema import Schema
+from shiftschema.result import Error
+from shiftschema.exceptions import InvalidErrorType
+from shiftschema import codegen
+from shiftschema import validators
+from tests import helpers
+
+
+class BadValidator(validators.AbstractValidator):
+    """ Validator returning a string instead of error """
+    def validate(self, value, model=None, context=None):
+        return 'bad'
+
+
+class ContextValidator(validators.AbstractValidator):
+    """ Validator failing when there is no context """
+    def validate(self, value, model=None, context=None):
+        if context is None:
+            return Error('no context')
+
+
+@attr('codegen')
+class CodegenTest(TestCase):
+
+    def person(self):
+        """ Invalid person with spouse and addresses """
+        person = helpers.Person(first_name='W', last_name='Wonka')
+        person.salutation = 'dr'
+        person.spouse = helpers.Person(first_name='', last_name='Wonka')
+        person.addresses = [
+            helpers.Address('1 Road', 'London', 'GB', 'N1'),
+            helpers.Address('2 Road', None, 'US', ''),
+            helpers.Address(None, None, None, None),
+        ]
+        return person
+
+    def assertSameResult(self, schema, model, context=None):
+        """ Generated function gives the same result as schema """
+        expected = schema.validate(model, context=context)
+        generated = codegen.compile_schema(schema)(schema, model, context)
+        self.assertEqual(bool(expected), bool(generated))
+        self.assertEqual(expected.get_messages(), generated.get_messages())
+        self.assertEqual(expected.locale, generated.locale)
+        self.assertIs(expected.translator, generated.translator)
+        return generated
+
+    def test_generate_source(self):
+        """ Generating source of validation function """
+        source, namespace = codegen.generate(helpers.PersonSpecAggregate())
+        self.assertIn('def validate_0(schema, model, context):', source)
+        self.assertIn('def validate_1(schema, model, context):', source)
+        self.assertIn("value = get(model, 'first_name')", source)
+        self.assertIn('length = len(value)', source)
+        self.assertIn(helpers.ValidatorValid, [
+            type(getattr(obj, '__self__', None)) for obj in namespace.values()
+        ])
+
+    def test_generated_results_are_the_same(self):
+        """ Generated validation gives the same results """
+        schema = helpers.PersonSpecAggregate()
+        self.assertSameResult(schema, self.person())
+        self.assertSameResult(schema, helpers.Person('Willy', 'Wonka'))
+        self.assertSameResult(schema, dict(first_name='W', spouse=dict()))
+        self.assertSameResult(schema, None)
+
+    def test_valid_result_does_not_allocate_errors(self):
+        """ Generated validation does not create errors for valid models """
+        schema = helpers.PersonSpec()
+        result = self.assertSameResult(schema, dict(first_name='Willy'))
+        self.assertTrue(result)
+        self.assertIsNone(result._errors)
+
+    def test_inlined_validators(self):
+        """ Inlined validators behave like validators """
+        schema = Schema()
+        schema.add_property('name').add_validator(validators.Length(min=3))
+        schema.add_property('title').add_validator(validators.Length(max=3))
+        schema.add_property('code').add_validator(
+            validators.Length(min=2, max=3, message='Bad code')
+        )
+        schema.add_property('any').add_validator(validators.Length())
+        schema.add_property('zero').add_validator(
+            validators.Required(allow_zero=True)
+        )
+        schema.add_property('false').add_validator(
+            validators.Required(allow_false=True, allow_empty_string=True)
+        )
+        schema.add_property('size').add_validator(
+            validators.Choice(['S', 'M', ['L', 'XL']])
+        )
+        schema.add_property('letter').add_validator(validators.Choice('abc'))
+        schema.add_property('color').add_validator(
+            validators.Choice(['red', 'green'])
+        )
+
+        for model in [
+            dict(),
+            dict(name='Wi', title='Mr.', code=1, zero=0, false=False),
+            dict(name=12345, title='Mrs.', code='', zero='', false=''),
+            dict(size=['L', 'XL'], letter='ab', color=['red']),
+            dict(size='XL', letter='d', color='red', false=0),
+        ]:
+            self.assertSameResult(schema, model)
+
+    def test_custom_validators(self):
+        """ Custom validators are called with context """
+        schema = Schema()
+        schema.add_property('first').add_validator(ContextValidator())
+        schema.add_property('second', use_context=False).add_validator(
+            ContextValidator()
+        )
+        result = self.assertSameResult(schema, dict(first=1, second=2), 'ctx')
+        self.assertEqual(['second'], list(result.errors.keys()))
+
+        schema.add_property('third').add_validator(BadValidator())
+        generated = codegen.compile_schema(schema)
+        with self.assertRaises(InvalidErrorType):
+            generated(schema, dict(third=3), None)
+
+    def test_fail_fast_properties(self):
+        """ Properties failing fast stop on first error """
+        schema = Schema()
+        prop = schema.add_property('name', fail_fast=True)
+        prop.add_validator(validators.Length(min=3))
+        prop.add_validator(helpers.ValidatorInvalid())
+        prop.add_validator(validators.Length())
+        schema.add_entity('spouse', fail_fast=True)
+        schema.spouse.add_validator(helpers.ValidatorInvalid())
+        schema.spouse.schema = helpers.PersonSpec()
+        schema.add_collection('addresses', fail_fast=True)
+        schema.addresses.schema = helpers.AddressSpec()
+
+        model = dict(
+            name='W',
+            spouse=dict(first_name='W'),
+            addresses=[dict(), dict()]
+        )
+        result = self.assertSameResult(schema, model)
+        self.assertEqual(1, len(result.errors['name']))
+
+    def test_collections_with_executor(self):
+        """ Collections with executor are validated by executor """
+        schema = Schema()
+        with ThreadPoolExecutor(2) as executor:
+            schema.add_collection('addresses', executor=executor, chunk_size=1)
+            schema.addresses.schema = helpers.AddressSpec()
+            model = dict(addresses=[dict(), dict(address='A')])
+            self.assertSameResult(schema, model)
+
+    def test_recursive_schema(self):
+        """ Generating code for schema nested in itself """
+        schema = Schema()
+        schema.add_property('name').add_validator(validators.Required())
+        schema.add_collection('children').schema = schema
+        model = dict(name='a', children=[dict(children=[dict(name='c')])])
+        self.assertSameResult(schema, model)
+
+    def test_schema_can_use_generated_code(self):
+        """ Schema with codegen enabled validates with generated code """
+        schema = helpers.PersonSpecAggregate()
+        schema.codegen = True
+        person = self.person()
+        expected = helpers.PersonSpecAggregate().validate(person)
+        with mock.patch.object(
+            codegen,
+            'compile_schema',
+            wraps=codegen.compile_schema
+        ) as compile_schema:
+            result = schema.validate(person)
+            schema.validate(person)
+            self.assertEqual(1, compile_schema.call_count)
+
+        self.assertEqual(expected.get_messages(), result.get_messages())
+
+        # fail fast validation is not generated
+        result = schema.validate(person, fail_fast=True)
+        self.assertEqual(1, len(result.errors))
+
+    def test_regenerate_when_schema_gets_recompiled(self):
+        """ Generated code is regenerated when schema gets recompiled """
+        schema = helpers.PersonSpecAggregate()
+        schema.codegen = True
+        model = dict(first_name='Willy', spouse=dict(first_name='Wanda'))
+        self.assertNotIn('spouse', schema.validate(model).errors)
+
+        # nested changes are picked up after recompiling
+        schema.spouse.schema.first_name.add_validator(
+            helpers.ValidatorInvalid()
+        )
+        self.assertNotIn('spouse', schema.validate(model).errors)
+        schema.compile()
+        self.assertIn('spouse', schema.validate(model).errors)
+
+        # changing schema through its api recompiles it
+        schema.add_property('nickname').add_validator(
+            helpers.ValidatorInvalid()
+        )
+        model['nickname'] = 'W'
+        self.assertIn('nickname', schema.validate(model).errors)
+
+    def test_shared_schemas_share_generated_code(self):
+        """ Schemas sharing definitions share generated code """
+        class Shared(helpers.PersonSpecAggregate):
+            shared = True
+            codegen = True
+
+        person = self.person()
+        Shared().validate(person)
+        with mock.patch.object(codegen, 'compile_schema') as compile_schema:
+            result = Shared(locale='ru').validate(person)
+            self.assertFalse(compile_schema.called)
+        self.assertEqual('ru', result.locale)
+
+    def test_codegen_does_not_imply_shared_definitions(self):
+        """ Schemas with codegen build their own definitions """
+        class Titled(helpers.PersonSpec):
+            codegen = True
+
+            def __init__(self, titles):
+                self.titles = titles
+                super().__init__()
+
+            def schema(self):
+                super().schema()
+                self.add_property('title').add_validator(
+                    validators.Choice(self.titles)
+                )
+
+        first, second = Titled(['mr']), Titled(['dr'])
+        self.assertFalse(first._shared)
+        self.assertTrue(first.validate(dict(first_name='Willy', title='mr')))
+        result = second.validate(dict(first_name='Willy', title='mr'))
+        self.assertEqual(['title'], list(result.errors.keys()))
+
+    def test_overridden_validation_is_not_bypassed(self):
+        """ Schemas overriding validation methods validate with them """
+        class StateSpec(helpers.PersonSpec):
+            def validate_state(self, model, context=None, result=None,
+                               fail_fast=False):
+                result.add_state_errors([Error('bad state')])
+                return result
+
+        schema = StateSpec()
+        schema.codegen = True
+        result = schema.validate(dict(first_name='Willy'))
+        self.assertEqual(['bad state'], result.get_messages()['__state__'])
+
+        parent = Schema()
+        parent.add_entity('spouse').schema = StateSpec()
+        parent.add_collection('children').schema = StateSpec()
+        model = dict(
+            spouse=dict(first_name='Wanda'),
+            children=[dict(first_name='Charlie')]
+        )
+        result = self.assertSameResult(parent, model)
+        self.assertEqual(['spouse', 'children'], list(result.errors.keys()))
+
+    def test_generated_code_is_kept_by_schema(self):
+        """ Generated code is dropped along with schema and not pickled """
+        schema = helpers.PersonSpec()
+        schema.codegen = True
+        schema.validate(dict(first_name='Willy'))
+        self.assertIn('_generated', vars(schema))
+
+        restored = pickle.loads(pickle.dumps(schema))
+        self.assertNotIn('_generated', vars(restored))
+        self.assertTrue(restored.validate(dict(first_name='Willy')))
+
+        ref = weakref.ref(schema)
+        del schema
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_instrumented_schema_is_not_generated(self):
+        """ Instrumented validation does not use generated code """
+        schema = helpers.PersonSpec()
+        schema.codegen = True
+        with Schema.instrument() as instrument:
+            schema.validate(dict(first_name='Willy'))
+        self.assertEqual(1, instrument.properties['first_name'].calls)
@@ -1,7 +1,7 @@
 from unittest import TestCase
 from nose.plugins.attrib import attr
 
-from shiftschema.result import Error
+from shiftschema.result import Error, VALID
 
 
 @attr('result', 'error')
@@ -24,5 +24,7 @@ class ErrorTest(TestCase):
         self.assertFalse(err)
         self.assertFalse(bool(err))
 
-
-
+    def test_shared_valid_error_evaluates_to_false(self):
+        """ Shared valid error object evaluates to false """
+        self.assertIsInstance(VALID, Error)
+        self.assertFalse(VALID)
@@ -1,4 +1,6 @@
 from unittest import TestCase, mock
+import pickle
+import threading
 from nose.plugins.attrib import attr
 
 from shiftschema.filters import Bleach
@@ -81,7 +83,43 @@ class BleachTest(TestCase):
         # assert link removed as protocol was invalid
         self.assertEquals(expected, filtered)
 
+    def test_reuse_cleaner(self):
+        """ Bleach: Reuse cleaner within a thread """
+        filter = Bleach()
+        self.assertIs(filter.get_cleaner(), filter.get_cleaner())
 
+    def test_cleaner_per_thread(self):
+        """ Bleach: Every thread gets its own cleaner """
+        filter = Bleach()
+        cleaners = []
+        thread = threading.Thread(
+            target=lambda: cleaners.append(filter.get_cleaner())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(filter.get_cleaner(), cleaners[0])
 
-
-
+    def test_filter_many(self):
+        """ Bleach: Filter many values at once """
+        filter = Bleach()
+        text = '<b>Example</b><!-- comment -->'
+        filtered = filter.filter_many([text, None, 123, text])
+        expected = filter.filter(text)
+        self.assertEquals([expected, None, 123, expected], filtered)
+
+    def test_keep_unchanged_values(self):
+        """ Bleach: Can return values it left unchanged as they are """
+        text = ''.join(['<b>Example</b> ', 'text'])
+        self.assertEqual(text, Bleach().filter(text))
+        filter = Bleach(keep_unchanged=True)
+        self.assertIs(text, filter.filter(text))
+        self.assertIs(text, filter.filter_many([text])[0])
+        self.assertEqual('Example', filter.filter('<div>Example</div>'))
+
+    def test_can_pickle(self):
+        """ Bleach: Can pickle filter having a cleaner """
+        filter = Bleach()
+        text = '<b>Example</b><!-- comment -->'
+        expected = filter.filter(text)
+        unpickled = pickle.loads(pickle.dumps(filter))
+        self.assertEquals(expected, unpickled.filter(text))
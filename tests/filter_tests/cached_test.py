@@ -0,0 +1,71 @@
+from unittest import TestCase, mock
+from nose.plugins.attrib import attr
+
+from shiftschema.filters import Cached, Slugify, Strip
+from shiftschema.exceptions import InvalidFilter
+
+
+@attr('filter', 'cached')
+class CachedTest(TestCase):
+    """ Cached filter test"""
+
+    def test_create(self):
+        """ Can create cached filter """
+        filter = Cached(Slugify())
+        self.assertIsInstance(filter, Cached)
+
+    def test_raise_on_wrapping_non_filters(self):
+        """ Raise when wrapping something that is not a filter """
+        with self.assertRaises(InvalidFilter):
+            Cached(object())
+
+    def test_filter_identical_values_once(self):
+        """ Filtering identical values once """
+        slugify = Slugify()
+        filter = Cached(slugify)
+        with mock.patch.object(slugify, 'filter', wraps=slugify.filter) as f:
+            self.assertEqual('hello-world', filter.filter('Hello World'))
+            self.assertEqual('hello-world', filter.filter('Hello World'))
+            self.assertEqual('hi', filter.filter('Hi'))
+
+        self.assertEqual(2, f.call_count)
+        self.assertEqual(1, filter.cache.hits)
+        self.assertEqual(2, filter.cache.misses)
+
+    def test_return_same_value_if_unchanged(self):
+        """ Cached unchanged values are returned as the same object """
+        filter = Cached(Strip())
+        filter.filter('value')
+        value = ''.join(['val', 'ue'])
+        self.assertIs(value, filter.filter(value))
+
+    def test_do_not_mix_equal_values_of_different_types(self):
+        """ Caching equal values of different types separately """
+        filter = Cached(Strip())
+        self.assertIs(True, filter.filter(True))
+        self.assertEqual(1, filter.filter(1))
+        self.assertEqual(2, filter.cache.misses)
+
+    def test_filter_unhashable_values_without_caching(self):
+        """ Filtering unhashable values without caching """
+        filter = Cached(Strip())
+        self.assertEqual(['a'], filter.filter(['a']))
+        self.assertEqual(0, len(filter.cache))
+
+    def test_byte_limit_counts_unchanged_input_values(self):
+        """ Byte limit counts large input values filter left unchanged """
+        filter = Cached(Strip(), max_bytes=10000)
+        for index in range(100):
+            value = str(index) * 5000
+            self.assertIs(value, filter.filter(value))
+
+        stats = filter.cache.stats()
+        self.assertLessEqual(stats['bytes'], 10000)
+        self.assertLessEqual(stats['items'], 1)
+
+    def test_byte_limit_holds_small_values(self):
+        """ Small values fit byte limit without counting their type """
+        filter = Cached(Strip(), max_bytes=10000)
+        for index in range(50):
+            filter.filter(' {} '.format(index))
+        self.assertEqual(50, len(filter.cache))
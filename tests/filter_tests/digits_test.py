@@ -41,7 +41,16 @@ class DigitsTest(TestCase):
         filter = Digits(to_int=True)
         self.assertEqual(1964, filter.filter(value))
 
+    def test_return_same_value_if_only_digits(self):
+        """ Return original value if it only contains digits """
+        value = ''.join(['123', '456'])
+        filter = Digits()
+        self.assertIs(value, filter.filter(value))
 
-
-
-
+    def test_filter_many(self):
+        """ Can filter many values at once """
+        value = '123'
+        filter = Digits(to_int=True)
+        filtered = filter.filter_many(['a 1 b 2', value, '', None])
+        self.assertEqual([12, 123, '', None], filtered)
+        self.assertIs(value, Digits().filter_many([value])[0])
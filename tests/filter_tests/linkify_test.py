@@ -1,4 +1,6 @@
 from unittest import TestCase, mock
+import pickle
+import threading
 from nose.plugins.attrib import attr
 
 from shiftschema.filters import Linkify
@@ -85,5 +87,43 @@ class LinkifyTest(TestCase):
         expected += '<pre>https://yahoo.com</pre>'
         self.assertEquals(expected, filtered)
 
+    def test_reuse_linker(self):
+        """ Linkify: Reuse linker within a thread """
+        filter = Linkify()
+        self.assertIs(filter.get_linker(), filter.get_linker())
 
+    def test_linker_per_thread(self):
+        """ Linkify: Every thread gets its own linker """
+        filter = Linkify()
+        linkers = []
+        thread = threading.Thread(
+            target=lambda: linkers.append(filter.get_linker())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(filter.get_linker(), linkers[0])
 
+    def test_filter_many(self):
+        """ Linkify: Filter many values at once """
+        filter = Linkify()
+        text = 'Google: https://google.com'
+        filtered = filter.filter_many([text, None, 123, text])
+        expected = filter.filter(text)
+        self.assertEquals([expected, None, 123, expected], filtered)
+
+    def test_keep_unchanged_values(self):
+        """ Linkify: Can return values it left unchanged as they are """
+        text = ''.join(['Example ', 'text'])
+        self.assertEqual(text, Linkify().filter(text))
+        filter = Linkify(keep_unchanged=True)
+        self.assertIs(text, filter.filter(text))
+        self.assertIs(text, filter.filter_many([text])[0])
+        self.assertIn('<a href', filter.filter('https://google.com'))
+
+    def test_can_pickle(self):
+        """ Linkify: Can pickle filter having a linker """
+        filter = Linkify()
+        text = 'Google: https://google.com'
+        expected = filter.filter(text)
+        unpickled = pickle.loads(pickle.dumps(filter))
+        self.assertEquals(expected, unpickled.filter(text))
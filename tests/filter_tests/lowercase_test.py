@@ -26,7 +26,20 @@ class LowercaseTest(TestCase):
         filter = Lowercase()
         self.assertEqual(value.lower(), filter.filter(value))
 
-
-
-
-
+    def test_filter_many(self):
+        """ Can filter many values at once """
+        values = ['ABC', None, 123]
+        expected = ['abc', None, 123]
+        filter = Lowercase()
+        self.assertEqual(expected, filter.filter_many(values))
+        self.assertEqual(
+            [filter.filter(value) for value in values],
+            filter.filter_many(values)
+        )
+
+    def test_return_same_value_if_unchanged(self):
+        """ Return original value if it is lowercase already """
+        value = ''.join(['wil', 'ly'])
+        filter = Lowercase()
+        self.assertIs(value, filter.filter(value))
+        self.assertIs(value, filter.filter_many([value])[0])
@@ -54,6 +54,13 @@ class StripTest(TestCase):
         strip = Strip(chars='w.')
         self.assertEqual(expected, strip.filter(value))
 
-
-
-
+    def test_filter_many(self):
+        """ Can filter many values at once """
+        values = ['..a..', None, 123, 'b']
+        expected = ['a..', None, 123, 'b']
+        filter = Strip(mode='left', chars='.')
+        self.assertEqual(expected, filter.filter_many(values))
+        self.assertEqual(
+            [filter.filter(value) for value in values],
+            filter.filter_many(values)
+        )
@@ -26,7 +26,20 @@ class UppercaseTest(TestCase):
         filter = Uppercase()
         self.assertEqual(value.upper(), filter.filter(value))
 
-
-
-
-
+    def test_filter_many(self):
+        """ Can filter many values at once """
+        values = ['abc', None, 123]
+        expected = ['ABC', None, 123]
+        filter = Uppercase()
+        self.assertEqual(expected, filter.filter_many(values))
+        self.assertEqual(
+            [filter.filter(value) for value in values],
+            filter.filter_many(values)
+        )
+
+    def test_return_same_value_if_unchanged(self):
+        """ Return original value if it is uppercase already """
+        value = ''.join(['WIL', 'LY'])
+        filter = Uppercase()
+        self.assertIs(value, filter.filter(value))
+        self.assertIs(value, filter.filter_many([value])[0])
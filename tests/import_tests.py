@@ -0,0 +1,75 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+import os
+import sys
+import subprocess
+from shiftschema import filters, validators
+
+
+def import_times(code):
+    """
+    Import times
+    Runs code in a fresh interpreter with -X importtime and returns
+    cumulative import time in microseconds per imported module.
+
+    :param code: str, python code to run
+    :return: dict
+    """
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, module = line.split('|')
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+@attr('imports')
+class ImportTest(TestCase):
+
+    heavy = ('bleach', 'html5lib', 'slugify', 'text_unidecode', 'asyncio',
+             'ipaddress')
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """ Importing schema does not load heavy dependencies """
+        times = import_times(
+            'import shiftschema\n'
+            'from shiftschema.validators import Required, Length'
+        )
+        self.assertIn('shiftschema.schema', times)
+        loaded = [
+            module for module in times
+            if module.split('.')[0] in self.heavy
+        ]
+        self.assertEqual([], loaded)
+
+    def test_heavy_filters_are_loaded_on_first_use(self):
+        """ Heavy filters get imported on first access """
+        times = import_times('from shiftschema.filters import Bleach')
+        self.assertIn('bleach', times)
+        self.assertNotIn('slugify', times)
+
+    def test_lazy_attributes(self):
+        """ Accessing lazy filters and validators """
+        from shiftschema.filters.slugify import Slugify
+        from shiftschema.validators.ip import Ip
+        self.assertIs(Slugify, filters.Slugify)
+        self.assertIs(Ip, validators.Ip)
+        self.assertIn('Linkify', dir(filters))
+        self.assertIn('Ip', dir(validators))
+        with self.assertRaises(AttributeError):
+            filters.Nope
+        with self.assertRaises(AttributeError):
+            validators.Nope
@@ -0,0 +1,130 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+from shiftschema.schema import Schema
+from shiftschema import instrumentation
+from shiftschema import validators, filters
+from tests import helpers
+
+
+@attr('instrumentation')
+class InstrumentationTest(TestCase):
+
+    def person(self):
+        """ Person model with nested spouse and addresses """
+        person = helpers.Person(first_name='  Willy  ', last_name='Wonka')
+        person.spouse = helpers.Person(first_name='Wanda', last_name='W')
+        person.addresses = [
+            helpers.Address(address='  A  ', city='B', country='UK'),
+            helpers.Address(address='  C  ', city='D', country='UK'),
+        ]
+        return person
+
+    def test_disabled_by_default(self):
+        """ Instrumentation is disabled by default """
+        self.assertIsNone(instrumentation.active.get())
+
+    def test_instrument_is_active_within_block(self):
+        """ Instrument is active within context manager block only """
+        with Schema.instrument() as instrument:
+            self.assertIs(instrument, instrumentation.active.get())
+        self.assertIsNone(instrumentation.active.get())
+
+    def test_record_property_paths_across_nested_schemas(self):
+        """ Recording time per property path across nested schemas """
+        schema = helpers.PersonSpecAggregate()
+
+        with Schema.instrument() as instrument:
+            schema.validate(self.person())
+
+        paths = instrument.properties
+        self.assertEqual(1, paths['first_name'].calls)
+        self.assertIn('__state__', paths)
+        self.assertIn('spouse', paths)
+        self.assertEqual(1, paths['spouse.last_name'].calls)
+        self.assertIn('spouse.__state__', paths)
+        self.assertEqual(2, paths['addresses.postcode'].calls)
+        self.assertGreater(paths['spouse'].seconds, 0)
+
+    def test_record_validators_and_filters(self):
+        """ Recording time per validator and filter class """
+        schema = helpers.PersonSpecAggregate()
+        with Schema.instrument() as instrument:
+            schema.process(self.person())
+
+        self.assertEqual(9, instrument.validators[validators.Required].calls)
+        self.assertIn(validators.Length, instrument.validators)
+        self.assertIn(helpers.ValidatorValid, instrument.validators)
+        self.assertEqual(10, instrument.filters[filters.Strip].calls)
+        self.assertIn('Strip', instrument.report())
+
+    def test_instrumented_result_is_the_same(self):
+        """ Instrumentation does not change filtering and validation """
+        schema = helpers.PersonSpecAggregate()
+
+        person = self.person()
+        expected = schema.process(person).get_messages()
+        instrumented = self.person()
+        with Schema.instrument():
+            result = schema.process(instrumented)
+
+        self.assertEqual(expected, result.get_messages())
+        self.assertEqual(person.first_name, instrumented.first_name)
+        self.assertEqual('A', instrumented.addresses[0].address)
+
+    def test_record_property_paths_when_fused(self):
+        """ Recording property paths of fused processing """
+        schema = helpers.PersonSpecAggregate()
+        with Schema.instrument() as instrument:
+            expected = schema.process(self.person())
+        with Schema.instrument() as fused:
+            result = schema.process(self.person(), fused=True)
+
+        self.assertEqual(expected.get_messages(), result.get_messages())
+        self.assertEqual(
+            set(instrument.properties.keys()),
+            set(fused.properties.keys())
+        )
+        for path in ['first_name', 'spouse.last_name', 'addresses.postcode']:
+            self.assertEqual(
+                instrument.properties[path].calls,
+                fused.properties[path].calls
+            )
+
+    def test_nothing_recorded_when_disabled(self):
+        """ Nothing gets recorded outside of instrumented block """
+        schema = helpers.PersonSpec()
+        with Schema.instrument() as instrument:
+            pass
+        schema.process(dict(first_name='Willy'))
+        self.assertEqual({}, instrument.properties)
+        self.assertEqual({}, instrument.validators)
+
+    def test_can_override_hooks(self):
+        """ Overriding instrument hooks to send timings elsewhere """
+        class Metrics(instrumentation.Instrument):
+            def __init__(self):
+                super().__init__()
+                self.sent = []
+
+            def on_validator(self, validator, seconds):
+                self.sent.append(type(validator).__name__)
+
+        schema = helpers.PersonSpec()
+        with Schema.instrument(Metrics()) as instrument:
+            schema.validate(dict(first_name='Willy'))
+
+        self.assertIn('Length', instrument.sent)
+        self.assertEqual({}, instrument.validators)
+
+    def test_recompiled_schema_is_instrumented(self):
+        """ Instrumenting schema changed after it was instrumented """
+        schema = Schema()
+        schema.add_property('name')
+        instrument = instrumentation.Instrument()
+        with Schema.instrument(instrument):
+            schema.validate(dict(name='Willy'))
+            schema.name.add_validator(validators.Length(min=1))
+            schema.validate(dict(name='Willy'))
+
+        self.assertEqual(1, instrument.validators[validators.Length].calls)
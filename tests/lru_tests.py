@@ -0,0 +1,86 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+import sys
+from shiftschema.lru import LRUCache, MISSING
+
+
+@attr('lru')
+class LRUCacheTest(TestCase):
+
+    def test_get_missing(self):
+        """ Getting missing item counts a miss """
+        cache = LRUCache()
+        self.assertIs(MISSING, cache.get('missing'))
+        self.assertEqual(1, cache.misses)
+
+    def test_set_and_get(self):
+        """ Getting cached item counts a hit """
+        cache = LRUCache()
+        cache.set('key', 'value')
+        self.assertEqual('value', cache.get('key'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, len(cache))
+
+    def test_evict_least_recently_used_items(self):
+        """ Evicting least recently used items over maximum size """
+        cache = LRUCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIs(MISSING, cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(1, cache.evictions)
+
+    def test_evict_items_over_byte_limit(self):
+        """ Evicting items over maximum size in bytes """
+        size = sys.getsizeof('a') + sys.getsizeof('x' * 100)
+        cache = LRUCache(max_bytes=size * 2)
+        cache.set('a', 'x' * 100)
+        cache.set('b', 'x' * 100)
+        cache.set('c', 'x' * 100)
+        self.assertEqual(2, len(cache))
+        self.assertLessEqual(cache.bytes, size * 2)
+        self.assertIs(MISSING, cache.get('a'))
+
+    def test_do_not_cache_items_larger_than_byte_limit(self):
+        """ Items larger than byte limit are not cached """
+        cache = LRUCache(max_bytes=100)
+        cache.set('a', 'x' * 1000)
+        self.assertEqual(0, len(cache))
+
+    def test_replacing_item_updates_size(self):
+        """ Replacing cached item keeps size in sync """
+        cache = LRUCache()
+        cache.set('a', 'x' * 100)
+        cache.set('a', 'x')
+        expected = sys.getsizeof('a') + sys.getsizeof('x')
+        self.assertEqual(expected, cache.bytes)
+
+    def test_clear(self):
+        """ Clearing cache and its counters """
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        expected = dict(items=0, bytes=0, hits=0, misses=0, evictions=0)
+        self.assertEqual(expected, cache.stats())
+
+    def test_tuple_keys_count_their_items(self):
+        """ Size of tuple keys includes size of their items """
+        cache = LRUCache()
+        value = 'x' * 1000
+        cache.set((str, value), 1)
+        self.assertGreater(cache.bytes, sys.getsizeof(value))
+
+    def test_tuple_keys_do_not_count_types(self):
+        """ Types and shared singletons in tuple keys are not counted """
+        cache = LRUCache()
+        cache.set((str, 'a', None, True), 'b')
+        expected = (
+            sys.getsizeof((str, 'a', None, True))
+            + sys.getsizeof('a')
+            + sys.getsizeof('b')
+        )
+        self.assertEqual(expected, cache.bytes)
@@ -0,0 +1,141 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from shiftschema.schema import Schema
+from shiftschema.result import Result
+from shiftschema import parallel
+from tests import helpers
+
+
+@attr('parallel')
+class ParallelTest(TestCase):
+
+    def addresses(self, count, invalid=()):
+        """ Generate a collection of addresses, some of which are invalid """
+        addresses = []
+        for index in range(count):
+            address = dict(address='A', city='B', country='C', postcode='D')
+            if index in invalid:
+                address['postcode'] = None
+            addresses.append(address)
+        return addresses
+
+    def test_split_into_chunks(self):
+        """ Splitting iterable into chunks """
+        chunks = list(parallel.chunks(range(7), 3))
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], chunks)
+
+    def test_validate_in_parallel_preserving_order(self):
+        """ Validating models in parallel preserves order of results """
+        schema = helpers.AddressSpec()
+        models = self.addresses(50, invalid=[3, 27, 49])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(parallel.validate_parallel(
+                executor,
+                schema,
+                models,
+                chunk_size=7,
+                pending=2
+            ))
+
+        self.assertEqual(50, len(results))
+        invalid = [i for i, result in enumerate(results) if not result]
+        self.assertEqual([3, 27, 49], invalid)
+
+    def test_stop_on_first_invalid_model(self):
+        """ Stop validating in parallel after first invalid model """
+        schema = helpers.AddressSpec()
+        models = self.addresses(50, invalid=[12, 27])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(parallel.validate_parallel(
+                executor,
+                schema,
+                models,
+                stop_on_invalid=True,
+                chunk_size=5
+            ))
+
+        self.assertEqual(13, len(results))
+        self.assertFalse(results[-1])
+
+    def test_validate_collection_with_executor(self):
+        """ Validating collection property items with executor """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            schema = Schema()
+            schema.add_collection('addresses', executor=executor, chunk_size=4)
+            schema.addresses.schema = helpers.AddressSpec()
+            model = dict(addresses=self.addresses(20, invalid=[1, 19]))
+            result = schema.validate(model)
+
+        collection = result.errors['addresses']['collection']
+        self.assertEqual([1, 19], sorted(collection.keys()))
+        self.assertIsInstance(collection[19], Result)
+        self.assertIn('postcode', collection[19].errors)
+
+    def test_validate_many_with_executor(self):
+        """ Validating batches of models with executor """
+        schema = helpers.AddressSpec()
+        models = self.addresses(30, invalid=[0, 29])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            errors = dict(schema.validate_many(
+                models,
+                invalid_only=True,
+                executor=executor,
+                chunk_size=4
+            ))
+
+        self.assertEqual([0, 29], list(errors.keys()))
+
+    def test_nested_collections_sharing_executor(self):
+        """ Nested collections sharing bounded executor do not deadlock """
+        executor = ThreadPoolExecutor(max_workers=1)
+        shipment = Schema()
+        shipment.add_collection('addresses', executor=executor, chunk_size=1)
+        shipment.addresses.schema = helpers.AddressSpec()
+        schema = Schema()
+        schema.add_collection('shipments', executor=executor, chunk_size=1)
+        schema.shipments.schema = shipment
+
+        model = dict(shipments=[
+            dict(addresses=self.addresses(3)),
+            dict(addresses=self.addresses(3, invalid=[2])),
+        ])
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(schema.validate(model)),
+            daemon=True
+        )
+        thread.start()
+        thread.join(timeout=5)
+        executor.shutdown(wait=not thread.is_alive())
+        self.assertFalse(thread.is_alive(), 'Validation deadlocked')
+
+        collection = results[0].errors['shipments']['collection']
+        self.assertEqual([1], list(collection.keys()))
+        nested = collection[1].errors['addresses']['collection']
+        self.assertEqual([2], list(nested.keys()))
+        self.assertFalse(parallel.in_worker())
+
+    def test_validate_with_process_pool(self):
+        """ Validating collection with process pool executor """
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            schema = Schema()
+            schema.add_collection('addresses', executor=executor, chunk_size=5)
+            schema.addresses.schema = helpers.AddressSpec()
+            model = dict(addresses=self.addresses(20, invalid=[7]))
+            result = schema.validate(model)
+
+        collection = result.errors['addresses']['collection']
+        self.assertEqual([7], list(collection.keys()))
+
+    def test_executor_is_not_pickled(self):
+        """ Executors are dropped when pickling schemas """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            schema = Schema()
+            schema.add_collection('addresses', executor=executor)
+            restored = pickle.loads(pickle.dumps(schema))
+
+        self.assertIsNone(restored.addresses.executor)
@@ -0,0 +1,211 @@
+from unittest import TestCase, mock
+from nose.plugins.attrib import attr
+
+import os
+import shutil
+import tempfile
+from shiftschema.schema import Schema
+from shiftschema.translator import Translator
+from shiftschema.validators import Email, Url
+from shiftschema.filters import Linkify
+from shiftschema import persistence
+from shiftschema import translator
+from tests import helpers
+
+
+class SharedPersonSpec(helpers.PersonSpecAggregate):
+    shared = True
+
+
+@attr('persistence')
+class PersistenceTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'schema.cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+        translator.clear_cache()
+        super().tearDown()
+
+    def person(self):
+        """ Invalid person with spouse """
+        person = helpers.Person(first_name='W', last_name='Wonka')
+        person.spouse = helpers.Person(first_name='', last_name='Wonka')
+        return person
+
+    def test_save_and_load_schema(self):
+        """ Saving compiled schema to cache file and loading it """
+        schema = helpers.PersonSpecAggregate(locale='ru')
+        persistence.save(schema, self.path)
+        self.assertTrue(os.path.isfile(self.path))
+        self.assertEqual([], os.listdir(self.tmp)[1:])
+
+        loaded = persistence.load(self.path)
+        self.assertIsInstance(loaded, helpers.PersonSpecAggregate)
+        self.assertIsNotNone(loaded._plan)
+        self.assertIsNotNone(loaded.spouse.schema._plan)
+        self.assertEqual('ru', loaded.locale)
+
+        expected = schema.validate(self.person())
+        result = loaded.validate(self.person())
+        self.assertEqual(expected.get_messages(), result.get_messages())
+
+    def test_missing_or_broken_cache_is_not_loaded(self):
+        """ Missing or broken cache files are not loaded """
+        self.assertIsNone(persistence.load(self.path))
+        with open(self.path, 'wb') as file:
+            file.write(b'not a pickle')
+        self.assertIsNone(persistence.load(self.path))
+
+    def test_cache_is_stale_when_library_version_changes(self):
+        """ Cache is stale when library version changes """
+        persistence.save(helpers.PersonSpec(), self.path)
+        with mock.patch.object(persistence, 'version', '0.0.1'):
+            self.assertIsNone(persistence.load(self.path))
+        self.assertIsNotNone(persistence.load(self.path))
+
+    def test_source_files(self):
+        """ Getting source files of classes used by schema """
+        files = persistence.source_files(helpers.PersonSpecAggregate())
+        self.assertEqual([os.path.realpath(helpers.__file__)], files)
+
+    def test_cache_is_stale_when_source_changes(self):
+        """ Cache is stale when source of schema changes """
+        source = os.path.join(self.tmp, 'schema.py')
+        with open(source, 'w') as file:
+            file.write('# schema')
+
+        with mock.patch.object(
+            persistence,
+            'source_files',
+            return_value=[source]
+        ):
+            persistence.save(helpers.PersonSpec(), self.path)
+
+        self.assertIsNotNone(persistence.load(self.path))
+        with open(source, 'w') as file:
+            file.write('# changed schema')
+        self.assertIsNone(persistence.load(self.path))
+
+    def test_unchanged_files_are_not_hashed(self):
+        """ Files are only hashed when their modification time or size change """
+        source = os.path.join(self.tmp, 'schema.py')
+        with open(source, 'w') as file:
+            file.write('# schema')
+
+        with mock.patch.object(
+            persistence,
+            'source_files',
+            return_value=[source]
+        ):
+            persistence.save(helpers.PersonSpec(), self.path)
+
+        with mock.patch.object(
+            persistence,
+            'hash_file',
+            wraps=persistence.hash_file
+        ) as hash_file:
+            self.assertIsNotNone(persistence.load(self.path))
+            self.assertFalse(hash_file.called)
+
+            # touched, but same contents
+            stat = os.stat(source)
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNotNone(persistence.load(self.path))
+            hash_file.assert_called_once_with(source)
+
+    def test_cache_is_stale_when_translations_change(self):
+        """ Cache is stale when translation files change or get added """
+        schema = helpers.PersonSpec()
+        schema.translator = Translator()
+        schema.translator.add_location(self.tmp)
+        persistence.save(schema, self.path)
+        self.assertIsNotNone(persistence.load(self.path))
+
+        file = os.path.join(self.tmp, 'en.json')
+        with open(file, 'w') as handle:
+            handle.write('{"%property_required%": "Me want it"}')
+        self.assertIsNone(persistence.load(self.path))
+
+        persistence.save(schema, self.path)
+        self.assertIsNotNone(persistence.load(self.path))
+        with open(file, 'w') as handle:
+            handle.write('{}')
+        self.assertIsNone(persistence.load(self.path))
+
+    def test_loading_primes_translations(self):
+        """ Loading schema primes translations cache """
+        schema = helpers.PersonSpec(locale='ru')
+        persistence.save(schema, self.path)
+        translator.clear_cache()
+
+        loaded = persistence.load(self.path)
+        key = ('ru', tuple(loaded.translator.dirs))
+        self.assertIn(key, translator.cache)
+        with mock.patch.object(translator, 'load_file') as load_file:
+            Translator().translate('%property_required%', 'ru')
+            self.assertFalse(load_file.called)
+
+    def test_loading_restores_compiled_regexes(self):
+        """ Loading schema restores compiled regexes """
+        schema = Schema()
+        schema.add_property('email').add_validator(Email())
+        schema.add_property('url').add_validator(Url(localhost=True))
+        persistence.save(schema, self.path)
+        email = dict(Email.compiled_regexes)
+        url = dict(Url.compiled_regexes)
+
+        with mock.patch.object(Email, 'compiled_regexes', {}):
+            with mock.patch.object(Url, 'compiled_regexes', {}):
+                loaded = persistence.load(self.path)
+                self.assertEqual(email, Email.compiled_regexes)
+                self.assertEqual(url, Url.compiled_regexes)
+
+                model = dict(email='me@', url='http://localhost')
+                result = loaded.validate(model)
+                self.assertEqual(['email'], list(result.errors.keys()))
+
+    def test_loaded_shared_schema_shares_definitions(self):
+        """ Loaded shared schema shares definitions with its class """
+        persistence.save(SharedPersonSpec(), self.path)
+        SharedPersonSpec._definitions = None
+
+        loaded = persistence.load(self.path)
+        schema = SharedPersonSpec()
+        self.assertIs(loaded.properties, schema.properties)
+        self.assertIs(loaded._plan, schema._plan)
+
+        loaded = persistence.load(self.path)
+        self.assertIs(loaded.properties, schema.properties)
+
+    def test_cached_schema(self):
+        """ Creating schema once and loading it from cache after """
+        with mock.patch.object(
+            persistence,
+            'save',
+            wraps=persistence.save
+        ) as save:
+            schema = helpers.PersonSpecAggregate.cached(self.path)
+            self.assertIsInstance(schema, helpers.PersonSpecAggregate)
+            loaded = helpers.PersonSpecAggregate.cached(self.path)
+            self.assertIsInstance(loaded, helpers.PersonSpecAggregate)
+            self.assertEqual(1, save.call_count)
+
+            # other schema is rebuilt
+            schema = helpers.PersonSpec.cached(self.path)
+            self.assertIsInstance(schema, helpers.PersonSpec)
+            self.assertEqual(2, save.call_count)
+
+    def test_unpicklable_schema_is_not_cached(self):
+        """ Schema that can't be pickled is returned without caching """
+        def build():
+            schema = helpers.PersonSpec()
+            schema.first_name.add_filter(Linkify(callbacks=[lambda a, n: a]))
+            return schema
+
+        schema = persistence.cached(self.path, build)
+        self.assertIsInstance(schema, helpers.PersonSpec)
+        self.assertEqual([], os.listdir(self.tmp))
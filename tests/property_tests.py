@@ -10,6 +10,7 @@ from shiftschema.property import CollectionProperty
 from shiftschema.exceptions import InvalidFilter
 from shiftschema.exceptions import InvalidValidator
 from shiftschema.exceptions import InvalidSchemaType
+from shiftschema.exceptions import FrozenDefinition
 from shiftschema import filters
 from shiftschema import validators
 
@@ -30,6 +31,29 @@ class SimplePropertyTests(TestCase):
         prop = SimpleProperty(use_context=use_context)
         self.assertEquals(use_context, prop.use_context)
 
+    def test_fail_fast_stops_on_first_error(self):
+        """ Stop validating property value on first error """
+        prop = SimpleProperty()
+        prop.add_validator(helpers.ValidatorInvalid())
+        prop.add_validator(helpers.ValidatorInvalid())
+        self.assertEqual(2, len(prop.validate('value')))
+        self.assertEqual(1, len(prop.validate('value', fail_fast=True)))
+
+        prop = SimpleProperty(fail_fast=True)
+        prop.add_validator(helpers.ValidatorInvalid())
+        prop.add_validator(helpers.ValidatorInvalid())
+        self.assertEqual(1, len(prop.validate('value')))
+
+    def test_get_errors_returns_none_when_valid(self):
+        """ Getting errors returns None for valid values """
+        prop = SimpleProperty()
+        prop.add_validator(helpers.ValidatorValid())
+        self.assertIsNone(prop.get_errors('value'))
+        self.assertEqual([], prop.validate('value'))
+
+        prop.add_validator(helpers.ValidatorInvalid())
+        self.assertEqual(1, len(prop.get_errors('value')))
+
     def test_adding_filter(self):
         """ Add filter to property """
         prop = SimpleProperty()
@@ -56,6 +80,29 @@ class SimplePropertyTests(TestCase):
         with self.assertRaises(InvalidValidator):
             prop.add_validator(mock.Mock())
 
+    def test_compile_filter_and_validator_chains(self):
+        """ Compiling property filter and validator chains """
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.add_validator(validators.Length(min=10))
+        prop.add_validator(validators.Required())
+        filter_chain, validator_chain, required, has_async = prop.compile()
+        self.assertEqual(1, len(filter_chain))
+        self.assertEqual(2, len(validator_chain))
+        self.assertEqual(1, len(required))
+        self.assertIsInstance(required[0], validators.Required)
+        self.assertFalse(has_async)
+
+    def test_reset_compiled_chains_when_adding_filters_and_validators(self):
+        """ Compiled chains are reset when adding filters or validators """
+        prop = SimpleProperty()
+        prop.compile()
+        prop.add_filter(filters.Strip())
+        self.assertIsNone(prop._compiled)
+        prop.compile()
+        prop.add_validator(validators.Required())
+        self.assertIsNone(prop._compiled)
+
     def test_added_filter_and_validators_are_not_shared(self):
         """ Added filters and validators are not shared """
         property1 = SimpleProperty()
@@ -70,6 +117,18 @@ class SimplePropertyTests(TestCase):
         self.assertTrue(len(property3.filters) == 0)
         self.assertTrue(len(property3.validators) == 0)
 
+    def test_freeze_property(self):
+        """ Frozen property can't be changed """
+        prop = SimpleProperty()
+        prop.add_validator(helpers.ValidatorInvalid())
+        prop.freeze()
+        self.assertIsNotNone(prop._compiled)
+        with self.assertRaises(FrozenDefinition):
+            prop.add_filter(filters.Strip())
+        with self.assertRaises(FrozenDefinition):
+            prop.add_validator(helpers.ValidatorValid())
+        self.assertEqual(1, len(prop.validate('value')))
+
     def test_filter_value(self):
         """ Filtering property value with attached filters """
         prop = SimpleProperty()
@@ -176,6 +235,52 @@ class SimplePropertyTests(TestCase):
         result = prop.validate(None)
         self.assertEquals(1, len(result))
 
+    def test_filter_many(self):
+        """ Filter a column of values skipping None values """
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.add_filter(filters.Uppercase())
+        prop.add_filter(filters.Stringify())
+        values = (' one ', None, 'two ', None)
+        filtered = prop.filter_many(values)
+        expected = [prop.filter(value) for value in values]
+        self.assertEquals(expected, filtered)
+        self.assertEquals(['ONE', None, 'TWO', None], filtered)
+
+    def test_filter_many_without_filters(self):
+        """ Filtering column without filters returns values as list """
+        prop = SimpleProperty()
+        self.assertEquals([1, None], prop.filter_many((1, None)))
+
+    def test_validate_many(self):
+        """ Validate a column of values as if validated one by one """
+        prop = SimpleProperty()
+        prop.add_validator(validators.Length(min=3))
+        prop.add_validator(validators.Choice(['me', 'you']))
+        prop.add_validator(validators.Required())
+        values = ['no', 'you', 'nobody', None]
+        results = prop.validate_many(values)
+        self.assertEquals(len(values), len(results))
+        for value, errors in zip(values, results):
+            expected = prop.validate(value)
+            self.assertEquals(
+                [e.message for e in expected],
+                [e.message for e in errors]
+            )
+
+        self.assertEquals(2, len(results[0]))
+        self.assertEquals([], results[1])
+        self.assertEquals(1, len(results[2]))
+        self.assertEquals(1, len(results[3]))
+
+    def test_validate_many_fail_fast(self):
+        """ Stop validating column values on their first error """
+        prop = SimpleProperty()
+        prop.add_validator(helpers.ValidatorInvalid())
+        prop.add_validator(helpers.ValidatorInvalid())
+        results = prop.validate_many(['a', 'b'], fail_fast=True)
+        self.assertEquals([1, 1], [len(errors) for errors in results])
+
 
 @attr('property', 'entity')
 class EntityPropertyTests(TestCase):
@@ -381,6 +486,17 @@ class CollectionPropertyTests(TestCase):
         prop = CollectionProperty(use_context=use_context)
         self.assertEquals(use_context, prop.use_context)
 
+    def test_collection_fail_fast_stops_on_first_invalid_item(self):
+        """ Stop validating collection items on first invalid item """
+        prop = CollectionProperty(fail_fast=True)
+        prop.schema = Schema()
+        prop.schema.add_property('name').add_validator(validators.Required())
+        collection = [dict(name='Kady'), dict(), dict()]
+        result = prop.validate_with_schema(collection)
+        self.assertEqual(2, len(result))
+        self.assertTrue(result[0])
+        self.assertFalse(result[1])
+
     def test_filtering_a_collection(self):
         """ Filtering a collection """
         collection = [
@@ -1,7 +1,11 @@
 from unittest import TestCase
 from nose.plugins.attrib import attr
 
+from unittest import mock
+import io
+import json
 from shiftschema.result import Error, Result
+from shiftschema.translator import Translator
 from shiftschema import exceptions as x
 from pprint import pprint as pp
 
@@ -27,6 +31,15 @@ class ResultTest(TestCase):
         self.assertTrue(result == True)
         self.assertTrue(result != False)
 
+    def test_errors_dict_is_created_lazily(self):
+        """ Errors dictionary is only created when needed """
+        result = Result()
+        self.assertIsNone(result._errors)
+        self.assertTrue(result)
+        result.add_errors('property', Error('error'))
+        self.assertIsInstance(result._errors, dict)
+        self.assertFalse(result)
+
     def test_result_with_errors_is_false(self):
         """ Result with errors evaluates to False """
         result = Result({'what': 'error'})
@@ -525,6 +538,91 @@ class ResultTest(TestCase):
         # assert errors merged recursively for existing collection members
         self.assertEquals(2, len(err['nested_collection1']['collection'][0]))
 
+    def test_merge_nested_errors_missing_locally(self):
+        """ Merging direct, schema and collection errors missing locally """
+        result1 = Result()
+        result1.add_entity_errors('entity', direct_errors=Error('Direct'))
+        result1.add_collection_errors('items', direct_errors=Error('Direct'))
+
+        nested = Result()
+        nested.add_errors('name', Error('Nested'))
+        result2 = Result()
+        result2.add_entity_errors('entity', schema_errors=nested)
+        result2.add_collection_errors('items', collection_errors=[nested])
+
+        result1.merge(result2)
+        self.assertIn('name', result1.errors['entity']['schema'])
+        self.assertIn(0, result1.errors['items']['collection'])
+
+    def test_merge_collection_items_repeatedly(self):
+        """ Merging into collection items that were merged before """
+        def item_errors(message):
+            item = Result()
+            item.add_errors('name', Error(message))
+            result = Result()
+            result.add_collection_errors('items', collection_errors=[item])
+            return result
+
+        result = item_errors('First')
+        result.merge(item_errors('Second'))
+        result.merge(item_errors('Third'))
+        item = Result()
+        item.add_errors('name', Error('Fourth'))
+        result.add_collection_errors('items', collection_errors=[item])
+
+        item = result.errors['items']['collection'][0]
+        self.assertEqual(4, len(item['name']))
+
+    def test_merging_keeps_collection_results(self):
+        """ Collection results missing locally are copied into results """
+        item = Result(translator=Translator(), locale='ru')
+        item.add_errors('name', Error('Item'))
+        remote = Result()
+        remote.add_collection_errors('items', collection_errors=[item])
+
+        result = Result()
+        result.merge(remote)
+        copied = result.errors['items']['collection'][0]
+        self.assertIsInstance(copied, Result)
+        self.assertIsNot(item, copied)
+        self.assertIs(item.translator, copied.translator)
+        self.assertEqual('ru', copied.locale)
+        self.assertEqual(['Item'], copied.get_messages()['name'])
+
+        copied.add_errors('name', Error('Copied'))
+        self.assertEqual(1, len(item.errors['name']))
+
+    def test_merging_does_not_share_remote_branches(self):
+        """ Merging into merged result does not change remote result """
+        nested = Result()
+        nested.add_errors('name', Error('Nested'))
+        item = Result()
+        item.add_errors('name', Error('Item'))
+        remote = Result()
+        remote.add_errors('simple', Error('Simple'))
+        remote.add_entity_errors(
+            'entity',
+            direct_errors=Error('Direct'),
+            schema_errors=nested
+        )
+        remote.add_collection_errors('items', collection_errors=[item])
+
+        result = Result()
+        result.merge(remote)
+        result.merge(remote)
+        self.assertEqual(2, len(result.errors['simple']))
+        self.assertEqual(2, len(result.errors['entity']['direct']))
+        self.assertEqual(2, len(result.errors['entity']['schema']['name']))
+        merged = result.errors['items']['collection'][0]
+        self.assertEqual(2, len(merged['name']))
+        messages = result.get_messages()['items']['collection'][0]
+        self.assertEqual(['Item', 'Item'], messages['name'])
+
+        self.assertEqual(1, len(remote.errors['simple']))
+        self.assertEqual(1, len(remote.errors['entity']['direct']))
+        self.assertEqual(1, len(nested.errors['name']))
+        self.assertEqual(1, len(item.errors['name']))
+
     # --------------------------------------------------------------------------
     # translating and formatting results
     # --------------------------------------------------------------------------
@@ -637,6 +735,118 @@ class ResultTest(TestCase):
 
         )
 
+    def test_getting_messages_does_not_change_errors(self):
+        """ Getting messages builds new graph leaving errors intact """
+        item = Result()
+        item.add_errors('nested', Error('Item error'))
+        result = Result()
+        result.add_errors('simple', Error('Simple error'))
+        result.add_collection_errors('items', collection_errors=[item])
+
+        messages = result.get_messages()
+        self.assertEqual(['Simple error'], messages['simple'])
+        collection = messages['items']['collection']
+        self.assertEqual(['Item error'], collection[0]['nested'])
+        self.assertIsInstance(result.errors['simple'][0], Error)
+        self.assertIs(item, result.errors['items']['collection'][0])
+
+    def test_translated_messages_are_memoized(self):
+        """ Repeated errors are translated and formatted once """
+        translator = Translator()
+        result = Result(translator=translator, locale='en')
+        items = []
+        for _ in range(10):
+            item = Result()
+            item.add_errors('name', Error('%length_too_long%', dict(max=3)))
+            items.append(item)
+        result.add_collection_errors('items', collection_errors=items)
+
+        with mock.patch.object(
+            translator,
+            'translate',
+            wraps=translator.translate
+        ) as translate:
+            messages = result.get_messages()
+            result.get_messages()
+
+        self.assertEqual(1, translate.call_count)
+        item = messages['items']['collection'][9]
+        self.assertEqual('String is too long. Maximum is 3', item['name'][0])
+
+    def test_messages_with_unhashable_kwargs_are_not_memoized(self):
+        """ Translating errors with unhashable kwargs """
+        result = Result(translator=Translator(), locale='en')
+        error = Error('%invalid_multichoice%', dict(items=['a', 'b']))
+        result.add_errors('choice', [error, error])
+        messages = result.get_messages()
+        self.assertEqual(2, len(messages['choice']))
+        self.assertIn("['a', 'b']", messages['choice'][1])
+
+    def test_messages_with_scalar_kwargs(self):
+        """ Translating errors with scalar kwargs returns message as is """
+        result = Result(translator=Translator(), locale='en')
+        result.add_errors('number', [Error('x {}', 5), Error('x {}', 5)])
+        messages = result.get_messages()
+        self.assertEqual(['x {}', 'x {}'], messages['number'])
+
+    def test_iterate_errors_as_flat_records(self):
+        """ Iterating errors graph as flat path and message records """
+        item = Result()
+        item.add_errors('price', Error('%value_required%'))
+        address = Result()
+        address.add_errors('city', Error('City error'))
+        address.add_state_errors(Error('Address state error'))
+
+        result = Result(translator=Translator(), locale='en')
+        result.add_errors('name', Error('Name error'))
+        result.add_entity_errors('address', direct_errors=Error('Direct'))
+        result.add_entity_errors('address', schema_errors=address)
+        items = [Result() for _ in range(42)] + [item]
+        result.add_collection_errors('items', collection_errors=items)
+
+        records = result.iter_errors()
+        self.assertEqual(('name', 'Name error', 'Name error'), next(records))
+        records = list(records)
+        self.assertIn(('address', 'Direct', 'Direct'), records)
+        self.assertIn(('address.city', 'City error', 'City error'), records)
+        state = 'Address state error'
+        self.assertIn(('address.__state__', state, state), records)
+        self.assertIn((
+            'items.42.price',
+            '%value_required%',
+            "Value required, can't be empty."
+        ), records)
+        self.assertEqual(4, len(records))
+
+    def test_iterate_errors_with_path_prefix(self):
+        """ Prefixing paths of flat error records """
+        result = Result()
+        result.add_errors('name', Error('Name error'))
+        records = list(result.iter_errors(prefix='17'))
+        self.assertEqual([('17.name', 'Name error', 'Name error')], records)
+
+    def test_iterate_errors_of_valid_result(self):
+        """ Valid result has no error records """
+        self.assertEqual([], list(Result().iter_errors()))
+
+    def test_write_errors_as_json_lines(self):
+        """ Writing errors to a stream as json lines """
+        result = Result(translator=Translator(), locale='en')
+        result.add_errors('name', [
+            Error('%value_required%'),
+            Error('%length_too_long%', dict(max=3))
+        ])
+
+        stream = io.StringIO()
+        lines = result.write_json_lines(stream, prefix='5')
+        self.assertEqual(2, lines)
+
+        records = [json.loads(l) for l in stream.getvalue().splitlines()]
+        self.assertEqual('5.name', records[1]['path'])
+        self.assertEqual('%length_too_long%', records[1]['message'])
+        expected = 'String is too long. Maximum is 3'
+        self.assertEqual(expected, records[1]['translated'])
+
     def test_formatting_messages(self):
         """ Error messages formatted with parameters (if any) """
         result = Result()
@@ -1,12 +1,18 @@
 from unittest import TestCase, mock
 from nose.plugins.attrib import attr
 
+from collections import OrderedDict, defaultdict, namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from shiftschema.schema import Schema
-from shiftschema.result import Result
+from shiftschema import accessors
+from shiftschema.result import Result, Error
 from shiftschema.property import SimpleProperty
 from shiftschema.property import EntityProperty
 from shiftschema.property import CollectionProperty
 from shiftschema.exceptions import PropertyExists, InvalidValidator
+from shiftschema.exceptions import FrozenDefinition
 from shiftschema.translator import Translator
 from shiftschema import validators
 from shiftschema import filters
@@ -155,6 +161,172 @@ class SchemaTest(TestCase):
         schema.set(model, 'someproperty', 'SOME VALUE')
         self.assertEqual('SOME VALUE', model.someproperty)
 
+    def test_model_accessors_are_cached_per_class(self):
+        """ Resolving model accessors once per model class and property """
+        class Model:
+            def __init__(self, value):
+                self.value = value
+
+            def get_someproperty(self):
+                return self.value
+
+        schema = Schema()
+        self.assertEqual(1, schema.get(Model(1), 'someproperty'))
+        getter = accessors.getters[(Model, 'someproperty')]
+        self.assertEqual(2, schema.get(Model(2), 'someproperty'))
+        self.assertIs(getter, accessors.getters[(Model, 'someproperty')])
+
+        schema.set(Model(1), 'other', 'value')
+        self.assertIn((Model, 'other'), accessors.setters)
+
+    def test_model_accessors_attached_to_models(self):
+        """ Using getters and setters attached to models, not their class """
+        class Model:
+            pass
+
+        plain = Model()
+        plain.someproperty = 'attribute'
+        model = Model()
+        model.get_someproperty = lambda: 'from getter'
+        model.set_someproperty = lambda value: setattr(model, 'set', value)
+
+        schema = Schema()
+        self.assertEqual('attribute', schema.get(plain, 'someproperty'))
+        self.assertEqual('from getter', schema.get(model, 'someproperty'))
+        schema.set(model, 'someproperty', 'value')
+        self.assertEqual('value', model.set)
+        schema.set(plain, 'someproperty', 'value')
+        self.assertEqual('value', plain.someproperty)
+
+    def test_model_accessors_on_dynamic_models(self):
+        """ Resolving accessors per model for models with __getattr__ """
+        class Model:
+            def __getattr__(self, name):
+                if name == 'get_someproperty':
+                    return lambda: 'from getter'
+                raise AttributeError(name)
+
+        schema = Schema()
+        self.assertEqual('from getter', schema.get(Model(), 'someproperty'))
+        self.assertIsNone(schema.get(Model(), 'other'))
+
+    def test_model_accessors_for_mappings(self):
+        """ Getting and setting items on any kind of mapping """
+        class Custom(Mapping):
+            def __init__(self, **kwargs):
+                self.data = kwargs
+
+            def __getitem__(self, key):
+                return self.data[key]
+
+            def __iter__(self):
+                return iter(self.data)
+
+            def __len__(self):
+                return len(self.data)
+
+        schema = Schema()
+        ordered = OrderedDict(name='ordered')
+        defaults = defaultdict(list, name='defaults')
+        proxy = MappingProxyType(dict(name='proxy'))
+        custom = Custom(name='custom')
+
+        self.assertEqual('ordered', schema.get(ordered, 'name'))
+        self.assertEqual('defaults', schema.get(defaults, 'name'))
+        self.assertEqual('proxy', schema.get(proxy, 'name'))
+        self.assertEqual('custom', schema.get(custom, 'name'))
+        self.assertIsNone(schema.get(defaults, 'missing'))
+        self.assertNotIn('missing', defaults)
+
+        schema.set(ordered, 'name', 'changed')
+        self.assertEqual('changed', ordered['name'])
+        schema.set(proxy, 'name', 'changed')
+        self.assertEqual('proxy', proxy['name'])
+
+    def test_model_accessors_for_dataclasses(self):
+        """ Getting and setting dataclass fields """
+        @dataclass
+        class Model:
+            name: str
+            other: str = field(default=None, init=False)
+
+        @dataclass(frozen=True)
+        class Frozen:
+            name: str
+
+        schema = Schema()
+        model = Model(name='dataclass')
+        self.assertEqual('dataclass', schema.get(model, 'name'))
+        self.assertIsNone(schema.get(model, 'other'))
+        schema.set(model, 'name', 'changed')
+        self.assertEqual('changed', model.name)
+
+        frozen = Frozen(name='frozen')
+        schema.set(frozen, 'name', 'changed')
+        self.assertEqual('frozen', schema.get(frozen, 'name'))
+
+    def test_model_accessors_for_slots_and_namedtuples(self):
+        """ Getting and setting slots and namedtuple fields """
+        class Slotted:
+            __slots__ = ('name', 'other')
+
+            def __init__(self, name):
+                self.name = name
+
+        Record = namedtuple('Record', ['id', 'name'])
+
+        schema = Schema()
+        slotted = Slotted(name='slotted')
+        self.assertEqual('slotted', schema.get(slotted, 'name'))
+        self.assertIsNone(schema.get(slotted, 'other'))
+        schema.set(slotted, 'other', 'value')
+        self.assertEqual('value', slotted.other)
+
+        record = Record(id=1, name='record')
+        self.assertEqual('record', schema.get(record, 'name'))
+        self.assertIsNone(schema.get(record, 'missing'))
+        schema.set(record, 'name', 'changed')
+        self.assertEqual('record', record.name)
+
+    def test_compile_schema_into_plan(self):
+        """ Compiling schema into a flat execution plan """
+        schema = helpers.PersonSpecAggregate()
+        plan = schema.compile()
+        state, properties, entities, collections = plan
+        self.assertEqual(1, len(state))
+        self.assertIn('first_name', [name for name, prop in properties])
+        self.assertEqual('spouse', entities[0][0])
+        self.assertEqual('addresses', collections[0][0])
+        self.assertIsNotNone(schema.spouse.schema._plan)
+        self.assertIsNotNone(schema.addresses.schema._plan)
+
+    def test_compile_lazily_on_first_use(self):
+        """ Schema gets compiled lazily on first validation """
+        schema = helpers.PersonSpec()
+        self.assertIsNone(schema._plan)
+        schema.validate(helpers.Person())
+        self.assertIsNotNone(schema._plan)
+
+    def test_reset_plan_when_schema_changes(self):
+        """ Compiled plan is reset when adding properties or validators """
+        schema = helpers.PersonSpec()
+        schema.compile()
+        schema.add_property('email')
+        self.assertIsNone(schema._plan)
+
+        schema.compile()
+        schema.add_state_validator(helpers.ValidatorInvalid())
+        self.assertIsNone(schema._plan)
+        self.assertFalse(schema.validate(helpers.Person()))
+
+    def test_validators_added_after_compile_are_used(self):
+        """ Validators added to properties after compilation are applied """
+        schema = Schema()
+        schema.add_property('prop')
+        self.assertTrue(schema.validate(dict()))
+        schema.prop.add_validator(validators.Required())
+        self.assertFalse(schema.validate(dict()))
+
     def test_create_by_subclassing(self):
         """ Creating schema in subclass """
         class MySchema(Schema):
@@ -181,6 +353,80 @@ class SchemaTest(TestCase):
         self.assertEqual('mr', person.salutation)
         self.assertEqual(1964, person.birth_year)
 
+    def test_do_not_write_back_unchanged_values(self):
+        """ Filtering does not write back values filters left unchanged """
+        class Model:
+            def __init__(self):
+                self.writes = []
+                self.name = 'Willy'
+                self.items = []
+
+            def set_name(self, value):
+                self.writes.append('name')
+
+            def set_items(self, value):
+                self.writes.append('items')
+
+        schema = Schema()
+        schema.add_property('name').add_filter(filters.Strip())
+        schema.add_collection('items')
+        model = Model()
+        schema.filter(model)
+        self.assertEqual([], model.writes)
+
+        model.name = '  Willy  '
+        schema.filter(model)
+        self.assertEqual(['name'], model.writes)
+
+    def test_do_not_write_back_values_built_in_filters_left_unchanged(self):
+        """ Built-in filters return values they left unchanged as is """
+        class Model:
+            def __init__(self, **values):
+                self.writes = []
+                self.__dict__.update(values)
+
+            def __setattr__(self, name, value):
+                if name != 'writes':
+                    self.writes.append(name)
+                super().__setattr__(name, value)
+
+        schema = Schema()
+        schema.add_property('lower').add_filter(filters.Lowercase())
+        schema.add_property('upper').add_filter(filters.Uppercase())
+        schema.add_property('slug').add_filter(filters.Slugify())
+        schema.add_property('html').add_filter(
+            filters.Bleach(keep_unchanged=True)
+        )
+        schema.add_property('text').add_filter(
+            filters.Linkify(keep_unchanged=True)
+        )
+        schema.add_property('digits').add_filter(filters.Digits())
+        schema.add_property('string').add_filter(filters.Stringify())
+        schema.add_property('url').add_filter(filters.AddHttp())
+        schema.add_property('strip').add_filter(filters.Strip())
+        values = dict(
+            lower=''.join(['wil', 'ly']),
+            upper=''.join(['WIL', 'LY']),
+            slug=''.join(['willy-', 'wonka']),
+            html=''.join(['<b>Willy</b> ', 'Wonka']),
+            text=''.join(['Willy ', 'Wonka']),
+            digits=''.join(['123', '456']),
+            string=''.join(['Wil', 'ly']),
+            url=''.join(['http://', 'example.com']),
+            strip=''.join(['Wil', 'ly']),
+        )
+
+        model = Model(**values)
+        schema.filter(model)
+        self.assertEqual([], model.writes)
+        schema.process(model, fused=True)
+        self.assertEqual([], model.writes)
+
+        model = Model(**values)
+        model.__dict__.update(lower='Willy', upper='Willy', slug='Willy')
+        schema.filter(model)
+        self.assertEqual(['lower', 'slug', 'upper'], sorted(model.writes))
+
     def test_skip_all_filters_if_value_is_none(self):
         """ Skip filtering if value is none """
         schema = helpers.PersonSpec()
@@ -454,6 +700,281 @@ class SchemaTest(TestCase):
         self.assertTrue('first_name' in result.errors) # too short
         self.assertTrue('first_name' in result.errors['spouse']['schema'])
 
+    def test_validate_many(self):
+        """ Validating an iterable of models """
+        schema = helpers.PersonSpec()
+        models = [
+            dict(first_name='Willy'),
+            dict(first_name='W'),
+            dict(first_name='Wonka'),
+        ]
+
+        results = schema.validate_many(models)
+        self.assertNotIsInstance(results, list)
+
+        results = list(results)
+        self.assertEqual(3, len(results))
+        self.assertIsInstance(results[1], Result)
+        self.assertTrue(results[0])
+        self.assertFalse(results[1])
+        self.assertTrue(results[2])
+        self.assertIn('first_name', results[1].errors)
+        self.assertEqual(schema.locale, results[1].locale)
+
+    def test_validate_many_returning_invalid_only(self):
+        """ Validating many models into compact per-index error map """
+        schema = helpers.PersonSpec()
+        models = (dict(first_name=name) for name in ['Willy', 'W', 'X'])
+        errors = dict(schema.validate_many(models, invalid_only=True))
+        self.assertEqual([1, 2], list(errors.keys()))
+        self.assertIn('first_name', errors[2].errors)
+
+    def test_process_many(self):
+        """ Filtering and validating an iterable of models """
+        schema = helpers.PersonSpec()
+        models = [
+            dict(first_name='  Willy  '),
+            dict(first_name='  W  '),
+        ]
+
+        results = list(schema.process_many(models, invalid_only=True))
+        self.assertEqual('Willy', models[0]['first_name'])
+        self.assertEqual('W', models[1]['first_name'])
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, results[0][0])
+
+    def test_fail_fast_validation(self):
+        """ Fail fast validation stops on first error """
+        schema = helpers.PersonSpec()
+        schema.add_state_validator(helpers.ValidatorInvalid())
+        person = helpers.Person(first_name='W', last_name='X')
+
+        result = schema.validate(person)
+        self.assertIn('__state__', result.errors)
+        self.assertIn('first_name', result.errors)
+
+        result = schema.validate(person, fail_fast=True)
+        self.assertFalse(result)
+        self.assertEqual(['__state__'], list(result.errors.keys()))
+        self.assertEqual(1, len(result.errors['__state__']))
+
+    def test_fail_fast_can_be_set_on_schema(self):
+        """ Fail fast mode can be set on schema and overridden per call """
+        schema = helpers.PersonSpec(fail_fast=True)
+        person = helpers.Person(first_name='W', last_name='X')
+        result = schema.validate(person)
+        self.assertEqual(1, len(result.errors))
+
+        result = schema.validate(person, fail_fast=False)
+        self.assertEqual(2, len(result.errors))
+
+    def test_fail_fast_stops_iterating_collections(self):
+        """ Fail fast stops validating collection on first invalid item """
+        schema = Schema()
+        schema.add_collection('addresses')
+        schema.addresses.schema = helpers.AddressSpec()
+        model = dict(addresses=[
+            dict(address='A', city='B', country='C', postcode='D'),
+            dict(),
+            dict(),
+        ])
+
+        result = schema.validate(model)
+        self.assertEqual(2, len(result.errors['addresses']['collection']))
+
+        result = schema.validate(model, fail_fast=True)
+        collection = result.errors['addresses']['collection']
+        self.assertEqual([1], list(collection.keys()))
+        self.assertEqual(1, len(collection[1].errors))
+
+    def test_fail_fast_per_property(self):
+        """ Fail fast mode can be enabled per property """
+        schema = Schema()
+        schema.add_property('first', fail_fast=True)
+        schema.first.add_validator(helpers.ValidatorInvalid())
+        schema.first.add_validator(helpers.ValidatorInvalid())
+        schema.add_property('second')
+        schema.second.add_validator(helpers.ValidatorInvalid())
+        schema.second.add_validator(helpers.ValidatorInvalid())
+
+        result = schema.validate(dict(first=1, second=2))
+        self.assertEqual(1, len(result.errors['first']))
+        self.assertEqual(2, len(result.errors['second']))
+
+    def aggregate_person(self):
+        """ Creates person with spouse and addresses needing filtering """
+        person = helpers.Person(
+            first_name='  W  ',
+            last_name='  Wonka  ',
+            salutation=' dr ',
+            birth_year=' born 1950 '
+        )
+        person.spouse = helpers.Person(first_name=' Grandma ', last_name=' J ')
+        person.addresses = [
+            helpers.Address(' 1 Road ', ' London ', ' GB ', ' N1 '),
+            helpers.Address(' 2 Road ', ' Boston ', ' US ', ' 02108 '),
+            helpers.Address(' 3 Road ', None, ' FR ', None),
+        ]
+        return person
+
+    def test_fused_process(self):
+        """ Fused processing filters and validates like filter + validate """
+        schema = helpers.PersonSpecAggregate()
+        person = self.aggregate_person()
+        expected = schema.process(person)
+
+        fused = self.aggregate_person()
+        result = schema.process(fused, fused=True)
+        self.assertEqual(expected.get_messages(), result.get_messages())
+        self.assertEqual(repr(person), repr(fused))
+        self.assertEqual(repr(person.spouse), repr(fused.spouse))
+        self.assertEqual(
+            [repr(address) for address in person.addresses],
+            [repr(address) for address in fused.addresses]
+        )
+
+    def test_fused_process_reads_properties_once(self):
+        """ Fused processing gets every property from model once """
+        schema = helpers.PersonSpec(fused=True)
+        person = helpers.Person(first_name=' Willy ', last_name='Wonka')
+        with mock.patch.object(Schema, 'get', wraps=schema.get) as get:
+            schema.process(person)
+            names = [call[0][1] for call in get.call_args_list]
+
+        # first name written back and read again as it was filtered
+        self.assertEqual(
+            ['first_name', 'first_name', 'last_name', 'salutation',
+             'birth_year'],
+            names
+        )
+        self.assertEqual('Willy', person.first_name)
+
+    def test_fused_fail_fast_still_filters(self):
+        """ Fused fail fast processing filters model after first error """
+        schema = helpers.PersonSpecAggregate()
+        person = self.aggregate_person()
+        result = schema.process(person, fail_fast=True, fused=True)
+        self.assertEqual(['first_name'], list(result.errors.keys()))
+        self.assertEqual('Wonka', person.last_name)
+        self.assertEqual('Grandma', person.spouse.first_name)
+        self.assertEqual(2, len(person.addresses))
+        self.assertEqual('FR', person.addresses[1].country)
+
+    def test_fused_process_validates_state_of_filtered_model(self):
+        """ Fused processing runs state validators on filtered model """
+        class Stripped(validators.AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                if value['name'] != value['name'].strip():
+                    return Error('not stripped')
+
+        schema = Schema(fused=True)
+        schema.add_state_validator(Stripped())
+        schema.add_property('name')
+        schema.name.add_filter(filters.Strip())
+        schema.name.add_validator(helpers.ValidatorInvalid())
+
+        result = schema.process(dict(name=' name '))
+        self.assertEqual(['name'], list(result.errors.keys()))
+
+        schema.add_state_validator(helpers.ValidatorInvalid())
+        result = schema.process(dict(name=' name '))
+        self.assertEqual(['__state__', 'name'], list(result.errors.keys()))
+
+        result = schema.process(dict(name=' name '), fail_fast=True)
+        self.assertEqual(['__state__'], list(result.errors.keys()))
+
+    def test_fused_process_many(self):
+        """ Processing many models in a single pass """
+        schema = helpers.PersonSpec()
+        models = [dict(first_name='  Willy  '), dict(first_name='  W  ')]
+        results = list(schema.process_many(models, fused=True))
+        self.assertEqual('Willy', models[0]['first_name'])
+        self.assertEqual('W', models[1]['first_name'])
+        self.assertTrue(results[0])
+        self.assertFalse(results[1])
+
+    def test_shared_definitions_built_once_per_class(self):
+        """ Shared definitions are built once and shared by instances """
+        class Shared(helpers.PersonSpecAggregate):
+            shared = True
+
+        with mock.patch.object(
+            helpers.PersonSpecAggregate,
+            'schema',
+            autospec=True,
+            side_effect=helpers.PersonSpecAggregate.schema
+        ) as definition:
+            first = Shared()
+            second = Shared()
+            self.assertEqual(1, definition.call_count)
+
+        self.assertIs(first.properties, second.properties)
+        self.assertIs(first.first_name, second.first_name)
+        self.assertIs(first.spouse.schema, second.spouse.schema)
+        self.assertIs(first._plan, second._plan)
+
+        person = helpers.Person(first_name=' W ')
+        result = second.process(person)
+        self.assertEqual('W', person.first_name)
+        self.assertIn('first_name', result.errors)
+
+    def test_shared_definitions_are_per_subclass(self):
+        """ Every subclass gets its own shared definitions """
+        class Shared(Schema):
+            shared = True
+
+            def schema(self):
+                self.add_property('name')
+
+        class SharedChild(Shared):
+            def schema(self):
+                super().schema()
+                self.add_property('email')
+
+        self.assertEqual(['name'], list(Shared().properties.keys()))
+        self.assertEqual(
+            ['name', 'email'],
+            list(SharedChild().properties.keys())
+        )
+
+    def test_changing_shared_schema_copies_definitions(self):
+        """ Changing schema sharing definitions gives it its own copy """
+        class Shared(helpers.PersonSpec):
+            shared = True
+
+        schema = Shared()
+        schema.add_property('email')
+        schema.add_state_validator(helpers.ValidatorInvalid())
+        self.assertIn('email', schema.properties)
+        self.assertEqual(2, len(schema.state))
+
+        other = Shared()
+        self.assertNotIn('email', other.properties)
+        self.assertEqual(1, len(other.state))
+        self.assertTrue(other.validate(dict(first_name='Willy')))
+        self.assertFalse(schema.validate(dict(first_name='Willy')))
+
+    def test_shared_properties_are_frozen(self):
+        """ Properties and nested schemas of shared definitions are frozen """
+        class Shared(helpers.PersonSpecAggregate):
+            shared = True
+
+        schema = Shared()
+        with self.assertRaises(FrozenDefinition):
+            schema.first_name.add_validator(helpers.ValidatorInvalid())
+        with self.assertRaises(FrozenDefinition):
+            schema.spouse.schema = helpers.PersonSpec()
+        with self.assertRaises(FrozenDefinition):
+            schema.spouse.schema.add_property('email')
+
+    def test_valid_result_does_not_allocate_errors(self):
+        """ Validating valid model does not create errors dictionary """
+        schema = helpers.PersonSpec()
+        person = helpers.Person(first_name='Willy', last_name='Wonka')
+        result = schema.validate(person)
+        self.assertTrue(result)
+        self.assertIsNone(result._errors)
+
     def test_results_injected_with_translations(self):
         """ Schema-generated results are injected with translation settings """
         schema = Schema()
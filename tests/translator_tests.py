@@ -2,8 +2,13 @@ from unittest import TestCase
 from nose.plugins.attrib import attr
 
 import os
+import shutil
+import tempfile
+from unittest import mock
+from shiftschema import translator
 from shiftschema.translator import Translator
 from shiftschema.exceptions import NoTranslations
+from shiftschema.result import Result, Error
 
 @attr('translator')
 class TranslatorTests(TestCase):
@@ -96,26 +101,80 @@ class TranslatorTests(TestCase):
         msg = 'no-translation-for-me'
         self.assertEqual(msg, trans.translate(msg, 'en'))
 
+    def test_keep_defaults_when_merging_custom_translations(self):
+        """ Custom dictionaries override defaults, but keep other messages """
+        trans = Translator()
+        custom = os.path.dirname(os.path.realpath(__file__))
+        custom = os.path.join(custom, '_assets', 'translations')
+        trans.add_location(custom)
 
+        translations = trans.get_translations('ru')
+        self.assertTrue(translations['__meta__'].startswith('Custom'))
+        self.assertIn('%value_required%', translations)
 
+    def test_load_translations_from_json(self):
+        """ Loading translations from json files """
+        assets = os.path.dirname(os.path.realpath(__file__))
+        assets = os.path.join(assets, '_assets')
+        trans = Translator()
+        trans.add_location(os.path.join(assets, 'translations'))
+        trans.add_location(os.path.join(assets, 'json_translations'))
 
+        translations = trans.get_translations('ru')
+        meta = translations['__meta__']
+        self.assertEqual('JSON translations for Russian', meta)
+        self.assertIn('%custom_message%', translations)
+        self.assertIn('%value_required%', translations)
+
+    def test_translations_are_cached_across_translators(self):
+        """ Translators with same locations share loaded translations """
+        translator.clear_cache()
+        with mock.patch(
+            'shiftschema.translator.spec_from_file_location',
+            wraps=translator.spec_from_file_location
+        ) as loader:
+            first = Translator().get_translations('en')
+            second = Translator().get_translations('en_GB')
+
+        self.assertIs(first, second)
+        self.assertEqual(1, loader.call_count)
+
+    def test_files_are_loaded_once_for_different_locations(self):
+        """ Each translation file is loaded once per process """
+        translator.clear_cache()
+        custom = os.path.dirname(os.path.realpath(__file__))
+        custom = os.path.join(custom, '_assets', 'translations')
 
+        Translator().get_translations('ru')
+        with mock.patch(
+            'shiftschema.translator.spec_from_file_location',
+            wraps=translator.spec_from_file_location
+        ) as loader:
+            trans = Translator()
+            trans.add_location(custom)
+            translations = trans.get_translations('ru')
+
+        self.assertEqual(1, loader.call_count)
+        self.assertEqual(custom, os.path.dirname(loader.call_args[0][1]))
+        self.assertIn('%value_required%', translations)
+
+    def test_clearing_cache_reloads_translations_in_translators(self):
+        """ Clearing cache makes existing translators reload translations """
+        dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dir)
+        file = os.path.join(dir, 'en.json')
+        with open(file, 'w') as handle:
+            handle.write('{"%custom%": "Old message"}')
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        trans = Translator()
+        trans.add_location(dir)
+        result = Result(translator=trans, locale='en')
+        result.add_errors('name', Error('%custom%'))
+        self.assertEqual('Old message', trans.translate('%custom%', 'en'))
+        self.assertEqual(['Old message'], result.get_messages()['name'])
+
+        with open(file, 'w') as handle:
+            handle.write('{"%custom%": "New message"}')
+        translator.clear_cache()
+        self.assertEqual(['New message'], result.get_messages()['name'])
+        self.assertEqual('New message', trans.translate('%custom%', 'en'))
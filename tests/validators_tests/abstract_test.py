@@ -3,6 +3,7 @@ from nose.plugins.attrib import attr
 
 from shiftschema.validators import AbstractValidator
 from shiftschema.exceptions import InvalidErrorType
+from shiftschema.result import VALID
 
 
 @attr('validator', 'abstract')
@@ -28,5 +29,11 @@ class AbstractTest(TestCase):
             validator = Custom()
             validator.run('some value')
 
+    def test_accept_none_as_success(self):
+        """ Validators can return None to indicate success """
+        class Custom(AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                return None
 
-
+        validator = Custom()
+        self.assertIs(VALID, validator.run('some value'))
@@ -0,0 +1,50 @@
+from unittest import TestCase, mock
+from nose.plugins.attrib import attr
+
+from shiftschema.validators import Cached, Email, AbstractAsyncValidator
+from shiftschema.exceptions import InvalidValidator
+
+
+class AsyncValidator(AbstractAsyncValidator):
+    async def validate(self, value, model=None, context=None):
+        pass
+
+
+@attr('validator', 'cached')
+class CachedTest(TestCase):
+    """ Cached validator test"""
+
+    def test_create(self):
+        """ Can instantiate cached validator """
+        validator = Cached(Email())
+        self.assertIsInstance(validator, Cached)
+
+    def test_raise_on_wrapping_non_validators(self):
+        """ Raise when wrapping something that is not a validator """
+        with self.assertRaises(InvalidValidator):
+            Cached(object())
+
+    def test_raise_on_wrapping_async_validators(self):
+        """ Raise when wrapping async validator """
+        with self.assertRaises(InvalidValidator):
+            Cached(AsyncValidator())
+
+    def test_validate_identical_values_once(self):
+        """ Validating identical values once """
+        email = Email()
+        validator = Cached(email)
+        with mock.patch.object(email, 'validate', wraps=email.validate) as v:
+            self.assertFalse(validator.run('me@example.com'))
+            self.assertFalse(validator.run('me@example.com'))
+            error = validator.run('bad')
+            self.assertTrue(error)
+            self.assertIs(error, validator.run('bad'))
+
+        self.assertEqual(2, v.call_count)
+        self.assertEqual(2, validator.cache.hits)
+
+    def test_validate_unhashable_values_without_caching(self):
+        """ Validating unhashable values without caching """
+        validator = Cached(Email())
+        self.assertTrue(validator.run(['bad']))
+        self.assertEqual(0, len(validator.cache))
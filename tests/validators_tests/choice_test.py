@@ -1,10 +1,14 @@
 from unittest import TestCase, mock
+import os
 from nose.plugins.attrib import attr
 
 from shiftschema.validators import Choice
 from shiftschema.exceptions import InvalidOption
 
 
+assets = os.path.join(os.path.dirname(__file__), '..', '_assets', 'choices')
+
+
 @attr('validator', 'choice')
 class ChoiceTest(TestCase):
     """ Choice validator test"""
@@ -41,4 +45,70 @@ class ChoiceTest(TestCase):
         error = validator.run('s')
         self.assertFalse(error)
 
+    def test_validate_many(self):
+        """ Validating many values at once """
+        validator = Choice(['one', 'two'])
+        results = validator.validate_many(['one', 'three', 'two'])
+        self.assertEqual([False, True, False], [bool(e) for e in results])
+
+    def test_choices_are_hashed(self):
+        """ Choices get hashed at construction """
+        validator = Choice(['one', 'two', 'three'])
+        self.assertEqual({'one', 'two', 'three'}, validator.lookup.hashed)
+        self.assertEqual(['one', 'two', 'three'], validator.choices)
+
+    def test_keep_choices_that_are_cheap_to_check(self):
+        """ Sets, mappings and ranges are used as they are """
+        huge = range(1, 10 ** 12)
+        codes = frozenset(['GB', 'US'])
+        names = dict(GB='United Kingdom')
+        for choices in (huge, codes, names, names.keys()):
+            validator = Choice(choices)
+            self.assertIs(choices, validator.choices)
+            self.assertIs(choices, validator.lookup)
+
+        self.assertFalse(Choice(huge).run(10 ** 11))
+        self.assertTrue(Choice(huge).run(0))
+        self.assertFalse(Choice(names).run('GB'))
 
+    def test_rebuild_lookup_when_setting_choices(self):
+        """ Setting choices rebuilds their lookup """
+        validator = Choice(['one'])
+        validator.choices = ('two', 'three')
+        self.assertTrue(validator.run('one'))
+        self.assertFalse(validator.run('three'))
+
+    def test_can_use_generator_for_choices(self):
+        """ Generator choices can be used more than once """
+        validator = Choice(str(i) for i in range(100))
+        self.assertFalse(validator.run('42'))
+        self.assertFalse(validator.run('42'))
+        self.assertTrue(validator.run('100'))
+
+    def test_can_use_unhashable_choices(self):
+        """ Fall back to comparing unhashable choices """
+        validator = Choice(['one', ['two'], dict(three=3)])
+        self.assertFalse(validator.run('one'))
+        self.assertFalse(validator.run(['two']))
+        self.assertFalse(validator.run(dict(three=3)))
+        self.assertTrue(validator.run(['one']))
+        self.assertTrue(validator.run('two'))
+
+    def test_load_choices_from_text_file(self):
+        """ Load choices from a text file with one choice per line """
+        path = os.path.join(assets, 'countries.txt')
+        validator = Choice.from_file(path, message='Bad country')
+        self.assertEqual({'GB', 'US', 'FR'}, set(validator.choices))
+        self.assertFalse(validator.run('GB'))
+        self.assertEqual('Bad country', validator.run('DE').message)
+
+    def test_load_choices_from_json_file(self):
+        """ Load choices from json file """
+        validator = Choice.from_file(os.path.join(assets, 'currencies.json'))
+        self.assertFalse(validator.run('GBP'))
+        self.assertTrue(validator.run('JPY'))
+
+    def test_raise_if_choices_file_not_found(self):
+        """ Raise an exception if choices file does not exist """
+        with self.assertRaises(InvalidOption):
+            Choice.from_file(os.path.join(assets, 'nope.txt'))
@@ -46,3 +46,10 @@ class DigitsTest(TestCase):
         self.assertFalse(error1)
         self.assertFalse(error2)
 
+
+    def test_share_compiled_regex(self):
+        """ Compiled regex is shared between digits validators """
+        validator1 = Digits()
+        validator2 = Digits()
+        self.assertIs(validator1.regex(), validator2.regex())
+        self.assertIn(validator1.regex(), Digits.compiled_regexes.values())
@@ -58,4 +58,30 @@ class EmailTest(TestCase):
             msg = 'Email [{}] failed validation'.format(address)
             self.assertTrue(error, msg=msg)
 
+    def test_share_compiled_regex(self):
+        """ Compiled regex is shared between email validators """
+        validator1 = Email()
+        validator2 = Email()
+        self.assertIs(validator1.regex(), validator2.regex())
 
+    def test_subclass_can_have_own_compiled_regexes(self):
+        """ Subclasses can keep compiled regexes of their own """
+        class OwnEmail(Email):
+            compiled_regexes = {}
+
+        regex = Email().regex()
+        self.assertEqual(regex.pattern, OwnEmail().regex().pattern)
+        self.assertEqual(1, len(OwnEmail.compiled_regexes))
+        OwnEmail.compiled_regexes.clear()
+        self.assertIn(regex, Email.compiled_regexes.values())
+
+    def test_subclass_overriding_pattern_gets_own_regex(self):
+        """ Subclass overriding pattern does not get regex of its parent """
+        class StrictEmail(Email):
+            def pattern(self):
+                return r'\A[a-z]+@example\.com\Z'
+
+        self.assertFalse(Email().validate('a@b.com'))
+        self.assertTrue(StrictEmail().validate('a@b.com'))
+        self.assertFalse(StrictEmail().validate('a@example.com'))
+        self.assertFalse(Email().validate('a@b.com'))
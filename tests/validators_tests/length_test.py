@@ -57,3 +57,18 @@ class LengthTest(TestCase):
         error = validator.validate(value)
         self.assertFalse(error)
 
+    def test_validate_many(self):
+        """ Validating many values gives same results as one by one """
+        values = ['Me', 'Me is ok', 'Me is too long', 12345]
+        for validator in [
+            Length(min=3),
+            Length(max=8),
+            Length(min=3, max=8),
+            Length(),
+        ]:
+            results = validator.validate_many(values)
+            expected = [validator.run(value) for value in values]
+            self.assertEqual(
+                [(e.message, e.kwargs) for e in expected],
+                [(e.message, e.kwargs) for e in results]
+            )
@@ -1,10 +1,14 @@
 from unittest import TestCase, mock
+import os
 from nose.plugins.attrib import attr
 
 from shiftschema.validators import MultiChoice
 from shiftschema.exceptions import InvalidOption
 
 
+assets = os.path.join(os.path.dirname(__file__), '..', '_assets', 'choices')
+
+
 @attr('validator', 'multichoice')
 class ChoiceTest(TestCase):
     """ Choice validator test"""
@@ -45,4 +49,26 @@ class ChoiceTest(TestCase):
         error = validator.run(value)
         self.assertFalse(error)
 
+    def test_report_invalid_items_of_any_type(self):
+        """ Report invalid items that are not strings """
+        validator = MultiChoice(range(10000))
+        error = validator.run([1, 2, 10001, 20000])
+        self.assertEqual('10001, 20000', error.kwargs['items'])
+
+    def test_load_choices_from_file(self):
+        """ Load choices from a file """
+        path = os.path.join(assets, 'countries.txt')
+        validator = MultiChoice.from_file(path)
+        self.assertFalse(validator.run(['GB', 'FR']))
+        self.assertEqual('DE', validator.run(['GB', 'DE']).kwargs['items'])
+
+    def test_keep_ranges_and_list_order(self):
+        """ Ranges are used as they are and lists keep their order """
+        huge = range(10 ** 12)
+        validator = MultiChoice(huge)
+        self.assertIs(huge, validator.choices)
+        self.assertFalse(validator.run([1, 10 ** 11]))
 
+        validator = MultiChoice(['b', 'a'])
+        self.assertEqual(['b', 'a'], validator.choices)
+        self.assertFalse(validator.run(['a']))
@@ -125,3 +125,19 @@ class UrlTest(TestCase):
             self.fail('URL [{}] failed'.format(url))
 
 
+
+    def test_share_compiled_regex_per_configuration(self):
+        """ Compiled regex is shared by validators with same configuration """
+        validator1 = Url(protocols=['http', 'https'])
+        validator2 = Url(protocols=['http', 'https'])
+        validator3 = Url(protocols=['http', 'https'], localhost=True)
+        regex = validator1.regex()
+        self.assertIs(regex, validator2.regex())
+        self.assertIsNot(regex, validator3.regex())
+
+    def test_getting_regex_source_is_deprecated(self):
+        """ Getting regex source from regex() still works but warns """
+        validator = Url()
+        with self.assertWarns(DeprecationWarning):
+            source = validator.regex(['http'], localhost=False)
+        self.assertEqual(validator.pattern(['http'], False), source)